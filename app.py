@@ -1,12 +1,16 @@
 """Career Genie Backend API - Main Application."""
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from dotenv import load_dotenv
+from bson import ObjectId
+import gzip
 import os
 import logging
+import zlib
 from logging.handlers import RotatingFileHandler
 
 # Load environment variables
@@ -33,6 +37,24 @@ from routes.ads import ads_bp
 from utils.helpers import format_error_response
 
 
+class APIJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider for API responses.
+
+    Keys keep their insertion order, since sorting every key of large nested
+    documents (parsed resumes, job lists) on each response costs CPU for no
+    benefit. ObjectIds are encoded as strings.
+    """
+
+    sort_keys = False
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, ObjectId):
+            return str(o)
+        return DefaultJSONProvider.default(o)
+
+
 def create_app(config_name=None):
     """
     Create and configure Flask application.
@@ -44,6 +66,7 @@ def create_app(config_name=None):
         Flask app instance
     """
     app = Flask(__name__)
+    app.json = APIJSONProvider(app)
 
     # Load configuration
     if config_name is None:
@@ -58,6 +81,9 @@ def create_app(config_name=None):
     # Initialize extensions
     setup_extensions(app)
 
+    # Compress large JSON responses
+    setup_compression(app)
+
     # Register blueprints
     register_blueprints(app)
 
@@ -279,6 +305,7 @@ def create_app(config_name=None):
                 'GET /api/jobs': 'Get recommended jobs',
                 'GET /api/jobs/<id>': 'Get job details',
                 'POST /api/jobs/<id>/swipe': 'Swipe on job',
+                'GET /api/jobs/<id>/auto-apply-status': 'Get queued auto-apply status',
                 'GET /api/jobs/liked': 'Get liked jobs',
                 'GET /api/jobs/history': 'Get swipe history',
                 'POST /api/jobs/<id>/apply': 'Apply to job',
@@ -297,6 +324,7 @@ def create_app(config_name=None):
                 'POST /api/onboarding/complete': 'Complete onboarding',
                 'GET /api/onboarding/status': 'Get onboarding status',
                 'POST /api/onboarding/parse-resume': 'Parse resume with AI',
+                'GET /api/onboarding/parse-resume/<task_id>': 'Get queued resume parse result',
                 'POST /api/onboarding/skills/recommend': 'Get diverse skill recommendations',
                 'GET /api/onboarding/skills/search': 'Search skills across all industries',
                 'GET /api/onboarding/skills/industries': 'Get all supported industries',
@@ -326,7 +354,8 @@ def create_app(config_name=None):
                 'GET /api/training/search': 'Search training resumes',
                 'GET /api/training/patterns': 'Get extracted patterns',
                 'POST /api/training/validate': 'Validate resume quality',
-                'POST /api/training/auto-train': 'Trigger automatic training'
+                'POST /api/training/auto-train': 'Queue automatic training',
+                'GET /api/training/tasks/<task_id>': 'Get queued import or auto-train status'
             }
         }), 200
 
@@ -406,6 +435,55 @@ def setup_extensions(app):
     app.logger.info("Extensions initialized")
 
 
+def setup_compression(app):
+    """Gzip JSON responses for clients that accept it."""
+    mimetypes = app.config['COMPRESS_MIMETYPES']
+    min_size = app.config['COMPRESS_MIN_SIZE']
+    level = app.config['COMPRESS_LEVEL']
+
+    def gzip_stream(chunks):
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    @app.after_request
+    def compress_response(response):
+        if (
+            response.mimetype not in mimetypes
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        if response.is_streamed:
+            # Compress chunk by chunk so streamed responses stay streamed
+            response.response = gzip_stream(response.iter_encoded())
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < min_size:
+                return response
+            response.set_data(gzip.compress(body, level))
+
+        response.headers['Content-Encoding'] = 'gzip'
+
+        # The compressed body is a different representation of the same data
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
+
+
 def register_blueprints(app):
     """Register Flask blueprints."""
     app.register_blueprint(auth_bp)
@@ -1,6 +1,9 @@
 """Celery application for background task processing."""
 import os
+import base64
 import logging
+import tempfile
+import uuid
 from celery import Celery
 from dotenv import load_dotenv
 
@@ -27,7 +30,13 @@ celery_app.conf.update(
     task_time_limit=3600,  # 1 hour max
     task_soft_time_limit=3000,  # 50 minutes soft limit
     worker_prefetch_multiplier=1,
-    worker_max_tasks_per_child=50
+    worker_max_tasks_per_child=50,
+    # Multi-minute dataset downloads get their own queue so they can't hold
+    # up resume parsing or auto-apply. start_celery.sh and the Procfile
+    # worker consume both: celery -A celery_app worker -Q celery,scraper_queue
+    task_routes={
+        'import_training_resumes_task': {'queue': 'scraper_queue'}
+    }
 )
 
 
@@ -98,10 +107,10 @@ def auto_training_check(self):
     to warrant retraining the model.
     """
     try:
-        from services.training_service import TrainingService
+        from services.training_service import get_training_service
 
         logger.info("Running automatic training check")
-        training_service = TrainingService()
+        training_service = get_training_service()
 
         result = training_service.trigger_auto_training()
 
@@ -118,7 +127,7 @@ def auto_training_check(self):
 
 
 @celery_app.task(name='process_user_resume_for_training', bind=True)
-def process_user_resume_for_training(self, user_id: str, resume_path: str):
+def process_user_resume_for_training(self, user_id: str, resume_path: str, parsed: dict = None):
     """
     Background task to add user's resume to training corpus.
 
@@ -126,6 +135,7 @@ def process_user_resume_for_training(self, user_id: str, resume_path: str):
         self: Celery task instance
         user_id: User ID
         resume_path: Path to resume file
+        parsed: Already-parsed resume data, to skip parsing it again
 
     Returns:
         Dictionary with processing results
@@ -139,8 +149,9 @@ def process_user_resume_for_training(self, user_id: str, resume_path: str):
         logger.info(f"Processing resume for user {user_id}")
 
         # Parse resume
-        parser = ResumeParser()
-        parsed = parser.parse_resume(resume_path)
+        if parsed is None:
+            parser = ResumeParser()
+            parsed = parser.parse_resume(resume_path)
 
         # Calculate quality score
         quality_score = _calculate_quality_score(parsed)
@@ -148,8 +159,8 @@ def process_user_resume_for_training(self, user_id: str, resume_path: str):
         # Only add to training corpus if quality is sufficient
         if quality_score >= 0.6:
             # Copy resume to training directory
-            from services.training_service import TrainingService
-            training_service = TrainingService()
+            from services.training_service import get_training_service
+            training_service = get_training_service()
 
             import os
             from bson import ObjectId
@@ -200,6 +211,228 @@ def process_user_resume_for_training(self, user_id: str, resume_path: str):
         }
 
 
+@celery_app.task(name='parse_resume_task', bind=True, acks_late=True)
+def parse_resume_task(self, user_id: str, resume_b64: str, filename: str,
+                      merge_with_profile: bool = False):
+    """
+    Background task to parse an uploaded resume.
+
+    PDF/DOCX extraction and AI parsing are slow, so the upload request
+    only queues this task. The file travels in the message (base64, since
+    tasks are JSON) because workers don't share the web process's disk.
+
+    Args:
+        self: Celery task instance
+        user_id: User ID
+        resume_b64: Base64-encoded resume file contents
+        filename: Sanitized upload file name (its extension picks the parser)
+        merge_with_profile: Whether to copy parsed data into the user profile
+
+    Returns:
+        Dictionary with parsed resume data
+    """
+    resume_path = os.path.join(tempfile.gettempdir(), f'{uuid.uuid4().hex}_{filename}')
+
+    try:
+        from models.user_enhanced import EnhancedUser
+        from services.resume_parser import ResumeParser
+
+        logger.info(f"Parsing resume for user {user_id}")
+
+        with open(resume_path, 'wb') as f:
+            f.write(base64.b64decode(resume_b64))
+
+        parser = ResumeParser()
+        parsed_data = parser.parse_resume(resume_path)
+
+        if merge_with_profile:
+            EnhancedUser.merge_parsed_resume(user_id, parsed_data)
+
+        # Add to the training corpus here, while the file is on this worker's
+        # disk; it reuses parsed_data instead of parsing again
+        process_user_resume_for_training(user_id, resume_path, parsed_data)
+
+        return {
+            'success': True,
+            'parsedData': parsed_data,
+            'merged': merge_with_profile
+        }
+
+    except Exception as e:
+        logger.error(f"Error parsing resume for user {user_id}: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+    finally:
+        if os.path.exists(resume_path):
+            os.remove(resume_path)
+
+
+def parse_resume_task_id(user_id: str) -> str:
+    """
+    Get a new task ID for parsing a user's resume.
+
+    The user ID prefix lets the status endpoint check task ownership.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Celery task ID
+    """
+    return f'parse-resume-{user_id}-{uuid.uuid4().hex}'
+
+
+# Acked on receipt (not acks_late): a redelivered hour-long import would
+# re-import the whole source into a second corpus
+@celery_app.task(name='import_training_resumes_task', bind=True)
+def import_training_resumes_task(self, source: str, user_id: str, options: dict):
+    """
+    Background task to import resumes into a new training corpus.
+
+    Dataset downloads and Google Drive/Sheets imports take minutes, so the
+    training routes only queue this task.
+
+    Args:
+        self: Celery task instance
+        source: 'huggingface', 'kaggle', 'url', 'google_drive' or 'google_sheets'
+        user_id: User ID
+        options: Keyword arguments for the importer
+
+    Returns:
+        Dictionary with import results
+    """
+    try:
+        from services.google_forms_service import get_google_forms_service
+        from services.resume_scraper import ResumeScraper
+        from utils.helpers import serialize_document
+
+        self.update_state(state='PROGRESS', meta={'source': source})
+        logger.info(f"Importing training resumes from {source} for user {user_id}")
+
+        if source in ('google_drive', 'google_sheets'):
+            service = get_google_forms_service()
+            importers = {
+                'google_drive': service.import_resumes_from_folder,
+                'google_sheets': service.import_from_sheets
+            }
+        else:
+            scraper = ResumeScraper()
+            importers = {
+                'huggingface': scraper.download_huggingface_dataset,
+                'kaggle': scraper.download_from_kaggle,
+                'url': scraper.download_from_url
+            }
+
+        result = importers[source](user_id=user_id, **options)
+
+        if not result.get('success'):
+            return {
+                'success': False,
+                'error': result.get('error', 'Import failed')
+            }
+
+        uploaded_files = result.get('uploaded_files', [])
+        failed_files = result.get('failed_files', [])
+
+        return {
+            'success': True,
+            'corpusId': str(result['corpus_id']),
+            'filesUploaded': result['files_uploaded'],
+            'filesFailed': result['files_failed'],
+            'corpus': serialize_document(result['corpus']),
+            'uploadedFiles': uploaded_files[:10],  # Show first 10
+            'failedFiles': failed_files[:10],
+            'totalFiles': len(uploaded_files)
+        }
+
+    except Exception as e:
+        logger.error(f"Error importing training resumes from {source}: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+
+def training_task_id(user_id: str) -> str:
+    """
+    Get a new task ID for a user's training import or auto-train request.
+
+    The user ID prefix lets the status endpoint check task ownership.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Celery task ID
+    """
+    return f'training-{user_id}-{uuid.uuid4().hex}'
+
+
+@celery_app.task(name='auto_apply_task', bind=True)
+def auto_apply_task(self, user_id: str, job_id: str):
+    """
+    Background task to auto-apply a paid user to a liked job.
+
+    Generating the cover letter and tailoring the resume call the LLM, so
+    this runs off the swipe request path.
+
+    Args:
+        self: Celery task instance
+        user_id: User ID
+        job_id: Job ID
+
+    Returns:
+        Dictionary with auto-apply results
+    """
+    try:
+        from models.job import Job
+        from models.user import User
+        from services.auto_apply_service import AutoApplyService
+
+        job = Job.find_by_id(job_id)
+        user = User.find_by_id(user_id)
+
+        if not job or not user:
+            return {
+                'success': False,
+                'error': 'Job or user not found'
+            }
+
+        logger.info(f"Auto-applying user {user_id} to job {job_id}")
+
+        auto_apply = AutoApplyService()
+        return auto_apply.apply_to_job_automatically(
+            user_id=user_id,
+            job_id=job_id,
+            job_data=job,
+            user_profile=user
+        )
+
+    except Exception as e:
+        logger.error(f"Error auto-applying user {user_id} to job {job_id}: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+
+def auto_apply_task_id(user_id: str, job_id: str) -> str:
+    """
+    Get the deterministic task ID for a user's auto-apply to a job.
+
+    Args:
+        user_id: User ID
+        job_id: Job ID
+
+    Returns:
+        Celery task ID
+    """
+    return f'auto-apply-{user_id}-{job_id}'
+
+
 def _calculate_quality_score(parsed_data: dict) -> float:
     """
     Calculate quality score for a resume.
@@ -250,6 +483,20 @@ def _calculate_quality_score(parsed_data: dict) -> float:
     return round(score / max_score, 2)
 
 
+@celery_app.task(name='flush_swipe_counts')
+def flush_swipe_counts():
+    """
+    Periodic task that writes the Redis swipe counters to MongoDB in one
+    bulk_write per batch.
+    """
+    from services.swipe_counter import flush_swipe_counts as flush
+
+    flushed = flush()
+    if flushed:
+        logger.info(f"Flushed {flushed} swipe counters to MongoDB")
+    return flushed
+
+
 # Periodic task schedule
 celery_app.conf.beat_schedule = {
     'auto-training-check-daily': {
@@ -269,4 +516,8 @@ celery_app.conf.beat_schedule = {
         'task': 'cache_health_check',
         'schedule': 3600.0,  # Run every hour
     },
+    'flush-swipe-counts': {
+        'task': 'flush_swipe_counts',
+        'schedule': 30.0,  # Run every 30 seconds
+    },
 }
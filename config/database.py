@@ -1,6 +1,6 @@
 """Database configuration and connection management."""
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo.errors import ConnectionFailure, OperationFailure, ServerSelectionTimeoutError
 import os
 from datetime import datetime
 
@@ -26,11 +26,19 @@ class Database:
                 if not connection_string:
                     raise ValueError("MONGODB_URI environment variable not set")
 
+                # Pool sizes are per process (each gunicorn/celery worker).
+                # zlib compression is built in; add zstd or snappy to
+                # MONGO_COMPRESSORS once their packages are installed.
                 self._client = MongoClient(
                     connection_string,
                     serverSelectionTimeoutMS=5000,
                     connectTimeoutMS=10000,
-                    socketTimeoutMS=10000
+                    socketTimeoutMS=10000,
+                    maxPoolSize=int(os.getenv('MONGO_MAX_POOL_SIZE', 200)),
+                    minPoolSize=int(os.getenv('MONGO_MIN_POOL_SIZE', 20)),
+                    waitQueueTimeoutMS=int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', 500)),
+                    retryWrites=True,
+                    compressors=os.getenv('MONGO_COMPRESSORS', 'zlib')
                 )
 
                 # Test the connection
@@ -134,40 +142,64 @@ def init_database():
     try:
         # Users collection indexes
         users = get_users_collection()
+        # Unique email also makes the LinkedIn login upsert race-safe
         users.create_index('email', unique=True)
         users.create_index('createdAt')
 
         # Jobs collection indexes
         jobs = get_jobs_collection()
         jobs.create_index('isActive')
+        jobs.create_index([('isActive', 1), ('_id', 1)])
         jobs.create_index('postedAt')
         jobs.create_index([('location.city', 1), ('location.state', 1)])
         jobs.create_index([('salary.min', 1), ('salary.max', 1)])
         jobs.create_index('company.name')
+        jobs.create_index([
+            ('title', 'text'),
+            ('company.name', 'text'),
+            ('description', 'text')
+        ])
+        try:
+            # Deduplicates jobs fetched from external sources
+            jobs.create_index(
+                [('externalId', 1), ('source', 1)],
+                unique=True,
+                partialFilterExpression={'externalId': {'$type': 'string'}}
+            )
+        except OperationFailure as e:
+            # Existing duplicates; fetch_jobs still pre-checks before inserting
+            print(f"✗ Could not create unique externalId/source index: {e}")
 
         # Swipes collection indexes
         swipes = get_swipes_collection()
         swipes.create_index([('userId', 1), ('jobId', 1)], unique=True)
         swipes.create_index('userId')
         swipes.create_index('timestamp')
+        # Cursor pagination sorts by (timestamp, _id), newest first
+        swipes.create_index([('userId', 1), ('timestamp', -1), ('_id', -1)])
+        swipes.create_index([('userId', 1), ('action', 1), ('timestamp', -1), ('_id', -1)])
 
         # Applications collection indexes
         applications = get_applications_collection()
         applications.create_index([('userId', 1), ('jobId', 1)])
         applications.create_index('userId')
         applications.create_index('status')
+        applications.create_index([('userId', 1), ('status', 1)])
         applications.create_index('appliedAt')
 
         # Training corpora collection indexes
         training_corpora = get_training_corpora_collection()
-        training_corpora.create_index('category')
         training_corpora.create_index('uploadedBy')
         training_corpora.create_index('createdAt')
+        # Serves category counts and newest-first (keyset) listings; its
+        # category prefix makes a separate category index redundant
+        training_corpora.create_index([('category', 1), ('_id', -1)])
 
         # Training resumes collection indexes
         training_resumes = get_training_resumes_collection()
         training_resumes.create_index('corpusId')
         training_resumes.create_index('qualityScore')
+        training_resumes.create_index([('qualityScore', -1), ('_id', -1)])
         training_resumes.create_index('uploadedAt')
         training_resumes.create_index([('filename', 'text'), ('parsedData.raw_text', 'text')])
 
@@ -26,6 +26,11 @@ class Config:
 
     # File upload settings
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB
+    MAX_RESUME_SIZE = 10 * 1024 * 1024  # 10MB
+
+    # Customized resume versions (stored inside the user document)
+    MAX_RESUME_VERSIONS = 50
+    MAX_RESUME_VERSION_SIZE = 256 * 1024  # 256KB of JSON content per version
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', './uploads')
     ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
     ALLOWED_DOCUMENT_EXTENSIONS = {'pdf', 'doc', 'docx'}
@@ -37,6 +42,11 @@ class Config:
     RATELIMIT_STORAGE_URL = os.getenv('RATELIMIT_STORAGE_URL', 'memory://')
     RATELIMIT_DEFAULT = "200 per day;50 per hour"
 
+    # Response compression (gzip) for JSON responses
+    COMPRESS_MIMETYPES = {'application/json'}
+    COMPRESS_MIN_SIZE = 2048  # Bytes; smaller bodies aren't worth compressing
+    COMPRESS_LEVEL = 6
+
     # Pagination
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGE_SIZE = 100
@@ -51,6 +61,7 @@ class Config:
     # Job matching
     MIN_MATCH_SCORE = 0.3  # Minimum 30% match to show job
     DEFAULT_JOB_RADIUS_MILES = 50
+    MAX_EXCLUDED_JOB_IDS = 5000  # Most recent swipes excluded from the feed via $nin
 
     # Security
     BCRYPT_LOG_ROUNDS = 12
@@ -0,0 +1,12 @@
+"""Gunicorn settings for the web process (Procfile and railway.toml)."""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+
+# Request time is mostly spent waiting on MongoDB and Redis, which release
+# the GIL, so each worker runs several threads to overlap that I/O
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+timeout = 60
@@ -1,6 +1,7 @@
 """Job model and operations."""
 from datetime import datetime
 from bson import ObjectId
+from pymongo import WriteConcern
 from config.database import get_jobs_collection
 from utils.helpers import calculate_match_score
 
@@ -8,6 +9,26 @@ from utils.helpers import calculate_match_score
 class Job:
     """Job model with database operations."""
 
+    # Fields needed by list views (liked, history, applications)
+    LIST_PROJECTION = {
+        'title': 1,
+        'company': 1,
+        'location': 1,
+        'employment': 1,
+        'salary': 1,
+        'postedAt': 1,
+        'isActive': 1
+    }
+
+    # Swipe cards also show the description and score on requirements;
+    # updatedAt versions cached match scores
+    CARD_PROJECTION = {
+        **LIST_PROJECTION,
+        'description': 1,
+        'requirements': 1,
+        'updatedAt': 1
+    }
+
     @staticmethod
     def create_job(job_data):
         """
@@ -29,6 +50,36 @@ class Job:
         result = jobs.insert_one(job_data)
         return result.inserted_id
 
+    @staticmethod
+    def create_jobs(jobs_data, acknowledged=True):
+        """
+        Create several job postings in one round trip.
+
+        Unordered, so one failing document doesn't stop the rest; a failure
+        raises BulkWriteError, whose details list the failed indexes.
+
+        Args:
+            jobs_data: List of job data dictionaries
+            acknowledged: False to skip waiting for the server (w=0), for
+                          bulk loads of throwaway data. Failures then go
+                          unreported.
+
+        Returns:
+            list: Created job IDs, in input order
+        """
+        jobs = get_jobs_collection()
+        if not acknowledged:
+            jobs = jobs.with_options(write_concern=WriteConcern(w=0))
+
+        now = datetime.utcnow()
+        for job_data in jobs_data:
+            job_data['postedAt'] = now
+            job_data['updatedAt'] = now
+            job_data['isActive'] = job_data.get('isActive', True)
+
+        result = jobs.insert_many(jobs_data, ordered=False)
+        return result.inserted_ids
+
     @staticmethod
     def find_by_id(job_id):
         """
@@ -48,7 +99,7 @@ class Job:
         return jobs.find_one({'_id': job_id})
 
     @staticmethod
-    def get_active_jobs(filters=None, skip=0, limit=20, sort_by='postedAt'):
+    def get_active_jobs(filters=None, skip=0, limit=20, sort_by='postedAt', projection=None):
         """
         Get active jobs with optional filters.
 
@@ -57,17 +108,73 @@ class Job:
             skip: Number of documents to skip
             limit: Number of documents to return
             sort_by: Field to sort by
+            projection: Optional projection (defaults to full documents)
 
         Returns:
             list: List of job documents
         """
         jobs = get_jobs_collection()
 
+        query = Job.build_active_query(filters)
+
+        # Execute query with pagination
+        cursor = jobs.find(query, projection).sort(sort_by, -1).skip(skip).limit(limit)
+
+        return list(cursor)
+
+    @staticmethod
+    def get_ranked_jobs(filters, score_expression, min_score=0.0, skip=0, limit=20,
+                        projection=None):
+        """
+        Get active jobs ranked by a server-side match score.
+
+        Args:
+            filters: Dictionary of filters
+            score_expression: Aggregation expression computing the match score
+            min_score: Minimum match score to include
+            skip: Number of documents to skip
+            limit: Number of documents to return
+            projection: Optional inclusion projection applied to the page
+
+        Returns:
+            list: List of job documents with a 'matchScore' field
+        """
+        jobs = get_jobs_collection()
+
+        pipeline = [
+            {'$match': Job.build_active_query(filters)},
+            {'$addFields': {'matchScore': score_expression}},
+            {'$match': {'matchScore': {'$gte': min_score}}},
+            {'$sort': {'matchScore': -1, 'postedAt': -1}},
+            {'$skip': skip},
+            {'$limit': limit}
+        ]
+
+        if projection:
+            pipeline.append({'$project': {**projection, 'matchScore': 1}})
+
+        return list(jobs.aggregate(pipeline))
+
+    @staticmethod
+    def build_active_query(filters=None):
+        """
+        Build the MongoDB query for active jobs matching filters.
+
+        Args:
+            filters: Dictionary of filters
+
+        Returns:
+            dict: MongoDB query
+        """
         # Base query for active jobs
         query = {'isActive': True}
 
         # Add filters
         if filters:
+            # Exclude already swiped jobs
+            if '_excludeIds' in filters and filters['_excludeIds']:
+                query['_id'] = {'$nin': filters['_excludeIds']}
+
             # Keywords/Title Search
             if 'keywords' in filters and filters['keywords']:
                 query['$or'] = [
@@ -125,10 +232,7 @@ class Job:
                 if filters['datePosted'] in date_ranges:
                     query['postedAt'] = {'$gte': date_ranges[filters['datePosted']]}
 
-        # Execute query with pagination
-        cursor = jobs.find(query).sort(sort_by, -1).skip(skip).limit(limit)
-
-        return list(cursor)
+        return query
 
     @staticmethod
     def get_total_count(filters=None):
@@ -231,14 +335,13 @@ class Job:
             filters['minSalary'] = expected_salary.get('min')
             filters['maxSalary'] = expected_salary.get('max')
 
+        # Exclude already swiped jobs in the query
+        if exclude_job_ids:
+            filters['_excludeIds'] = [ObjectId(jid) if isinstance(jid, str) else jid for jid in exclude_job_ids]
+
         # Get more jobs than needed for filtering
         jobs = Job.get_active_jobs(filters, limit=limit * 3)
 
-        # Exclude already swiped jobs
-        if exclude_job_ids:
-            exclude_ids = [ObjectId(jid) if isinstance(jid, str) else jid for jid in exclude_job_ids]
-            jobs = [job for job in jobs if job['_id'] not in exclude_ids]
-
         # Calculate match scores
         jobs_with_scores = []
         for job in jobs:
@@ -307,14 +410,72 @@ class Job:
         """
         jobs = get_jobs_collection()
 
-        # Create text search query
+        # Index-backed text search, best matches first
         query = {
             'isActive': True,
-            '$or': [
-                {'title': {'$regex': search_term, '$options': 'i'}},
-                {'company.name': {'$regex': search_term, '$options': 'i'}},
-                {'description': {'$regex': search_term, '$options': 'i'}}
-            ]
+            '$text': {'$search': search_term}
         }
+        score = {'score': {'$meta': 'textScore'}}
+
+        cursor = jobs.find(query, score).sort([('score', {'$meta': 'textScore'})])
+        return list(cursor.limit(limit))
 
-        return list(jobs.find(query).limit(limit))
+    @staticmethod
+    def get_statistics(top_n=10):
+        """
+        Get job counts and top industries/locations in one aggregation.
+
+        Args:
+            top_n: Number of top industries and locations to return
+
+        Returns:
+            dict: totalJobs, activeJobs, topIndustries and topLocations
+                (the latter two as raw $group results)
+        """
+        jobs = get_jobs_collection()
+
+        pipeline = [
+            {'$facet': {
+                'total': [{'$count': 'count'}],
+                'active': [
+                    {'$match': {'isActive': True}},
+                    {'$count': 'count'}
+                ],
+                'industries': [
+                    # Skip jobs without an industry so they don't take a top slot
+                    {'$match': {
+                        'isActive': True,
+                        'company.industry': {'$nin': [None, '']}
+                    }},
+                    {'$group': {
+                        '_id': '$company.industry',
+                        'count': {'$sum': 1}
+                    }},
+                    {'$sort': {'count': -1}},
+                    {'$limit': top_n}
+                ],
+                'locations': [
+                    {'$match': {'isActive': True}},
+                    {'$group': {
+                        '_id': {
+                            'city': '$location.city',
+                            'state': '$location.state'
+                        },
+                        'count': {'$sum': 1}
+                    }},
+                    {'$sort': {'count': -1}},
+                    {'$limit': top_n}
+                ]
+            }}
+        ]
+
+        result = next(jobs.aggregate(pipeline), None) or {}
+        total = result.get('total') or [{}]
+        active = result.get('active') or [{}]
+
+        return {
+            'totalJobs': total[0].get('count', 0),
+            'activeJobs': active[0].get('count', 0),
+            'topIndustries': result.get('industries', []),
+            'topLocations': result.get('locations', [])
+        }
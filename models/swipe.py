@@ -20,6 +20,10 @@ class Swipe:
 
         Returns:
             ObjectId: Created swipe record ID
+
+        Raises:
+            DuplicateKeyError: If the user already swiped on this job
+                (enforced by the unique {userId, jobId} index)
         """
         swipes = get_swipes_collection()
 
@@ -36,14 +40,27 @@ class Swipe:
             'matchScore': match_score
         }
 
-        # Use upsert to avoid duplicate swipes
-        result = swipes.update_one(
-            {'userId': user_id, 'jobId': job_id},
-            {'$set': swipe_data},
-            upsert=True
-        )
+        result = swipes.insert_one(swipe_data)
+        return result.inserted_id
+
+    @staticmethod
+    def delete_swipe(swipe_id):
+        """
+        Delete a swipe record.
+
+        Args:
+            swipe_id: Swipe record ID
 
-        return result.upserted_id if result.upserted_id else True
+        Returns:
+            bool: True if deleted
+        """
+        swipes = get_swipes_collection()
+
+        if isinstance(swipe_id, str):
+            swipe_id = ObjectId(swipe_id)
+
+        result = swipes.delete_one({'_id': swipe_id})
+        return result.deleted_count > 0
 
     @staticmethod
     def get_user_swipes(user_id, action=None, skip=0, limit=20):
@@ -68,27 +85,72 @@ class Swipe:
         if action:
             query['action'] = action
 
-        cursor = swipes.find(query).sort('timestamp', -1).skip(skip).limit(limit)
+        # Same order as the cursor pages, so nextCursor picks up where this page ends
+        cursor = swipes.find(query).sort([('timestamp', -1), ('_id', -1)]).skip(skip).limit(limit)
         return list(cursor)
 
     @staticmethod
-    def get_swiped_job_ids(user_id):
+    def _before_cursor(before):
+        """
+        Query clause for swipes after a (timestamp, _id) cursor, newest first.
+
+        Swipes can share a timestamp, so _id breaks ties; a timestamp-only
+        cursor would skip or repeat swipes at a page boundary.
         """
-        Get all job IDs that user has swiped on.
+        timestamp, swipe_id = before
+        return {'$or': [
+            {'timestamp': {'$lt': timestamp}},
+            {'timestamp': timestamp, '_id': {'$lt': swipe_id}}
+        ]}
+
+    @staticmethod
+    def get_user_swipes_after(user_id, action=None, before=None, limit=20):
+        """
+        Get user's swipe history using a range-keyed cursor.
 
         Args:
             user_id: User ID
+            action: Optional filter by action type
+            before: (timestamp, _id) of the last-seen swipe (None for first page)
+            limit: Number of records to return
 
         Returns:
-            list: List of job IDs
+            list: List of swipe documents, newest first
+        """
+        swipes = get_swipes_collection()
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        query = {'userId': user_id}
+        if action:
+            query['action'] = action
+        if before:
+            query.update(Swipe._before_cursor(before))
+
+        cursor = swipes.find(query).sort([('timestamp', -1), ('_id', -1)]).limit(limit)
+        return list(cursor)
+
+    @staticmethod
+    def get_swiped_job_ids(user_id, limit=None):
+        """
+        Get job IDs that user has swiped on.
+
+        Args:
+            user_id: User ID
+            limit: Optional cap, keeping the most recent swipes
+
+        Returns:
+            list: List of job ObjectIds
         """
         swipes = get_swipes_collection()
 
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        # Get all swipes for this user
-        cursor = swipes.find({'userId': user_id}, {'jobId': 1})
+        cursor = swipes.find({'userId': user_id}, {'jobId': 1, '_id': 0})
+        if limit:
+            cursor = cursor.sort('timestamp', -1).limit(limit)
 
         return [swipe['jobId'] for swipe in cursor]
 
@@ -112,10 +174,41 @@ class Swipe:
 
         cursor = swipes.find(
             {'userId': user_id, 'action': {'$in': ['like', 'superlike']}}
-        ).sort('timestamp', -1).skip(skip).limit(limit)
+        ).sort([('timestamp', -1), ('_id', -1)]).skip(skip).limit(limit)
 
         return [swipe['jobId'] for swipe in cursor]
 
+    @staticmethod
+    def get_liked_jobs_after(user_id, before=None, limit=20):
+        """
+        Get jobs that user has liked using a range-keyed cursor.
+
+        Args:
+            user_id: User ID
+            before: (timestamp, _id) of the last-seen like (None for first page)
+            limit: Number of records to return
+
+        Returns:
+            tuple: (list of job IDs, last swipe's {'timestamp', '_id'} or None)
+        """
+        swipes = get_swipes_collection()
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        query = {'userId': user_id, 'action': {'$in': ['like', 'superlike']}}
+        if before:
+            query.update(Swipe._before_cursor(before))
+
+        cursor = swipes.find(
+            query, {'jobId': 1, 'timestamp': 1}
+        ).sort([('timestamp', -1), ('_id', -1)]).limit(limit)
+
+        liked = list(cursor)
+        last_swipe = liked[-1] if liked else None
+
+        return [swipe['jobId'] for swipe in liked], last_swipe
+
     @staticmethod
     def has_swiped(user_id, job_id):
         """
@@ -176,22 +269,32 @@ class Swipe:
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        # Get total swipes by action
-        total_swipes = swipes.count_documents({'userId': user_id})
-        likes = swipes.count_documents({'userId': user_id, 'action': 'like'})
-        superlikes = swipes.count_documents({'userId': user_id, 'action': 'superlike'})
-        dislikes = swipes.count_documents({'userId': user_id, 'action': 'dislike'})
-
-        # Calculate average match score
+        # Counts by action and average match score in one roundtrip
         pipeline = [
-            {'$match': {'userId': user_id, 'matchScore': {'$exists': True}}},
-            {'$group': {
-                '_id': None,
-                'avgMatchScore': {'$avg': '$matchScore'}
+            {'$match': {'userId': user_id}},
+            {'$facet': {
+                'byAction': [
+                    {'$group': {'_id': '$action', 'count': {'$sum': 1}}}
+                ],
+                'average': [
+                    {'$match': {'matchScore': {'$exists': True}}},
+                    {'$group': {
+                        '_id': None,
+                        'avgMatchScore': {'$avg': '$matchScore'}
+                    }}
+                ]
             }}
         ]
 
-        avg_result = list(swipes.aggregate(pipeline))
+        result = next(swipes.aggregate(pipeline), None) or {}
+        by_action = {item['_id']: item['count'] for item in result.get('byAction', [])}
+
+        total_swipes = sum(by_action.values())
+        likes = by_action.get('like', 0)
+        superlikes = by_action.get('superlike', 0)
+        dislikes = by_action.get('dislike', 0)
+
+        avg_result = result.get('average', [])
         avg_match_score = avg_result[0]['avgMatchScore'] if avg_result else 0
 
         return {
@@ -245,6 +348,27 @@ class Application:
         result = applications.insert_one(app_data)
         return result.inserted_id
 
+    @staticmethod
+    def exists(user_id, job_id):
+        """
+        Check if user has already applied to a job.
+
+        Args:
+            user_id: User ID
+            job_id: Job ID
+
+        Returns:
+            bool: True if an application exists
+        """
+        applications = get_applications_collection()
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+        if isinstance(job_id, str):
+            job_id = ObjectId(job_id)
+
+        return applications.count_documents({'userId': user_id, 'jobId': job_id}, limit=1) > 0
+
     @staticmethod
     def get_user_applications(user_id, status=None, skip=0, limit=20):
         """
@@ -271,6 +395,93 @@ class Application:
         cursor = applications.find(query).sort('appliedAt', -1).skip(skip).limit(limit)
         return list(cursor)
 
+    @staticmethod
+    def search_user_applications(user_id, match=None, job_match=None, sort=None,
+                                 skip=0, limit=20, job_projection=None):
+        """
+        Filter, sort and page user's applications joined with their jobs.
+
+        Args:
+            user_id: User ID
+            match: Optional query on application fields
+            job_match: Optional query on joined job fields (prefixed 'job.')
+            sort: Sort spec as a dict (default: newest first)
+            skip: Number of records to skip
+            limit: Number of records to return
+            job_projection: Optional inclusion projection for the joined job
+
+        Returns:
+            tuple: (list of applications with a 'job' field, total count)
+        """
+        applications = get_applications_collection()
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        pipeline = [
+            {'$match': {'userId': user_id, **(match or {})}},
+            {'$lookup': {
+                'from': 'jobs',
+                'localField': 'jobId',
+                'foreignField': '_id',
+                'as': 'job'
+            }},
+            {'$unwind': '$job'}
+        ]
+
+        if job_match:
+            pipeline.append({'$match': job_match})
+
+        items = [
+            {'$sort': {**(sort or {'appliedAt': -1}), '_id': -1}},
+            {'$skip': skip},
+            {'$limit': limit}
+        ]
+
+        if job_projection:
+            job_fields = {'_id': '$job._id'}
+            job_fields.update({field: f'$job.{field}' for field in job_projection})
+            items.append({'$addFields': {'job': job_fields}})
+
+        pipeline.append({'$facet': {
+            'items': items,
+            'total': [{'$count': 'count'}]
+        }})
+
+        result = next(applications.aggregate(pipeline), None) or {}
+        total = result.get('total') or [{}]
+
+        return result.get('items', []), total[0].get('count', 0)
+
+    @staticmethod
+    def status_counts(user_id):
+        """
+        Count user's applications by status.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            dict: Counts keyed by status plus 'total'
+        """
+        applications = get_applications_collection()
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        pipeline = [
+            {'$match': {'userId': user_id}},
+            {'$group': {'_id': '$status', 'count': {'$sum': 1}}}
+        ]
+
+        by_status = {item['_id']: item['count'] for item in applications.aggregate(pipeline)}
+
+        counts = {'total': sum(by_status.values())}
+        for status in ('applied', 'interviewed', 'rejected', 'hired'):
+            counts[status] = by_status.get(status, 0)
+
+        return counts
+
     @staticmethod
     def update_application_status(application_id, status, note=None):
         """
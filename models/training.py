@@ -13,6 +13,18 @@ from config.database import (
 class TrainingCorpus:
     """Model for training corpus (collection of resumes)."""
 
+    # Fields shown in corpus listings
+    LIST_PROJECTION = {
+        'name': 1,
+        'description': 1,
+        'category': 1,
+        'filesCount': 1,
+        'totalResumes': 1,
+        'averageQualityScore': 1,
+        'source': 1,
+        'createdAt': 1
+    }
+
     @staticmethod
     def create(corpus_data: Dict) -> ObjectId:
         """
@@ -39,7 +51,36 @@ class TrainingCorpus:
         return collection.find_one({'_id': corpus_id})
 
     @staticmethod
-    def get_all(category: Optional[str] = None, skip: int = 0, limit: int = 20) -> List[Dict]:
+    def find_by_ids(corpus_ids: List, projection: Optional[Dict] = None) -> Dict[str, Dict]:
+        """
+        Find several corpora in one query.
+
+        Args:
+            corpus_ids: Corpus IDs (strings or ObjectIds)
+            projection: Fields to return
+
+        Returns:
+            Dictionary mapping string corpus ID to corpus
+        """
+        collection = get_training_corpora_collection()
+
+        object_ids = list({
+            ObjectId(corpus_id) for corpus_id in corpus_ids
+            if isinstance(corpus_id, ObjectId) or ObjectId.is_valid(corpus_id)
+        })
+        if not object_ids:
+            return {}
+
+        cursor = collection.find({'_id': {'$in': object_ids}}, projection)
+        return {str(corpus['_id']): corpus for corpus in cursor}
+
+    @staticmethod
+    def get_all(
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        projection: Optional[Dict] = None
+    ) -> List[Dict]:
         """
         Get all training corpora.
 
@@ -47,6 +88,7 @@ class TrainingCorpus:
             category: Filter by category
             skip: Number to skip
             limit: Number to return
+            projection: Fields to return (None for full documents)
 
         Returns:
             List of corpora
@@ -57,19 +99,54 @@ class TrainingCorpus:
         if category:
             query['category'] = category
 
-        cursor = collection.find(query).sort('createdAt', -1).skip(skip).limit(limit)
+        # _id order matches creation order and lines up with get_all_after cursors
+        cursor = collection.find(query, projection).sort('_id', -1).skip(skip).limit(limit)
         return list(cursor)
 
     @staticmethod
-    def get_count(category: Optional[str] = None) -> int:
-        """Get total corpus count."""
+    def get_all_after(
+        category: Optional[str] = None,
+        after_id: Optional[ObjectId] = None,
+        limit: int = 20,
+        projection: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Get training corpora using an _id-keyed cursor.
+
+        Args:
+            category: Filter by category
+            after_id: Return corpora older than this _id (None for first page)
+            limit: Number to return
+            projection: Fields to return (None for full documents)
+
+        Returns:
+            List of corpora, newest first
+        """
         collection = get_training_corpora_collection()
 
         query = {}
         if category:
             query['category'] = category
+        if after_id:
+            query['_id'] = {'$lt': after_id}
 
-        return collection.count_documents(query)
+        cursor = collection.find(query, projection).sort('_id', -1).limit(limit)
+        return list(cursor)
+
+    @staticmethod
+    def get_count(category: Optional[str] = None) -> int:
+        """
+        Get total corpus count.
+
+        Without a category filter this reads the collection metadata
+        (estimated_document_count) instead of scanning every document.
+        """
+        collection = get_training_corpora_collection()
+
+        if not category:
+            return collection.estimated_document_count()
+
+        return collection.count_documents({'category': category})
 
     @staticmethod
     def get_category_breakdown() -> List[Dict]:
@@ -105,6 +182,16 @@ class TrainingCorpus:
 class TrainingResume:
     """Model for individual training resumes."""
 
+    # Search hits leave out the parsed text, which is most of each document
+    SEARCH_PROJECTION = {
+        'filename': 1,
+        'corpusId': 1,
+        'qualityScore': 1,
+        'uploadedAt': 1,
+        'source': 1,
+        'parsedData.skills': 1
+    }
+
     @staticmethod
     def create(resume_data: Dict) -> ObjectId:
         """
@@ -203,7 +290,8 @@ class TrainingResume:
         category: Optional[str] = None,
         min_score: Optional[float] = None,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        projection: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Search training resumes.
@@ -214,6 +302,7 @@ class TrainingResume:
             min_score: Minimum quality score
             skip: Number to skip
             limit: Number to return
+            projection: Fields to return (None for full documents)
 
         Returns:
             List of matching resumes
@@ -231,7 +320,57 @@ class TrainingResume:
         if min_score:
             filters['qualityScore'] = {'$gte': min_score}
 
-        cursor = collection.find(filters).sort('qualityScore', -1).skip(skip).limit(limit)
+        cursor = collection.find(filters, projection).sort(
+            [('qualityScore', -1), ('_id', -1)]
+        ).skip(skip).limit(limit)
+        return list(cursor)
+
+    @staticmethod
+    def search_after(
+        query: str = '',
+        category: Optional[str] = None,
+        min_score: Optional[float] = None,
+        after: Optional[tuple] = None,
+        limit: int = 20,
+        projection: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Search training resumes using a (qualityScore, _id) keyed cursor.
+
+        Args:
+            query: Search query
+            category: Filter by category
+            min_score: Minimum quality score
+            after: (qualityScore, _id) of the last-seen resume (None for first page)
+            limit: Number to return
+            projection: Fields to return (None for full documents)
+
+        Returns:
+            List of matching resumes, best score first
+        """
+        collection = get_training_resumes_collection()
+
+        filters = []
+
+        if query:
+            filters.append({'$or': [
+                {'filename': {'$regex': query, '$options': 'i'}},
+                {'parsedData.raw_text': {'$regex': query, '$options': 'i'}}
+            ]})
+
+        if min_score:
+            filters.append({'qualityScore': {'$gte': min_score}})
+
+        if after:
+            score, last_id = after
+            filters.append({'$or': [
+                {'qualityScore': {'$lt': score}},
+                {'qualityScore': score, '_id': {'$lt': last_id}}
+            ]})
+
+        cursor = collection.find({'$and': filters} if filters else {}, projection).sort(
+            [('qualityScore', -1), ('_id', -1)]
+        ).limit(limit)
         return list(cursor)
 
     @staticmethod
@@ -284,7 +423,9 @@ class TrainingResume:
         # This is a simplified version - actual implementation would use NLP
         pipeline = [
             {'$match': {'qualityScore': {'$gte': 0.7}}},
-            {'$limit': 100}
+            {'$limit': 100},
+            # raw_text is the only field read below
+            {'$project': {'_id': 0, 'parsedData.raw_text': 1}}
         ]
 
         resumes = list(collection.aggregate(pipeline))
@@ -324,7 +465,8 @@ class TrainingResume:
         # Analyze section ordering and structure
         pipeline = [
             {'$match': {'qualityScore': {'$gte': 0.7}}},
-            {'$limit': 100}
+            {'$limit': 100},
+            {'$project': {'parsedData.raw_text': 0, 'filePath': 0}}
         ]
 
         return list(collection.aggregate(pipeline))
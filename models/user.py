@@ -1,15 +1,22 @@
 """User model and operations."""
 from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo import ReturnDocument
 import bcrypt
+from flask import g, has_app_context
+from flask_jwt_extended import get_jwt_identity
 from config.database import get_users_collection
 from config.settings import Config
+from services import swipe_counter
 from utils.helpers import calculate_swipe_reset_date, should_reset_swipes
 
 
 class User:
     """User model with database operations."""
 
+    # Everything except the password hash, for documents sent to clients
+    PUBLIC_PROJECTION = {'password_hash': 0}
+
     @staticmethod
     def create_user(email, password, first_name=None, last_name=None):
         """
@@ -88,12 +95,13 @@ class User:
         return users.find_one({'email': email.lower()})
 
     @staticmethod
-    def find_by_id(user_id):
+    def find_by_id(user_id, projection=None):
         """
         Find user by ID.
 
         Args:
             user_id: User ID (string or ObjectId)
+            projection: Optional fields to return (default: whole document)
 
         Returns:
             dict: User document or None
@@ -103,7 +111,109 @@ class User:
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        return users.find_one({'_id': user_id})
+        return users.find_one({'_id': user_id}, projection)
+
+    @staticmethod
+    def current_id():
+        """
+        Get the current request's JWT identity as an ObjectId.
+
+        Parsed once per request and kept on flask.g.
+
+        Returns:
+            ObjectId: User ID, or None if the identity isn't a valid ObjectId
+        """
+        identity = get_jwt_identity()
+        cached = g.get('current_user_id')
+        if cached is None or cached[0] != identity:
+            user_id = ObjectId(identity) if ObjectId.is_valid(identity) else None
+            cached = (identity, user_id)
+            g.current_user_id = cached
+
+        return cached[1]
+
+    @staticmethod
+    def current():
+        """
+        Get the user for the current request's JWT identity.
+
+        The document (without the password hash) is read once per
+        request and kept on flask.g, so
+        every caller in the same request shares one read. update_profile
+        and update_preferences refresh it; after other writes, re-read
+        with find_by_id.
+
+        Returns:
+            dict: User document or None
+        """
+        user_id = User.current_id()
+        if user_id is None:
+            return None
+
+        cached = g.get('current_user')
+        if cached is None or cached[0] != user_id:
+            cached = (user_id, User.find_by_id(user_id, User.PUBLIC_PROJECTION))
+            g.current_user = cached
+
+        return cached[1]
+
+    @staticmethod
+    def _refresh_current(user):
+        """Replace the request's cached current user after a write."""
+        if user is None or not has_app_context():
+            return
+
+        cached = g.get('current_user')
+        if cached is not None and cached[0] == user['_id']:
+            g.current_user = (user['_id'], user)
+
+    @staticmethod
+    def resolve_resume(user, resume_id):
+        """
+        Look up one of the user's resumes by its option ID.
+
+        Args:
+            user: User document
+            resume_id: 'original', 'parsed' or 'version_<n>'
+
+        Returns:
+            str or dict: Resume file path or data, or None if not found
+        """
+        resumes = user.get('resumes') or {}
+
+        if resume_id == 'original':
+            return resumes.get('original') or (user.get('profile') or {}).get('resume')
+        if resume_id == 'parsed':
+            return resumes.get('parsed')
+        if resume_id and resume_id.startswith('version_'):
+            version_idx = resume_id[len('version_'):]
+            versions = resumes.get('versions') or []
+            if version_idx.isdigit() and int(version_idx) < len(versions):
+                return versions[int(version_idx)]
+
+        return None
+
+    @staticmethod
+    def get_default_resume(user):
+        """
+        Get the resume the user selected as their default.
+
+        Only the selection's ID is stored, so the resume is resolved from
+        the original upload, parsed data or versions on read.
+
+        Args:
+            user: User document
+
+        Returns:
+            str or dict: Resume file path or data, or None if none selected
+        """
+        resumes = user.get('resumes') or {}
+        resume_id = resumes.get('defaultVersionId')
+        if not resume_id:
+            # Selections made before only the ID was stored
+            return resumes.get('defaultVersion')
+
+        return User.resolve_resume(user, resume_id)
 
     @staticmethod
     def verify_password(plain_password, password_hash):
@@ -132,7 +242,7 @@ class User:
             profile_data: Profile data to update
 
         Returns:
-            bool: True if successful
+            dict: Updated user document, or None if nothing was updated
         """
         users = get_users_collection()
 
@@ -150,15 +260,18 @@ class User:
             if field in profile_data:
                 update_doc[f'profile.{field}'] = profile_data[field]
 
-        if update_doc:
-            update_doc['updatedAt'] = datetime.utcnow()
-            result = users.update_one(
-                {'_id': user_id},
-                {'$set': update_doc}
-            )
-            return result.modified_count > 0
+        if not update_doc:
+            return None
 
-        return False
+        update_doc['updatedAt'] = datetime.utcnow()
+        user = users.find_one_and_update(
+            {'_id': user_id},
+            {'$set': update_doc},
+            projection=User.PUBLIC_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        User._refresh_current(user)
+        return user
 
     @staticmethod
     def update_preferences(user_id, preferences_data):
@@ -170,7 +283,7 @@ class User:
             preferences_data: Preferences data to update
 
         Returns:
-            bool: True if successful
+            dict: Updated user document, or None if nothing was updated
         """
         users = get_users_collection()
 
@@ -185,15 +298,18 @@ class User:
             if field in preferences_data:
                 update_doc[f'preferences.{field}'] = preferences_data[field]
 
-        if update_doc:
-            update_doc['updatedAt'] = datetime.utcnow()
-            result = users.update_one(
-                {'_id': user_id},
-                {'$set': update_doc}
-            )
-            return result.modified_count > 0
+        if not update_doc:
+            return None
 
-        return False
+        update_doc['updatedAt'] = datetime.utcnow()
+        user = users.find_one_and_update(
+            {'_id': user_id},
+            {'$set': update_doc},
+            projection=User.PUBLIC_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        User._refresh_current(user)
+        return user
 
     @staticmethod
     def update_profile_picture(user_id, file_path):
@@ -205,23 +321,25 @@ class User:
             file_path: Path to profile picture
 
         Returns:
-            bool: True if successful
+            dict: User document before the update with only profile.profilePicture,
+                  so the replaced file can be deleted; None if the user doesn't exist
         """
         users = get_users_collection()
 
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        result = users.update_one(
+        return users.find_one_and_update(
             {'_id': user_id},
             {
                 '$set': {
                     'profile.profilePicture': file_path,
                     'updatedAt': datetime.utcnow()
                 }
-            }
+            },
+            projection={'profile.profilePicture': 1, '_id': 0},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
 
     @staticmethod
     def update_resume(user_id, file_path):
@@ -233,23 +351,25 @@ class User:
             file_path: Path to resume
 
         Returns:
-            bool: True if successful
+            dict: User document before the update with only profile.resume,
+                  so the replaced file can be deleted; None if the user doesn't exist
         """
         users = get_users_collection()
 
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        result = users.update_one(
+        return users.find_one_and_update(
             {'_id': user_id},
             {
                 '$set': {
                     'profile.resume': file_path,
                     'updatedAt': datetime.utcnow()
                 }
-            }
+            },
+            projection={'profile.resume': 1, '_id': 0},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
 
     @staticmethod
     def increment_swipes(user_id):
@@ -262,50 +382,129 @@ class User:
         Returns:
             tuple: (success, swipes_remaining)
         """
+        subscription = User.use_swipe(user_id)
+        if subscription is None:
+            return False, 0
+
+        return True, User.swipes_remaining(subscription)
+
+    @staticmethod
+    def use_swipe(user_id):
+        """
+        Use one of today's swipes.
+
+        Every endpoint that spends swipes goes through here, so they all
+        share one count: the Redis counter when Redis is up (flushed to
+        MongoDB periodically), otherwise consume_swipe directly.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            dict: Subscription fields after the swipe, or None if the user
+                  doesn't exist or has reached the swipe limit
+        """
+        subscription = swipe_counter.track_swipe(str(user_id))
+
+        if subscription is None:
+            # Redis unavailable: update MongoDB directly
+            user = User.consume_swipe(user_id, projection={'subscription': 1})
+            return user.get('subscription', {}) if user else None
+
+        return subscription if subscription['allowed'] else None
+
+    @staticmethod
+    def refund_swipe(user_id):
+        """
+        Give back a swipe taken by use_swipe, e.g. when the work it paid
+        for couldn't be queued.
+
+        Args:
+            user_id: User ID
+        """
+        if swipe_counter.untrack_swipe(str(user_id)):
+            return
+
+        # No Redis counter for today: the swipe was counted in MongoDB
         users = get_users_collection()
 
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        # Get current user data
-        user = users.find_one({'_id': user_id})
-        if not user:
-            return False, 0
+        users.update_one(
+            {'_id': user_id, 'subscription.swipesUsed': {'$gt': 0}},
+            {'$inc': {'subscription.swipesUsed': -1}}
+        )
 
-        subscription = user.get('subscription', {})
-        reset_date = subscription.get('resetDate')
-
-        # Check if we need to reset swipes
-        if should_reset_swipes(reset_date):
-            users.update_one(
-                {'_id': user_id},
-                {
-                    '$set': {
-                        'subscription.swipesUsed': 1,
-                        'subscription.resetDate': calculate_swipe_reset_date(),
-                        'updatedAt': datetime.utcnow()
-                    }
-                }
-            )
-            swipes_remaining = subscription.get('swipeLimit', Config.FREE_SWIPE_LIMIT) - 1
-        else:
-            # Increment swipes
-            swipes_used = subscription.get('swipesUsed', 0)
-            swipe_limit = subscription.get('swipeLimit', Config.FREE_SWIPE_LIMIT)
+    @staticmethod
+    def consume_swipe(user_id, projection=None):
+        """
+        Atomically use one swipe, resetting the daily count if it's due.
+
+        The reset check, limit check and increment all happen in a single
+        pipeline find_one_and_update, so there is no read-then-write race
+        and only one round-trip per swipe.
+
+        Args:
+            user_id: User ID
+            projection: Optional projection for the returned document
 
-            if swipe_limit != -1 and swipes_used >= swipe_limit:
-                return False, 0
+        Returns:
+            dict: Updated user document, or None if the user doesn't exist
+                  or has reached the swipe limit
+        """
+        users = get_users_collection()
 
-            users.update_one(
-                {'_id': user_id},
-                {
-                    '$inc': {'subscription.swipesUsed': 1},
-                    '$set': {'updatedAt': datetime.utcnow()}
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        now = datetime.utcnow()
+        swipe_limit = {'$ifNull': ['$subscription.swipeLimit', Config.FREE_SWIPE_LIMIT]}
+        swipes_used = {'$ifNull': ['$subscription.swipesUsed', 0]}
+        reset_due = {'$lte': [{'$ifNull': ['$subscription.resetDate', None]}, now]}
+
+        # A swipe is allowed when the period has elapsed (it starts a new one),
+        # the plan is unlimited, or the user is still under the limit
+        return users.find_one_and_update(
+            {
+                '_id': user_id,
+                '$expr': {'$or': [
+                    reset_due,
+                    {'$eq': [swipe_limit, -1]},
+                    {'$lt': [swipes_used, swipe_limit]}
+                ]}
+            },
+            [{
+                '$set': {
+                    'subscription.swipesUsed': {
+                        '$cond': [reset_due, 1, {'$add': [swipes_used, 1]}]
+                    },
+                    'subscription.resetDate': {
+                        '$cond': [reset_due, calculate_swipe_reset_date(), '$subscription.resetDate']
+                    },
+                    'updatedAt': now
                 }
-            )
-            swipes_remaining = swipe_limit - (swipes_used + 1) if swipe_limit != -1 else -1
+            }],
+            projection=projection,
+            return_document=ReturnDocument.AFTER
+        )
+
+    @staticmethod
+    def swipes_remaining(subscription):
+        """
+        Get remaining swipes for a subscription subdocument.
+
+        Args:
+            subscription: User subscription data
+
+        Returns:
+            int: Swipes remaining (-1 for unlimited)
+        """
+        swipe_limit = subscription.get('swipeLimit', Config.FREE_SWIPE_LIMIT)
+        if swipe_limit == -1:
+            return -1
 
-        return True, swipes_remaining
+        return swipe_limit - subscription.get('swipesUsed', 0)
 
     @staticmethod
     def get_swipe_status(user_id):
@@ -323,12 +522,44 @@ class User:
         if isinstance(user_id, str):
             user_id = ObjectId(user_id)
 
-        user = users.find_one({'_id': user_id})
-        if not user:
+        user = users.find_one({'_id': user_id}, {'subscription': 1, '_id': 0})
+        if user is None:
             return None
 
-        subscription = user.get('subscription', {})
+        subscription = User.with_live_swipe_count(user_id, user.get('subscription', {}))
+        return User.build_swipe_status(subscription)
+
+    @staticmethod
+    def with_live_swipe_count(user_id, subscription):
+        """
+        Overlay today's Redis swipe count, which is ahead of MongoDB until
+        the next flush.
+
+        Args:
+            user_id: User ID
+            subscription: User subscription data
 
+        Returns:
+            dict: Subscription data with the current swipe count
+        """
+        live = swipe_counter.get_swipe_count(str(user_id))
+        if not live:
+            return subscription
+
+        swipes_used, reset_date = live
+        return {**subscription, 'swipesUsed': swipes_used, 'resetDate': reset_date}
+
+    @staticmethod
+    def build_swipe_status(subscription):
+        """
+        Build swipe status info from a subscription subdocument.
+
+        Args:
+            subscription: User subscription data
+
+        Returns:
+            dict: Swipe status info
+        """
         # Check if reset is needed
         if should_reset_swipes(subscription.get('resetDate')):
             swipes_used = 0
@@ -362,7 +593,7 @@ class User:
             plan: New plan ('free' or 'paid')
 
         Returns:
-            bool: True if successful
+            dict: Updated subscription subdocument, or None if the user doesn't exist
         """
         users = get_users_collection()
 
@@ -382,7 +613,7 @@ class User:
         if plan == 'paid':
             subscription_end = datetime.utcnow() + timedelta(days=30)
 
-        result = users.update_one(
+        user = users.find_one_and_update(
             {'_id': user_id},
             {
                 '$set': {
@@ -391,7 +622,14 @@ class User:
                     'subscription.subscriptionEnd': subscription_end,
                     'updatedAt': datetime.utcnow()
                 }
-            }
+            },
+            projection={'subscription': 1, '_id': 0},
+            return_document=ReturnDocument.AFTER
         )
 
-        return result.modified_count > 0
+        # The swipe counter caches the old limit
+        swipe_counter.forget_subscription(str(user_id))
+
+        if user is None:
+            return None
+        return user.get('subscription', {})
@@ -1,6 +1,7 @@
 """Enhanced User model with comprehensive onboarding data."""
 from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo import WriteConcern
 import bcrypt
 from config.database import get_users_collection
 from config.settings import Config
@@ -118,7 +119,7 @@ class EnhancedUser:
                 'original': kwargs.get('originalResume'),  # File path to uploaded resume
                 'parsed': kwargs.get('parsedResume'),  # Structured parsed data
                 'versions': [],  # List of tailored resume versions
-                'defaultVersion': None
+                'defaultVersionId': None
             },
 
             # Subscription & Limits
@@ -272,6 +273,48 @@ class EnhancedUser:
 
         return result.modified_count > 0
 
+    @staticmethod
+    def merge_parsed_resume(user_id, parsed_data):
+        """
+        Fill user profile fields from parsed resume data.
+
+        Args:
+            user_id: User ID
+            parsed_data: Output of ResumeParser.parse_resume
+
+        Returns:
+            bool: Success status
+        """
+        # Re-derivable from the resume, so don't wait for majority/journal acks
+        users = get_users_collection().with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        contact_info = parsed_data.get('contactInfo', {})
+
+        result = users.update_one(
+            {'_id': user_id},
+            {
+                '$set': {
+                    'profile.phone': contact_info.get('phone'),
+                    'profile.location': contact_info.get('location', {}),
+                    'workExperience': parsed_data.get('workExperience', []),
+                    'education': parsed_data.get('education', []),
+                    'skills': [
+                        {'name': skill, 'source': 'parsed', 'proficiency': 'intermediate'}
+                        for skill in parsed_data.get('skills', [])
+                    ],
+                    'professional.summary': parsed_data.get('summary', ''),
+                    'resumes.parsed': parsed_data
+                }
+            }
+        )
+
+        return result.modified_count > 0
+
     @staticmethod
     def complete_onboarding(user_id):
         """Mark onboarding as completed."""
@@ -426,26 +469,7 @@ class EnhancedUser:
         # Check if skill gap already exists
         user = users.find_one({'_id': user_id})
         skill_gaps = user.get('skillDevelopment', {}).get('identifiedGaps', [])
-
-        existing_gap = None
-        for gap in skill_gaps:
-            if gap['skill'].lower() == skill.lower():
-                existing_gap = gap
-                break
-
-        if existing_gap:
-            # Update frequency and priority
-            existing_gap['frequency'] += frequency
-            if priority == 'high' and existing_gap['priority'] != 'high':
-                existing_gap['priority'] = priority
-        else:
-            # Add new skill gap
-            skill_gaps.append({
-                'skill': skill,
-                'priority': priority,
-                'frequency': frequency,
-                'identifiedAt': datetime.utcnow()
-            })
+        skill_gaps = EnhancedUser.merge_skill_gaps(skill_gaps, [skill], priority, frequency)
 
         result = users.update_one(
             {'_id': user_id},
@@ -459,6 +483,84 @@ class EnhancedUser:
 
         return result.modified_count > 0
 
+    @staticmethod
+    def merge_skill_gaps(skill_gaps, skills, priority='medium', frequency=1):
+        """
+        Merge skills into a list of skill gaps.
+
+        Args:
+            skill_gaps: Existing skill gap list
+            skills: Skill names to add or bump
+            priority: Priority level (low/medium/high)
+            frequency: How often each skill appears in target jobs
+
+        Returns:
+            list: Updated skill gap list
+        """
+        skill_gaps = [dict(gap) for gap in skill_gaps]
+
+        for skill in skills:
+            existing_gap = None
+            for gap in skill_gaps:
+                if gap['skill'].lower() == skill.lower():
+                    existing_gap = gap
+                    break
+
+            if existing_gap:
+                # Update frequency and priority
+                existing_gap['frequency'] += frequency
+                if priority == 'high' and existing_gap['priority'] != 'high':
+                    existing_gap['priority'] = priority
+            else:
+                # Add new skill gap
+                skill_gaps.append({
+                    'skill': skill,
+                    'priority': priority,
+                    'frequency': frequency,
+                    'identifiedAt': datetime.utcnow()
+                })
+
+        return skill_gaps
+
+    @staticmethod
+    def record_auto_application(user_id, user_profile, missing_skills=None):
+        """
+        Record an auto-application's analytics and skill gaps in one write.
+
+        Args:
+            user_id: User ID
+            user_profile: User document the skill gaps are merged into
+            missing_skills: Job requirements the user lacks
+
+        Returns:
+            bool: Success status
+        """
+        users = get_users_collection()
+
+        if isinstance(user_id, str):
+            user_id = ObjectId(user_id)
+
+        update_fields = {'updatedAt': datetime.utcnow()}
+
+        if missing_skills:
+            skill_gaps = user_profile.get('skillDevelopment', {}).get('identifiedGaps', [])
+            update_fields['skillDevelopment.identifiedGaps'] = EnhancedUser.merge_skill_gaps(
+                skill_gaps, missing_skills
+            )
+
+        result = users.update_one(
+            {'_id': user_id},
+            {
+                '$inc': {
+                    'analytics.autoApplications': 1,
+                    'analytics.totalApplications': 1
+                },
+                '$set': update_fields
+            }
+        )
+
+        return result.modified_count > 0
+
     @staticmethod
     def update_analytics(user_id, metric, value):
         """
@@ -36,25 +36,22 @@ def upload_avatar():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
-        # Get user's current profile picture (for deletion)
-        user = User.find_by_id(user_id)
-        old_picture = user.get('profile', {}).get('profilePicture') if user else None
-
         # Save new profile picture
         file_path = FileService.save_profile_picture(file, user_id)
 
         if not file_path:
             return jsonify(format_error_response("Failed to save profile picture", 500))
 
-        # Update user profile
-        success = User.update_profile_picture(user_id, file_path)
+        # Update user profile; returns the previous profile picture path in the same round trip
+        previous = User.update_profile_picture(user_id, file_path)
 
-        if not success:
+        if previous is None:
             # Cleanup uploaded file if database update failed
             FileService.delete_file(file_path)
             return jsonify(format_error_response("Failed to update profile", 500))
 
         # Delete old profile picture if it exists
+        old_picture = previous.get('profile', {}).get('profilePicture')
         if old_picture:
             FileService.delete_file(old_picture)
 
@@ -94,10 +91,6 @@ def upload_resume():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
-        # Get user's current resume (for deletion)
-        user = User.find_by_id(user_id)
-        old_resume = user.get('profile', {}).get('resume') if user else None
-
         # Save new resume
         file_path = FileService.save_resume(file, user_id)
 
@@ -114,15 +107,16 @@ def upload_resume():
             # Celery not available, skip training corpus addition
             pass
 
-        # Update user profile
-        success = User.update_resume(user_id, file_path)
+        # Update user profile; returns the previous resume path in the same round trip
+        previous = User.update_resume(user_id, file_path)
 
-        if not success:
+        if previous is None:
             # Cleanup uploaded file if database update failed
             FileService.delete_file(file_path)
             return jsonify(format_error_response("Failed to update profile", 500))
 
         # Delete old resume if it exists
+        old_resume = previous.get('profile', {}).get('resume')
         if old_resume:
             FileService.delete_file(old_resume)
 
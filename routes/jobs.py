@@ -1,25 +1,387 @@
 """Job management and swipe tracking routes."""
+import json
 import logging
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+import math
+import re
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
 from bson import ObjectId
+from flask import Blueprint, Response, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from models.job import Job
 from models.swipe import Swipe, Application
 from models.user import User
+from config.settings import Config
 from utils.helpers import (
+    build_match_score_expression,
+    cached_match_score,
     format_error_response,
+    has_match_preferences,
     serialize_document,
     serialize_documents,
     calculate_skip_limit,
     get_pagination_metadata,
-    is_valid_object_id
+    is_valid_object_id,
+    json_default,
+    preferences_cache_key
 )
 from utils.validators import validate_pagination_params
+from utils.cache import shared_cached
 
 logger = logging.getLogger(__name__)
 jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
 
 
+# Static filter options served by /filters, serialized once at import
+JOB_FILTER_OPTIONS = {
+    'jobTypes': [
+        'FULLTIME',
+        'PARTTIME',
+        'CONTRACT',
+        'CONTRACTOR',
+        'INTERN',
+        'TEMPORARY'
+    ],
+    'experienceLevels': [
+        'Internship',
+        'Entry Level',
+        'Mid Level',
+        'Senior',
+        'Lead',
+        'Executive'
+    ],
+    'industries': [
+        'Technology',
+        'Healthcare',
+        'Finance',
+        'Education',
+        'Marketing',
+        'Sales',
+        'Engineering',
+        'Design',
+        'Human Resources',
+        'Customer Service',
+        'Operations',
+        'Legal',
+        'Consulting',
+        'Real Estate',
+        'Retail',
+        'Manufacturing',
+        'Transportation',
+        'Hospitality',
+        'Media',
+        'Non-Profit',
+        'Government',
+        'Other'
+    ],
+    'companySizes': [
+        '1-10',
+        '11-50',
+        '51-200',
+        '201-500',
+        '501-1000',
+        '1001-5000',
+        '5001+'
+    ],
+    'datePosted': [
+        {'value': 'all', 'label': 'All time'},
+        {'value': 'today', 'label': 'Past 24 hours'},
+        {'value': '3days', 'label': 'Past 3 days'},
+        {'value': 'week', 'label': 'Past week'},
+        {'value': 'month', 'label': 'Past month'}
+    ],
+    'salaryRanges': [
+        {'min': 0, 'max': 30000, 'label': 'Under $30k'},
+        {'min': 30000, 'max': 50000, 'label': '$30k - $50k'},
+        {'min': 50000, 'max': 75000, 'label': '$50k - $75k'},
+        {'min': 75000, 'max': 100000, 'label': '$75k - $100k'},
+        {'min': 100000, 'max': 150000, 'label': '$100k - $150k'},
+        {'min': 150000, 'max': 200000, 'label': '$150k - $200k'},
+        {'min': 200000, 'max': None, 'label': '$200k+'}
+    ],
+    'remoteOptions': [
+        {'value': False, 'label': 'On-site'},
+        {'value': True, 'label': 'Remote only'}
+    ]
+}
+_JOB_FILTER_OPTIONS_JSON = json.dumps(JOB_FILTER_OPTIONS).encode('utf-8')
+
+# Metadata for every job source the aggregator knows about
+JOB_SOURCES = [
+    {
+        'id': 'jsearch',
+        'name': 'JSearch',
+        'description': 'Google for Jobs aggregator',
+        'icon': 'https://rapidapi.com/favicon.ico'
+    },
+    {
+        'id': 'careerjet',
+        'name': 'Careerjet',
+        'description': 'International job search engine',
+        'icon': 'https://www.careerjet.com/favicon.ico'
+    },
+    {
+        'id': 'jobs_search',
+        'name': 'Jobs Search API',
+        'description': 'LinkedIn, Indeed, ZipRecruiter aggregator',
+        'icon': 'https://rapidapi.com/favicon.ico'
+    },
+    {
+        'id': 'linkedin',
+        'name': 'LinkedIn Jobs',
+        'description': 'Direct LinkedIn job listings',
+        'icon': 'https://static.licdn.com/sc/h/eahiplrwoq61f4uan012ia17i'
+    },
+    {
+        'id': 'indeed',
+        'name': 'Indeed Jobs',
+        'description': 'Direct Indeed job listings',
+        'icon': 'https://www.indeed.com/favicon.ico'
+    }
+]
+
+# /sources response body, rebuilt at most every SOURCES_CACHE_TTL seconds
+SOURCES_CACHE_TTL = 30
+_sources_cache = {'body': None, 'expiresAt': 0.0}
+
+# /statistics cache lifetimes: global job aggregates and per-user counts
+JOB_STATS_CACHE_TTL = 300
+USER_STATS_CACHE_TTL = 30
+
+# Candidates fetched per page slot when scoring in Python, to leave room
+# for jobs dropped by the match score threshold
+MATCH_OVERFETCH_FACTOR = 1.5
+
+
+def _parse_cursor(cursor):
+    """
+    Parse a swipe pagination cursor of the form "<timestamp>_<swipeId>".
+
+    Args:
+        cursor: Cursor string from the query string
+
+    Returns:
+        tuple: (timestamp, ObjectId) of the last-seen swipe
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    timestamp, _, swipe_id = cursor.rpartition('_')
+    if not ObjectId.is_valid(swipe_id):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')), ObjectId(swipe_id)
+
+
+def _format_cursor(swipe):
+    """Build the cursor that resumes pagination after this swipe."""
+    return f"{swipe['timestamp'].isoformat()}_{swipe['_id']}"
+
+
+def _build_job_sources_response():
+    """
+    Build the serialized /sources response body.
+
+    Returns:
+        bytes: JSON body with job sources, their status and cache stats
+    """
+    from services.job_aggregation import JobAggregationService
+
+    job_service = JobAggregationService()
+    available_sources = job_service.get_available_sources()
+
+    sources = [
+        {**source, 'enabled': source['id'] in available_sources}
+        for source in JOB_SOURCES
+    ]
+
+    # Get cache stats if available
+    cache_stats = job_service.get_cache_stats()
+
+    return json.dumps({
+        'sources': sources,
+        'totalSources': len(sources),
+        'enabledSources': len(available_sources),
+        'caching': cache_stats
+    }).encode('utf-8')
+
+
+# Query parameters copied into job filters, grouped by how they're parsed
+_JOB_FILTER_STRING_ARGS = ('keywords', 'city', 'state', 'country', 'datePosted')
+_JOB_FILTER_INT_ARGS = ('minSalary', 'maxSalary')
+_JOB_FILTER_LIST_ARGS = ('jobTypes', 'industries', 'experienceLevels', 'companySize')
+
+
+def _parse_bool(value):
+    """Parse a 'true'/'false' query parameter."""
+    return value.lower() == 'true'
+
+
+def _split_list(value):
+    """Parse a comma-separated query parameter."""
+    return value.split(',') if value else []
+
+
+def _build_job_filters(args, user=None):
+    """
+    Build job filters from saved user preferences and query parameters.
+
+    Args:
+        args: Query parameters as a flat dict
+        user: User document whose preferences seed the filters (None to skip)
+
+    Returns:
+        dict: Filters for Job.get_active_jobs
+
+    Raises:
+        ValueError: If a numeric parameter is not an integer
+    """
+    filters = {}
+
+    # Start with user preferences if enabled
+    if user is not None:
+        preferences = user.get('preferences', {})
+        profile = user.get('profile', {})
+
+        filters = {
+            'jobTypes': preferences.get('jobTypes', []),
+            'industries': preferences.get('industries', []),
+            'roleLevels': preferences.get('roleLevels', []),
+            'remoteOnly': preferences.get('remoteOnly', False)
+        }
+
+        # Get salary expectations from preferences first, fallback to profile
+        expected_salary = preferences.get('expectedSalary') or profile.get('expectedSalary', {})
+        if expected_salary:
+            filters['minSalary'] = expected_salary.get('min')
+            filters['maxSalary'] = expected_salary.get('max')
+
+    # Override with query parameters (filters from filter modal)
+    for name in _JOB_FILTER_STRING_ARGS:
+        value = args.get(name)
+        if value:
+            filters[name] = value
+
+    remote = args.get('remote')
+    if remote:
+        filters['remoteOnly'] = _parse_bool(remote)
+
+    for name in _JOB_FILTER_INT_ARGS:
+        value = args.get(name)
+        if value:
+            filters[name] = int(value)
+
+    for name in _JOB_FILTER_LIST_ARGS:
+        value = args.get(name)
+        if value:
+            filters[name] = _split_list(value)
+
+    return filters
+
+
+# Application history sort keys mapped to aggregation fields
+APPLICATION_SORT_FIELDS = {
+    'appliedAt': 'appliedAt',
+    'company': 'job.company.name',
+    'title': 'job.title',
+    'status': 'status'
+}
+
+
+def _build_application_filters(args):
+    """
+    Build application history filters from query parameters.
+
+    Args:
+        args: Query parameters as a flat dict
+
+    Returns:
+        dict: Normalized filter values
+    """
+    return {
+        'status': args.get('status'),
+        'keywords': args.get('keywords', '').lower(),
+        'city': args.get('city', '').lower(),
+        'state': args.get('state', ''),
+        'jobTypes': _split_list(args.get('jobTypes')),
+        'industries': _split_list(args.get('industries')),
+        'dateFrom': args.get('dateFrom'),
+        'dateTo': args.get('dateTo'),
+        'sortBy': args.get('sortBy', 'appliedAt'),
+        'sortOrder': args.get('sortOrder', 'desc')
+    }
+
+
+def _parse_iso_date(value):
+    """Parse an ISO date query parameter into a naive UTC datetime (None if invalid)."""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _build_application_query(app_filters):
+    """
+    Translate application history filters into aggregation stages.
+
+    Args:
+        app_filters: Filters from _build_application_filters
+
+    Returns:
+        tuple: (application match, job match, sort spec)
+    """
+    match = {}
+    if app_filters['status']:
+        match['status'] = app_filters['status']
+
+    applied_at = {}
+    date_from = _parse_iso_date(app_filters['dateFrom'])
+    if date_from:
+        applied_at['$gte'] = date_from
+    date_to = _parse_iso_date(app_filters['dateTo'])
+    if date_to:
+        applied_at['$lte'] = date_to
+    if applied_at:
+        match['appliedAt'] = applied_at
+
+    job_match = {}
+    keywords = app_filters['keywords']
+    if keywords:
+        keyword_regex = {'$regex': re.escape(keywords), '$options': 'i'}
+        job_match['$or'] = [
+            {'job.title': keyword_regex},
+            {'job.company.name': keyword_regex}
+        ]
+
+    if app_filters['city']:
+        job_match['job.location.city'] = {
+            '$regex': re.escape(app_filters['city']),
+            '$options': 'i'
+        }
+
+    if app_filters['state']:
+        job_match['job.location.state'] = app_filters['state']
+
+    job_types = app_filters['jobTypes']
+    if job_types and job_types[0]:
+        job_match['job.employment.type'] = {'$in': job_types}
+
+    industries = app_filters['industries']
+    if industries and industries[0]:
+        job_match['job.company.industry'] = {'$in': industries}
+
+    direction = -1 if app_filters['sortOrder'] == 'desc' else 1
+    sort_field = APPLICATION_SORT_FIELDS.get(app_filters['sortBy'], 'appliedAt')
+
+    return match, job_match, {sort_field: direction}
+
+
 @jobs_bp.route('', methods=['GET'])
 @jwt_required()
 def get_jobs():
@@ -62,88 +424,28 @@ def get_jobs():
             return jsonify(format_error_response(error, 400))
 
         # Get user profile
-        user = User.find_by_id(user_id)
+        user = User.current()
         if not user:
             return jsonify(format_error_response("User not found", 404))
 
-        # Build filters from query parameters
-        filters = {}
-        use_preferences = request.args.get('usePreferences', 'true').lower() == 'true'
-
-        # Start with user preferences if enabled
-        if use_preferences:
-            preferences = user.get('preferences', {})
-            profile = user.get('profile', {})
-
-            filters = {
-                'jobTypes': preferences.get('jobTypes', []),
-                'industries': preferences.get('industries', []),
-                'roleLevels': preferences.get('roleLevels', []),
-                'remoteOnly': preferences.get('remoteOnly', False)
-            }
-
-            # Get salary expectations from preferences first, fallback to profile
-            expected_salary = preferences.get('expectedSalary') or profile.get('expectedSalary', {})
-            if expected_salary:
-                filters['minSalary'] = expected_salary.get('min')
-                filters['maxSalary'] = expected_salary.get('max')
-
-        # Override with query parameters (filters from filter modal)
-        if request.args.get('keywords'):
-            filters['keywords'] = request.args.get('keywords')
-
-        if request.args.get('city'):
-            filters['city'] = request.args.get('city')
-
-        if request.args.get('state'):
-            filters['state'] = request.args.get('state')
-
-        if request.args.get('country'):
-            filters['country'] = request.args.get('country')
-
-        if request.args.get('remote'):
-            filters['remoteOnly'] = request.args.get('remote').lower() == 'true'
-
-        if request.args.get('minSalary'):
-            filters['minSalary'] = int(request.args.get('minSalary'))
-
-        if request.args.get('maxSalary'):
-            filters['maxSalary'] = int(request.args.get('maxSalary'))
-
-        if request.args.get('jobTypes'):
-            filters['jobTypes'] = request.args.get('jobTypes').split(',')
-
-        if request.args.get('industries'):
-            filters['industries'] = request.args.get('industries').split(',')
-
-        if request.args.get('experienceLevels'):
-            filters['experienceLevels'] = request.args.get('experienceLevels').split(',')
-
-        if request.args.get('companySize'):
-            filters['companySize'] = request.args.get('companySize').split(',')
-
-        if request.args.get('datePosted'):
-            filters['datePosted'] = request.args.get('datePosted')
+        # Build filters from saved preferences and query parameters
+        args = request.args.to_dict(flat=True)
+        use_preferences = _parse_bool(args.get('usePreferences', 'true'))
+        filters = _build_job_filters(args, user if use_preferences else None)
 
         # Get match score threshold
-        min_match_score = float(request.args.get('minMatchScore', 0.0))
+        min_match_score = float(args.get('minMatchScore', 0.0))
 
-        # Get jobs user has already swiped on
-        swiped_job_ids = Swipe.get_swiped_job_ids(user_id)
+        # Exclude recently swiped jobs in the query itself; the cap keeps the
+        # $nin list from bloating the BSON query for very active users
+        exclude_ids = Swipe.get_swiped_job_ids(user_id, limit=Config.MAX_EXCLUDED_JOB_IDS)
 
         # Calculate pagination
         skip, limit = calculate_skip_limit(validated_page, validated_page_size)
 
-        # Get jobs with filters
-        jobs = Job.get_active_jobs(filters, skip=skip, limit=validated_page_size * 2)
-
-        # Exclude already swiped jobs
-        if swiped_job_ids:
-            exclude_ids = [ObjectId(jid) if isinstance(jid, str) else jid for jid in swiped_job_ids]
-            jobs = [job for job in jobs if job['_id'] not in exclude_ids]
-
-        # Calculate match scores
-        from utils.helpers import calculate_match_score
+        query_filters = filters
+        if exclude_ids:
+            query_filters = {**filters, '_excludeIds': exclude_ids}
 
         # Combine preferences and profile data for matching
         preferences = user.get('preferences', {})
@@ -164,20 +466,62 @@ def get_jobs():
         if 'expectedSalary' not in user_data and profile.get('expectedSalary'):
             user_data['expectedSalary'] = profile['expectedSalary']
 
-        jobs_with_scores = []
-        for job in jobs:
-            match_score = calculate_match_score(user_data, job)
-            if match_score >= min_match_score:
-                jobs_with_scores.append({
-                    'job': job,
-                    'matchScore': match_score
-                })
+        # Score, threshold, sort and paginate inside MongoDB when possible
+        has_preferences = has_match_preferences(user_data)
+        score_expression = None
+        if has_preferences:
+            score_expression = build_match_score_expression(user_data)
+
+        if not has_preferences:
+            # Nothing to match on (e.g. new signup): every job scores 0.0,
+            # so serve the newest jobs without scoring
+            jobs_with_scores = []
+            if min_match_score <= 0:
+                jobs = Job.get_active_jobs(
+                    query_filters,
+                    skip=skip,
+                    limit=validated_page_size,
+                    sort_by='postedAt',
+                    projection=Job.CARD_PROJECTION
+                )
+                jobs_with_scores = [{'job': job, 'matchScore': 0.0} for job in jobs]
+        elif score_expression is not None:
+            ranked_jobs = Job.get_ranked_jobs(
+                query_filters,
+                score_expression,
+                min_score=min_match_score,
+                skip=skip,
+                limit=validated_page_size,
+                projection=Job.CARD_PROJECTION
+            )
+            jobs_with_scores = [
+                {'job': job, 'matchScore': job.pop('matchScore')}
+                for job in ranked_jobs
+            ]
+        else:
+            # Get jobs with filters, overfetching for the score threshold
+            jobs = Job.get_active_jobs(
+                query_filters,
+                skip=skip,
+                limit=math.ceil(validated_page_size * MATCH_OVERFETCH_FACTOR),
+                projection=Job.CARD_PROJECTION
+            )
+
+            prefs_key = preferences_cache_key(user_data)
+            jobs_with_scores = []
+            for job in jobs:
+                match_score = cached_match_score(user_data, job, prefs_key)
+                if match_score >= min_match_score:
+                    jobs_with_scores.append({
+                        'job': job,
+                        'matchScore': match_score
+                    })
 
-        # Sort by match score
-        jobs_with_scores.sort(key=lambda x: x['matchScore'], reverse=True)
+            # Sort by match score
+            jobs_with_scores.sort(key=lambda x: x['matchScore'], reverse=True)
 
-        # Limit results
-        jobs_with_scores = jobs_with_scores[:validated_page_size]
+            # Limit results
+            jobs_with_scores = jobs_with_scores[:validated_page_size]
 
         # Serialize jobs
         result = []
@@ -228,13 +572,11 @@ def get_job_details(job_id):
         job_data = serialize_document(job)
 
         # Calculate match score for this user
-        user_id = get_jwt_identity()
-        user = User.find_by_id(user_id)
+        user = User.current()
 
         if user:
-            from utils.helpers import calculate_match_score
             preferences = user.get('preferences', {})
-            match_score = calculate_match_score(preferences, job)
+            match_score = cached_match_score(preferences, job)
             job_data['matchScore'] = round(match_score, 2)
 
         return jsonify({'job': job_data}), 200
@@ -286,32 +628,67 @@ def swipe_job(job_id):
         if not job:
             return jsonify(format_error_response("Job not found", 404))
 
-        # Check if already swiped
-        if Swipe.has_swiped(user_id, job_id):
+        # Record swipe; the unique {userId, jobId} index rejects repeats
+        match_score = data.get('matchScore')
+        try:
+            swipe_id = Swipe.record_swipe(user_id, job_id, action, match_score)
+        except DuplicateKeyError:
             return jsonify(format_error_response("Already swiped on this job", 409))
 
-        # Check swipe limit
-        success, swipes_remaining = User.increment_swipes(user_id)
+        # Check swipe limit through the same counter as /subscription/track-swipe
+        subscription = User.use_swipe(user_id)
 
-        if not success:
+        if subscription is None:
+            # Over the limit, so the swipe doesn't count
+            Swipe.delete_swipe(swipe_id)
             return jsonify(format_error_response(
                 "Swipe limit reached. Please upgrade your subscription.",
                 429
             ))
 
-        # Record swipe
-        match_score = data.get('matchScore')
-        Swipe.record_swipe(user_id, job_id, action, match_score)
+        swipes_remaining = User.swipes_remaining(subscription)
 
         # NEW: Auto-apply for paid users on like/superlike
         if action in ['like', 'superlike']:
-            user = User.find_by_id(user_id)
-            subscription = user.get('subscription', {})
             plan = subscription.get('plan', 'free')
 
             # Check if user is on paid plan
             if plan == 'paid':
-                # Trigger auto-apply workflow
+                # Queue auto-apply workflow; the LLM calls run on a Celery worker
+                try:
+                    from celery_app import auto_apply_task, auto_apply_task_id
+                except ImportError:
+                    auto_apply_task = None
+
+                if auto_apply_task:
+                    try:
+                        auto_apply_task.apply_async(
+                            args=[user_id, job_id],
+                            task_id=auto_apply_task_id(user_id, job_id)
+                        )
+                    except Exception as e:
+                        # Broker unreachable: undo the swipe and its quota so
+                        # the user can swipe again once it's back
+                        logger.error(f"Could not queue auto-apply for job {job_id}: {str(e)}")
+                        Swipe.delete_swipe(swipe_id)
+                        User.refund_swipe(user_id)
+                        body, status = format_error_response(
+                            "Auto-apply is temporarily unavailable. Please try again.",
+                            503
+                        )
+                        return jsonify(body), status
+
+                    return jsonify({
+                        'message': 'Job liked, application is being submitted automatically',
+                        'status': 'pending',
+                        'swipesRemaining': swipes_remaining,
+                        'action': action,
+                        'jobId': job_id,
+                        'autoApplied': 'queued',
+                        'statusUrl': f'/api/jobs/{job_id}/auto-apply-status'
+                    }), 202
+
+                # Celery not available, auto-apply inline
                 from services.auto_apply_service import AutoApplyService
 
                 auto_apply = AutoApplyService()
@@ -319,7 +696,7 @@ def swipe_job(job_id):
                     user_id=user_id,
                     job_id=job_id,
                     job_data=job,
-                    user_profile=user
+                    user_profile=User.current()
                 )
 
                 if apply_result['success']:
@@ -357,6 +734,65 @@ def swipe_job(job_id):
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
 
 
+@jobs_bp.route('/<job_id>/auto-apply-status', methods=['GET'])
+@jwt_required()
+def get_auto_apply_status(job_id):
+    """
+    Get the status of a queued auto-apply for a job.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        JSON response with status (pending, completed, failed)
+    """
+    try:
+        user_id = get_jwt_identity()
+
+        if not is_valid_object_id(job_id):
+            return jsonify(format_error_response("Invalid job ID", 400))
+
+        # The worker persists the application, so that is the source of truth
+        if Application.exists(user_id, job_id):
+            return jsonify({
+                'jobId': job_id,
+                'status': 'completed',
+                'autoApplied': True
+            }), 200
+
+        from celery_app import celery_app, auto_apply_task_id
+
+        result = celery_app.AsyncResult(auto_apply_task_id(user_id, job_id))
+
+        if not result.ready():
+            return jsonify({
+                'jobId': job_id,
+                'status': 'pending',
+                'autoApplied': 'queued'
+            }), 200
+
+        payload = result.result if result.successful() else {}
+        if isinstance(payload, dict) and payload.get('success'):
+            return jsonify({
+                'jobId': job_id,
+                'status': 'completed',
+                'autoApplied': True,
+                'applicationId': payload.get('applicationId'),
+                'coverLetterGenerated': payload.get('coverLetterGenerated', False),
+                'resumeCustomized': payload.get('resumeCustomized', False)
+            }), 200
+
+        return jsonify({
+            'jobId': job_id,
+            'status': 'failed',
+            'autoApplied': False,
+            'autoApplyError': payload.get('error') if isinstance(payload, dict) else str(result.result)
+        }), 200
+
+    except Exception as e:
+        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+
+
 @jobs_bp.route('/liked', methods=['GET'])
 @jwt_required()
 def get_liked_jobs():
@@ -366,6 +802,7 @@ def get_liked_jobs():
     Query parameters:
     - page: Page number (default: 1)
     - pageSize: Items per page (default: 20)
+    - cursor: meta.nextCursor from the previous page; takes precedence over page
 
     Returns:
         JSON response with liked jobs
@@ -376,6 +813,7 @@ def get_liked_jobs():
         # Get pagination params
         page = request.args.get('page', 1, type=int)
         page_size = request.args.get('pageSize', 20, type=int)
+        cursor = request.args.get('cursor')
 
         is_valid, (validated_page, validated_page_size), error = validate_pagination_params(
             page, page_size
@@ -384,25 +822,56 @@ def get_liked_jobs():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
+        from config.database import get_jobs_collection
+        jobs_collection = get_jobs_collection()
+
+        # Cursor pagination: index-backed range scan instead of skip()
+        if cursor:
+            try:
+                before = _parse_cursor(cursor)
+            except ValueError:
+                return jsonify(format_error_response("Invalid cursor", 400))
+
+            liked_job_ids, last_swipe = Swipe.get_liked_jobs_after(
+                user_id, before, validated_page_size
+            )
+
+            jobs = list(jobs_collection.find({'_id': {'$in': liked_job_ids}}, Job.LIST_PROJECTION))
+            has_next = len(liked_job_ids) == validated_page_size
+
+            return jsonify({
+                'jobs': serialize_documents(jobs),
+                'meta': {
+                    'pageSize': validated_page_size,
+                    'count': len(jobs),
+                    'hasNext': has_next,
+                    'nextCursor': _format_cursor(last_swipe) if has_next else None
+                }
+            }), 200
+
         # Calculate pagination
         skip, limit = calculate_skip_limit(validated_page, validated_page_size)
 
-        # Get liked job IDs
-        liked_job_ids = Swipe.get_liked_jobs(user_id, skip, limit)
+        # Get liked job IDs (first page also hands out a cursor for the next one)
+        last_swipe = None
+        if skip == 0:
+            liked_job_ids, last_swipe = Swipe.get_liked_jobs_after(user_id, None, limit)
+        else:
+            liked_job_ids = Swipe.get_liked_jobs(user_id, skip, limit)
 
         # Get job details
-        from config.database import get_jobs_collection
-        jobs_collection = get_jobs_collection()
-
-        jobs = list(jobs_collection.find({'_id': {'$in': liked_job_ids}}))
+        jobs = list(jobs_collection.find({'_id': {'$in': liked_job_ids}}, Job.LIST_PROJECTION))
         jobs_data = serialize_documents(jobs)
 
         # Get total count
         total_count = Swipe.get_swipe_count(user_id, action='like')
+        meta = get_pagination_metadata(total_count, validated_page, validated_page_size)
+        if last_swipe and len(liked_job_ids) == limit:
+            meta['nextCursor'] = _format_cursor(last_swipe)
 
         return jsonify({
             'jobs': jobs_data,
-            'meta': get_pagination_metadata(total_count, validated_page, validated_page_size)
+            'meta': meta
         }), 200
 
     except Exception as e:
@@ -419,6 +888,7 @@ def get_swipe_history():
     - page: Page number (default: 1)
     - pageSize: Items per page (default: 20)
     - action: Filter by action (like, dislike, superlike)
+    - cursor: meta.nextCursor from the previous page; takes precedence over page
 
     Returns:
         JSON response with swipe history
@@ -430,6 +900,7 @@ def get_swipe_history():
         page = request.args.get('page', 1, type=int)
         page_size = request.args.get('pageSize', 20, type=int)
         action = request.args.get('action')
+        cursor = request.args.get('cursor')
 
         is_valid, (validated_page, validated_page_size), error = validate_pagination_params(
             page, page_size
@@ -438,11 +909,17 @@ def get_swipe_history():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
-        # Calculate pagination
-        skip, limit = calculate_skip_limit(validated_page, validated_page_size)
+        # Get swipe history (cursor pagination avoids the O(skip) walk)
+        if cursor:
+            try:
+                before = _parse_cursor(cursor)
+            except ValueError:
+                return jsonify(format_error_response("Invalid cursor", 400))
 
-        # Get swipe history
-        swipes = Swipe.get_user_swipes(user_id, action, skip, limit)
+            swipes = Swipe.get_user_swipes_after(user_id, action, before, validated_page_size)
+        else:
+            skip, limit = calculate_skip_limit(validated_page, validated_page_size)
+            swipes = Swipe.get_user_swipes(user_id, action, skip, limit)
 
         # Get job details for each swipe
         from config.database import get_jobs_collection
@@ -450,7 +927,7 @@ def get_swipe_history():
 
         result = []
         for swipe in swipes:
-            job = jobs_collection.find_one({'_id': swipe['jobId']})
+            job = jobs_collection.find_one({'_id': swipe['jobId']}, Job.LIST_PROJECTION)
             if job:
                 swipe_data = serialize_document(swipe)
                 # Frontend expects 'jobData' not 'job'
@@ -460,12 +937,28 @@ def get_swipe_history():
                     swipe_data['swipedAt'] = swipe_data['timestamp']
                 result.append(swipe_data)
 
+        has_next = len(swipes) == validated_page_size
+        next_cursor = _format_cursor(swipes[-1]) if has_next else None
+
+        if cursor:
+            return jsonify({
+                'swipes': result,
+                'meta': {
+                    'pageSize': validated_page_size,
+                    'count': len(result),
+                    'hasNext': has_next,
+                    'nextCursor': next_cursor
+                }
+            }), 200
+
         # Get total count
         total_count = Swipe.get_swipe_count(user_id, action)
+        meta = get_pagination_metadata(total_count, validated_page, validated_page_size)
+        meta['nextCursor'] = next_cursor
 
         return jsonify({
             'swipes': result,
-            'meta': get_pagination_metadata(total_count, validated_page, validated_page_size)
+            'meta': meta
         }), 200
 
     except Exception as e:
@@ -502,12 +995,8 @@ def apply_to_job(job_id):
             return jsonify(format_error_response("Job not found", 404))
 
         # Check if already applied
-        existing_apps = Application.get_user_applications(user_id)
-        job_obj_id = ObjectId(job_id)
-
-        for app in existing_apps:
-            if app['jobId'] == job_obj_id:
-                return jsonify(format_error_response("Already applied to this job", 409))
+        if Application.exists(user_id, job_id):
+            return jsonify(format_error_response("Already applied to this job", 409))
 
         # Get application data
         data = request.get_json() or {}
@@ -561,106 +1050,26 @@ def get_applications():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
-        # Get all user applications (we'll filter manually)
-        applications = Application.get_user_applications(user_id, status=None, skip=0, limit=1000)
+        # Filter, sort and page in one aggregation over applications + jobs
+        app_filters = _build_application_filters(request.args.to_dict(flat=True))
+        match, job_match, sort = _build_application_query(app_filters)
 
-        # Enrich with job details and apply filters
-        from config.database import get_jobs_collection
-        jobs_collection = get_jobs_collection()
+        skip, limit = calculate_skip_limit(validated_page, validated_page_size)
+        applications, total_count = Application.search_user_applications(
+            user_id,
+            match=match,
+            job_match=job_match,
+            sort=sort,
+            skip=skip,
+            limit=limit,
+            job_projection=Job.LIST_PROJECTION
+        )
 
-        # Build filters from query parameters
-        status_filter = request.args.get('status')
-        keywords = request.args.get('keywords', '').lower()
-        city_filter = request.args.get('city', '').lower()
-        state_filter = request.args.get('state', '')
-        job_types = request.args.get('jobTypes', '').split(',') if request.args.get('jobTypes') else []
-        industries = request.args.get('industries', '').split(',') if request.args.get('industries') else []
-        date_from = request.args.get('dateFrom')
-        date_to = request.args.get('dateTo')
-
-        filtered_apps = []
+        paginated_apps = []
         for app in applications:
-            # Status filter
-            if status_filter and app.get('status') != status_filter:
-                continue
-
-            # Date range filter
-            if date_from:
-                try:
-                    from datetime import datetime
-                    app_date = app.get('appliedAt')
-                    if app_date < datetime.fromisoformat(date_from.replace('Z', '+00:00')):
-                        continue
-                except:
-                    pass
-
-            if date_to:
-                try:
-                    from datetime import datetime
-                    app_date = app.get('appliedAt')
-                    if app_date > datetime.fromisoformat(date_to.replace('Z', '+00:00')):
-                        continue
-                except:
-                    pass
-
-            # Get job details
-            job = jobs_collection.find_one({'_id': app['jobId']})
-            if not job:
-                continue
-
-            # Keywords filter (job title or company name)
-            if keywords:
-                title = job.get('title', '').lower()
-                company = job.get('company', {}).get('name', '').lower()
-                if keywords not in title and keywords not in company:
-                    continue
-
-            # City filter
-            if city_filter:
-                job_city = job.get('location', {}).get('city', '').lower()
-                if city_filter not in job_city:
-                    continue
-
-            # State filter
-            if state_filter:
-                job_state = job.get('location', {}).get('state', '')
-                if state_filter != job_state:
-                    continue
-
-            # Job types filter
-            if job_types and job_types[0]:  # Check if not empty list
-                job_type = job.get('employment', {}).get('type', '')
-                if job_type not in job_types:
-                    continue
-
-            # Industries filter
-            if industries and industries[0]:  # Check if not empty list
-                job_industry = job.get('company', {}).get('industry', '')
-                if job_industry not in industries:
-                    continue
-
-            # Passed all filters - add to results
             app_data = serialize_document(app)
-            app_data['job'] = serialize_document(job)
-            filtered_apps.append(app_data)
-
-        # Sort applications
-        sort_by = request.args.get('sortBy', 'appliedAt')
-        sort_order = request.args.get('sortOrder', 'desc')
-
-        if sort_by == 'appliedAt':
-            filtered_apps.sort(key=lambda x: x.get('appliedAt', ''), reverse=(sort_order == 'desc'))
-        elif sort_by == 'company':
-            filtered_apps.sort(key=lambda x: x.get('job', {}).get('company', {}).get('name', ''), reverse=(sort_order == 'desc'))
-        elif sort_by == 'title':
-            filtered_apps.sort(key=lambda x: x.get('job', {}).get('title', ''), reverse=(sort_order == 'desc'))
-        elif sort_by == 'status':
-            filtered_apps.sort(key=lambda x: x.get('status', ''), reverse=(sort_order == 'desc'))
-
-        # Apply pagination
-        total_count = len(filtered_apps)
-        skip, limit = calculate_skip_limit(validated_page, validated_page_size)
-        paginated_apps = filtered_apps[skip:skip+limit]
+            app_data['job'] = serialize_document(app['job'])
+            paginated_apps.append(app_data)
 
         return jsonify({
             'applications': paginated_apps,
@@ -716,59 +1125,12 @@ def get_job_sources():
         JSON response with available job sources and their status
     """
     try:
-        from services.job_aggregation import JobAggregationService
+        now = time.monotonic()
+        if _sources_cache['body'] is None or now >= _sources_cache['expiresAt']:
+            _sources_cache['body'] = _build_job_sources_response()
+            _sources_cache['expiresAt'] = now + SOURCES_CACHE_TTL
 
-        job_service = JobAggregationService()
-        available_sources = job_service.get_available_sources()
-
-        # Define all possible sources with metadata
-        all_sources = {
-            'jsearch': {
-                'id': 'jsearch',
-                'name': 'JSearch',
-                'description': 'Google for Jobs aggregator',
-                'icon': 'https://rapidapi.com/favicon.ico',
-                'enabled': 'jsearch' in available_sources
-            },
-            'careerjet': {
-                'id': 'careerjet',
-                'name': 'Careerjet',
-                'description': 'International job search engine',
-                'icon': 'https://www.careerjet.com/favicon.ico',
-                'enabled': 'careerjet' in available_sources
-            },
-            'jobs_search': {
-                'id': 'jobs_search',
-                'name': 'Jobs Search API',
-                'description': 'LinkedIn, Indeed, ZipRecruiter aggregator',
-                'icon': 'https://rapidapi.com/favicon.ico',
-                'enabled': 'jobs_search' in available_sources
-            },
-            'linkedin': {
-                'id': 'linkedin',
-                'name': 'LinkedIn Jobs',
-                'description': 'Direct LinkedIn job listings',
-                'icon': 'https://static.licdn.com/sc/h/eahiplrwoq61f4uan012ia17i',
-                'enabled': 'linkedin' in available_sources
-            },
-            'indeed': {
-                'id': 'indeed',
-                'name': 'Indeed Jobs',
-                'description': 'Direct Indeed job listings',
-                'icon': 'https://www.indeed.com/favicon.ico',
-                'enabled': 'indeed' in available_sources
-            }
-        }
-
-        # Get cache stats if available
-        cache_stats = job_service.get_cache_stats()
-
-        return jsonify({
-            'sources': list(all_sources.values()),
-            'totalSources': len(all_sources),
-            'enabledSources': len(available_sources),
-            'caching': cache_stats
-        }), 200
+        return Response(_sources_cache['body'], 200, mimetype='application/json')
 
     except Exception as e:
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
@@ -782,84 +1144,7 @@ def get_job_filters():
     Returns:
         JSON response with filter options (job types, industries, etc.)
     """
-    try:
-        # Return standardized filter options
-        filters = {
-            'jobTypes': [
-                'FULLTIME',
-                'PARTTIME',
-                'CONTRACT',
-                'CONTRACTOR',
-                'INTERN',
-                'TEMPORARY'
-            ],
-            'experienceLevels': [
-                'Internship',
-                'Entry Level',
-                'Mid Level',
-                'Senior',
-                'Lead',
-                'Executive'
-            ],
-            'industries': [
-                'Technology',
-                'Healthcare',
-                'Finance',
-                'Education',
-                'Marketing',
-                'Sales',
-                'Engineering',
-                'Design',
-                'Human Resources',
-                'Customer Service',
-                'Operations',
-                'Legal',
-                'Consulting',
-                'Real Estate',
-                'Retail',
-                'Manufacturing',
-                'Transportation',
-                'Hospitality',
-                'Media',
-                'Non-Profit',
-                'Government',
-                'Other'
-            ],
-            'companySizes': [
-                '1-10',
-                '11-50',
-                '51-200',
-                '201-500',
-                '501-1000',
-                '1001-5000',
-                '5001+'
-            ],
-            'datePosted': [
-                {'value': 'all', 'label': 'All time'},
-                {'value': 'today', 'label': 'Past 24 hours'},
-                {'value': '3days', 'label': 'Past 3 days'},
-                {'value': 'week', 'label': 'Past week'},
-                {'value': 'month', 'label': 'Past month'}
-            ],
-            'salaryRanges': [
-                {'min': 0, 'max': 30000, 'label': 'Under $30k'},
-                {'min': 30000, 'max': 50000, 'label': '$30k - $50k'},
-                {'min': 50000, 'max': 75000, 'label': '$50k - $75k'},
-                {'min': 75000, 'max': 100000, 'label': '$75k - $100k'},
-                {'min': 100000, 'max': 150000, 'label': '$100k - $150k'},
-                {'min': 150000, 'max': 200000, 'label': '$150k - $200k'},
-                {'min': 200000, 'max': None, 'label': '$200k+'}
-            ],
-            'remoteOptions': [
-                {'value': False, 'label': 'On-site'},
-                {'value': True, 'label': 'Remote only'}
-            ]
-        }
-
-        return jsonify(filters), 200
-
-    except Exception as e:
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+    return Response(_JOB_FILTER_OPTIONS_JSON, 200, mimetype='application/json')
 
 
 @jobs_bp.route('/statistics', methods=['GET'])
@@ -874,73 +1159,38 @@ def get_job_statistics():
     try:
         user_id = get_jwt_identity()
 
-        # Get total jobs count
-        total_jobs = Job.get_total_count({})
-
-        # Get active jobs count
-        active_jobs = Job.get_total_count({'isActive': True})
-
-        # Get user's swipe statistics
-        swipe_stats = Swipe.get_statistics(user_id)
-
-        # Get user's application statistics
-        applications = Application.get_user_applications(user_id)
-        app_stats = {
-            'total': len(applications),
-            'applied': len([a for a in applications if a.get('status') == 'applied']),
-            'interviewed': len([a for a in applications if a.get('status') == 'interviewed']),
-            'rejected': len([a for a in applications if a.get('status') == 'rejected']),
-            'hired': len([a for a in applications if a.get('status') == 'hired'])
-        }
-
-        # Get top industries from database
-        from config.database import get_jobs_collection
-        jobs_collection = get_jobs_collection()
-
-        pipeline = [
-            {'$match': {'isActive': True}},
-            {'$group': {
-                '_id': '$company.industry',
-                'count': {'$sum': 1}
-            }},
-            {'$sort': {'count': -1}},
-            {'$limit': 10}
-        ]
-
-        top_industries = list(jobs_collection.aggregate(pipeline))
-
-        # Get top locations
-        pipeline = [
-            {'$match': {'isActive': True}},
-            {'$group': {
-                '_id': {
-                    'city': '$location.city',
-                    'state': '$location.state'
-                },
-                'count': {'$sum': 1}
-            }},
-            {'$sort': {'count': -1}},
-            {'$limit': 10}
-        ]
-
-        top_locations = list(jobs_collection.aggregate(pipeline))
+        # Job counts and top industries/locations (same for every user, so
+        # cached once for all workers)
+        job_stats = shared_cached('jobstats:global', JOB_STATS_CACHE_TTL, Job.get_statistics)
+
+        # Get user's swipe and application statistics
+        user_stats = shared_cached(
+            f'jobstats:user:{user_id}',
+            USER_STATS_CACHE_TTL,
+            lambda: {
+                'swipes': Swipe.get_statistics(user_id),
+                'applications': Application.status_counts(user_id)
+            }
+        )
+        swipe_stats = user_stats['swipes']
+        app_stats = user_stats['applications']
 
         return jsonify({
             'jobStatistics': {
-                'totalJobs': total_jobs,
-                'activeJobs': active_jobs,
+                'totalJobs': job_stats['totalJobs'],
+                'activeJobs': job_stats['activeJobs'],
                 'topIndustries': [
                     {
                         'industry': item['_id'],
                         'count': item['count']
-                    } for item in top_industries if item['_id']
+                    } for item in job_stats['topIndustries'] if item['_id']
                 ],
                 'topLocations': [
                     {
                         'city': item['_id'].get('city'),
                         'state': item['_id'].get('state'),
                         'count': item['count']
-                    } for item in top_locations
+                    } for item in job_stats['topLocations']
                 ]
             },
             'swipeStatistics': swipe_stats,
@@ -951,6 +1201,66 @@ def get_job_statistics():
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
 
 
+def _save_new_jobs(jobs):
+    """
+    Insert fetched jobs not already stored, deduplicated by (externalId, source).
+
+    Existing jobs are found with one query per source and the rest are
+    written in a single unordered bulk insert. Duplicates that slip in from
+    concurrent fetches are rejected by the unique index and not counted.
+
+    Args:
+        jobs: Normalized job dicts from JobAggregationService
+
+    Returns:
+        int: Number of jobs inserted
+    """
+    from config.database import get_jobs_collection
+
+    jobs_collection = get_jobs_collection()
+
+    # Jobs without an external ID (e.g. Careerjet) can't be deduplicated
+    keyed_jobs = [
+        ((job['externalId'], job['source']), job)
+        for job in jobs
+        if job.get('externalId') and job.get('source')
+    ]
+    skipped = len(jobs) - len(keyed_jobs)
+    if skipped:
+        logger.info(f"Not saving {skipped} fetched jobs without externalId/source")
+
+    ids_by_source = defaultdict(set)
+    for (external_id, source), _ in keyed_jobs:
+        ids_by_source[source].add(external_id)
+
+    existing = set()
+    for source, external_ids in ids_by_source.items():
+        cursor = jobs_collection.find(
+            {'source': source, 'externalId': {'$in': list(external_ids)}},
+            {'externalId': 1, 'source': 1, '_id': 0}
+        )
+        existing.update((doc['externalId'], doc['source']) for doc in cursor)
+
+    now = datetime.now(timezone.utc)
+    ops = []
+    for key, job in keyed_jobs:
+        if key in existing:
+            continue
+        existing.add(key)
+
+        job['createdAt'] = now
+        job['updatedAt'] = now
+        ops.append(InsertOne(job))
+
+    if not ops:
+        return 0
+
+    try:
+        return jobs_collection.bulk_write(ops, ordered=False).inserted_count
+    except BulkWriteError as e:
+        return e.details.get('nInserted', 0)
+
+
 @jobs_bp.route('/fetch', methods=['POST'])
 @jwt_required()
 def fetch_jobs():
@@ -1009,54 +1319,14 @@ def fetch_jobs():
         # Save to database if requested
         saved_count = 0
         if save_to_db and jobs:
-            from config.database import get_jobs_collection
-            from datetime import datetime
-
-            jobs_collection = get_jobs_collection()
-
-            for job in jobs:
-                try:
-                    # Check if job already exists (by externalId and source)
-                    external_id = job.get('externalId')
-                    source = job.get('source')
-
-                    if external_id and source:
-                        existing = jobs_collection.find_one({
-                            'externalId': external_id,
-                            'source': source
-                        })
-
-                        if not existing:
-                            # Add timestamps
-                            job['createdAt'] = datetime.utcnow()
-                            job['updatedAt'] = datetime.utcnow()
-
-                            # Insert job
-                            jobs_collection.insert_one(job)
-                            saved_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error saving job to database: {str(e)}")
-                    continue
-
-        # Serialize jobs for response
-        jobs_data = []
-        for job in jobs:
-            job_copy = job.copy()
-            # Convert ObjectId to string if present
-            if '_id' in job_copy:
-                job_copy['_id'] = str(job_copy['_id'])
-            # Convert datetime to ISO string
-            if 'postedAt' in job_copy and hasattr(job_copy['postedAt'], 'isoformat'):
-                job_copy['postedAt'] = job_copy['postedAt'].isoformat()
-            if 'createdAt' in job_copy and hasattr(job_copy['createdAt'], 'isoformat'):
-                job_copy['createdAt'] = job_copy['createdAt'].isoformat()
-            if 'updatedAt' in job_copy and hasattr(job_copy['updatedAt'], 'isoformat'):
-                job_copy['updatedAt'] = job_copy['updatedAt'].isoformat()
-            jobs_data.append(job_copy)
-
-        return jsonify({
-            'jobs': jobs_data,
+            try:
+                saved_count = _save_new_jobs(jobs)
+            except Exception as e:
+                logger.error(f"Error saving jobs to database: {str(e)}")
+
+        # Encode in one pass; ObjectIds and datetimes go through json_default
+        body = json.dumps({
+            'jobs': jobs,
             'meta': {
                 'query': query,
                 'location': location,
@@ -1066,7 +1336,9 @@ def fetch_jobs():
                 'savedToDb': save_to_db,
                 'savedCount': saved_count
             }
-        }), 200
+        }, default=json_default)
+
+        return Response(body, 200, mimetype='application/json')
 
     except Exception as e:
         import traceback
@@ -1,20 +1,40 @@
 """OAuth authentication routes for LinkedIn."""
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import create_access_token, create_refresh_token
+import logging
 import os
 import secrets
-from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from datetime import datetime, timedelta, timezone
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from services.linkedin_auth import LinkedInAuthService
 from models.user import User
 from config.database import get_database
 from utils.helpers import format_success_response, format_error_response
 
+logger = logging.getLogger(__name__)
 oauth_bp = Blueprint('oauth', __name__, url_prefix='/api/oauth')
 
 # Initialize LinkedIn auth service
 linkedin_auth = LinkedInAuthService()
 
+LINKEDIN_AUTHORIZATION_URL = 'https://www.linkedin.com/oauth/v2/authorization'
+
+# Updated scopes for LinkedIn API v2 (openid profile email are the new standard scopes)
+# Note: r_liteprofile and r_emailaddress are deprecated
+LINKEDIN_SCOPE = 'openid profile email'
+
+# Lifetime (seconds) of the signed OAuth state token
+OAUTH_STATE_MAX_AGE = 600
+
+
+def _oauth_state_serializer():
+    """Get the serializer that signs LinkedIn OAuth state tokens."""
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt='linkedin-oauth')
+
 
 @oauth_bp.route('/linkedin/url', methods=['GET'])
 def get_linkedin_auth_url():
@@ -37,7 +57,7 @@ def get_linkedin_auth_url():
             )), 400
 
         # Log the redirect URI for debugging
-        print(f'DEBUG [OAuth]: Generating LinkedIn auth URL with redirect_uri: {redirect_uri}')
+        logger.debug('Generating LinkedIn auth URL with redirect_uri: %s', redirect_uri)
 
         # Get LinkedIn credentials from environment
         client_id = os.getenv('LINKEDIN_CLIENT_ID')
@@ -48,25 +68,23 @@ def get_linkedin_auth_url():
                 503
             )), 503
 
-        # Generate state for CSRF protection
-        state = secrets.token_urlsafe(32)
-        session['linkedin_oauth_state'] = state
-        session['linkedin_redirect_uri'] = redirect_uri
-
-        print(f'DEBUG [OAuth]: Generated state: {state}')
-
-        # Build authorization URL
-        # Updated scopes for LinkedIn API v2 (openid profile email are the new standard scopes)
-        # Note: r_liteprofile and r_emailaddress are deprecated
-        scope = 'openid profile email'
-        auth_url = (
-            f'https://www.linkedin.com/oauth/v2/authorization'
-            f'?response_type=code'
-            f'&client_id={client_id}'
-            f'&redirect_uri={redirect_uri}'
-            f'&state={state}'
-            f'&scope={scope}'
-        )
+        # Generate a signed state for CSRF protection; it carries the redirect
+        # URI so the callback can verify it on any instance without a session
+        state = _oauth_state_serializer().dumps({
+            'n': secrets.token_urlsafe(16),
+            'ru': redirect_uri
+        })
+
+        logger.debug('Generated LinkedIn OAuth state: %s', state)
+
+        # Build authorization URL (redirect_uri and state are percent-encoded)
+        auth_url = f"{LINKEDIN_AUTHORIZATION_URL}?" + urlencode({
+            'response_type': 'code',
+            'client_id': client_id,
+            'redirect_uri': redirect_uri,
+            'state': state,
+            'scope': LINKEDIN_SCOPE
+        })
 
         return jsonify(format_success_response(
             data={
@@ -116,8 +134,13 @@ def linkedin_callback():
             )), 400
 
         # Verify state if provided (CSRF protection)
-        if state and session.get('linkedin_oauth_state'):
-            if state != session.get('linkedin_oauth_state'):
+        if state:
+            try:
+                payload = _oauth_state_serializer().loads(state, max_age=OAUTH_STATE_MAX_AGE)
+            except BadSignature:
+                payload = None
+
+            if not payload or payload.get('ru') != redirect_uri:
                 return jsonify(format_error_response(
                     'Invalid state parameter',
                     400
@@ -163,64 +186,62 @@ def linkedin_callback():
         users_collection = db['users']
 
         email = user_profile['email']
-        existing_user = users_collection.find_one({'email': email})
-
-        if existing_user:
-            # User exists - login
-            user_id = str(existing_user['_id'])
-
-            # Update LinkedIn profile data if needed
-            update_data = {
-                'linkedinId': user_profile.get('id'),
-                'linkedinProfile': user_profile,
-                'lastLogin': datetime.utcnow()
-            }
-            users_collection.update_one(
-                {'_id': existing_user['_id']},
-                {'$set': update_data}
-            )
-
-        else:
-            # New user - register
-            new_user = {
-                'email': email,
-                'firstName': user_profile.get('firstName', ''),
-                'lastName': user_profile.get('lastName', ''),
-                'linkedinId': user_profile.get('id'),
-                'linkedinProfile': user_profile,
-                'isEmailVerified': True,  # LinkedIn email is verified
-                'createdAt': datetime.utcnow(),
-                'lastLogin': datetime.utcnow(),
-                'role': 'user',
-                'subscriptionTier': 'free',
-                'subscriptionStatus': 'active',
-                'onboardingCompleted': False,
-                'profile': {
-                    'skills': [],
-                    'experience': '',
-                    'location': {},
-                    'preferences': {
-                        'jobTypes': [],
-                        'industries': [],
-                        'minSalary': 0,
-                        'maxSalary': 0,
-                        'remote': True,
-                        'willingToRelocate': False
-                    }
+        now = datetime.now(timezone.utc)
+
+        # Refresh LinkedIn data on every login
+        update_data = {
+            'linkedinId': user_profile.get('id'),
+            'linkedinProfile': user_profile,
+            'lastLogin': now
+        }
+
+        # Registration defaults, only written when the user is new
+        new_user_defaults = {
+            'firstName': user_profile.get('firstName', ''),
+            'lastName': user_profile.get('lastName', ''),
+            'isEmailVerified': True,  # LinkedIn email is verified
+            'createdAt': now,
+            'role': 'user',
+            'subscriptionTier': 'free',
+            'subscriptionStatus': 'active',
+            'onboardingCompleted': False,
+            'profile': {
+                'skills': [],
+                'experience': '',
+                'location': {},
+                'preferences': {
+                    'jobTypes': [],
+                    'industries': [],
+                    'minSalary': 0,
+                    'maxSalary': 0,
+                    'remote': True,
+                    'willingToRelocate': False
                 }
             }
+        }
 
-            result = users_collection.insert_one(new_user)
-            user_id = str(result.inserted_id)
+        # Login or register in one roundtrip
+        upsert_args = (
+            {'email': email},
+            {'$set': update_data, '$setOnInsert': new_user_defaults}
+        )
+        upsert_kwargs = {
+            'projection': {'_id': 1, 'onboardingCompleted': 1},
+            'upsert': True,
+            'return_document': ReturnDocument.AFTER
+        }
+        try:
+            user = users_collection.find_one_and_update(*upsert_args, **upsert_kwargs)
+        except DuplicateKeyError:
+            # A concurrent callback registered this email first; now it's a login
+            user = users_collection.find_one_and_update(*upsert_args, **upsert_kwargs)
+
+        user_id = str(user['_id'])
 
         # Generate JWT tokens
         access_token_jwt = create_access_token(identity=user_id)
         refresh_token_jwt = create_refresh_token(identity=user_id)
 
-        # Clear session
-        session.pop('linkedin_oauth_state', None)
-        session.pop('linkedin_redirect_uri', None)
-
         return jsonify(format_success_response(
             data={
                 'accessToken': access_token_jwt,
@@ -230,7 +251,7 @@ def linkedin_callback():
                     'email': email,
                     'firstName': user_profile.get('firstName', ''),
                     'lastName': user_profile.get('lastName', ''),
-                    'onboardingCompleted': existing_user.get('onboardingCompleted', False) if existing_user else False
+                    'onboardingCompleted': user.get('onboardingCompleted', False)
                 }
             },
             message='LinkedIn authentication successful'
@@ -1,6 +1,10 @@
 """Onboarding routes for multi-step user registration."""
-from flask import Blueprint, request, jsonify
+import base64
+import hashlib
+import json
+from flask import Blueprint, Response, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from werkzeug.utils import secure_filename
 from bson import ObjectId
 
 from models.user_enhanced import EnhancedUser
@@ -10,9 +14,100 @@ from services.skill_recommendation import SkillRecommendationService
 from services.skill_taxonomy import SkillTaxonomyService
 from utils.validators import validate_required_fields
 from config.database import get_users_collection
+from config.settings import Config
 
 onboarding_bp = Blueprint('onboarding', __name__, url_prefix='/api/onboarding')
 
+# Chunk size for streaming uploaded resumes to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _save_upload(stream, path, max_size):
+    """
+    Copy an upload stream to a file in chunks, stopping past max_size.
+
+    Args:
+        stream: Readable upload stream
+        path: Destination file path
+        max_size: Maximum number of bytes to accept
+
+    Returns:
+        bool: False if the upload exceeded max_size (file left partial)
+    """
+    written = 0
+    with open(path, 'wb') as out:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                return True
+
+            written += len(chunk)
+            if written > max_size:
+                return False
+
+            out.write(chunk)
+
+
+# The skill taxonomy only changes on deploy, so clients may cache it
+TAXONOMY_CACHE_CONTROL = 'public, max-age=3600'
+
+
+def _build_industries_body():
+    """Serialize the /skills/industries response."""
+    industries = SkillTaxonomyService.get_all_industries()
+    return json.dumps({
+        'success': True,
+        'industries': [
+            {'key': key, 'name': name}
+            for key, name in industries.items()
+        ],
+        'count': len(industries)
+    }).encode('utf-8')
+
+
+def _build_categories_body(industry_key, categories):
+    """Serialize the /skills/categories/<industry_key> response."""
+    formatted_categories = [
+        {
+            'key': cat_key,
+            'name': cat_data['display_name'],
+            'skills': cat_data['skills'],
+            'skillCount': len(cat_data['skills'])
+        }
+        for cat_key, cat_data in categories.items()
+    ]
+
+    return json.dumps({
+        'success': True,
+        'industry': industry_key,
+        'categories': formatted_categories,
+        'totalCategories': len(formatted_categories)
+    }).encode('utf-8')
+
+
+def _with_etag(body):
+    """Pair a response body with its strong ETag."""
+    return body, hashlib.sha256(body).hexdigest()
+
+
+# Taxonomy response bodies and ETags, serialized once at import
+_INDUSTRIES_RESPONSE = _with_etag(_build_industries_body())
+_CATEGORIES_RESPONSES = {
+    industry_key: _with_etag(_build_categories_body(
+        industry_key,
+        SkillTaxonomyService.get_skills_by_industry(industry_key)
+    ))
+    for industry_key in SkillTaxonomyService.get_all_industries()
+}
+
+
+def _taxonomy_response(body, etag):
+    """Serve a precomputed taxonomy body, or 304 if the client's copy is current."""
+    response = Response(body, 200, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = TAXONOMY_CACHE_CONTROL
+    return response.make_conditional(request)
+
 
 @onboarding_bp.route('/start', methods=['POST'])
 @jwt_required()
@@ -144,7 +239,10 @@ def get_onboarding_status():
         JSON with current step and completion status
     """
     user_id = get_jwt_identity()
-    user = User.find_by_id(user_id)
+    user = User.find_by_id(
+        user_id,
+        projection={'onboardingCompleted': 1, 'onboardingStep': 1}
+    )
 
     if not user:
         return jsonify({'error': 'User not found'}), 404
@@ -164,11 +262,19 @@ def parse_resume():
     Supports PDF and DOCX formats.
     Uses AI-powered parsing with fallback to rule-based parsing.
 
+    Parsing runs on a Celery worker when available: the response is 202
+    with a taskId and a statusUrl to poll for the parsed data.
+
     Returns:
-        JSON with parsed resume data
+        JSON with task status, or parsed resume data when parsed inline
     """
     user_id = get_jwt_identity()
 
+    # Reject oversized uploads before the multipart body is read
+    if request.content_length and request.content_length > Config.MAX_RESUME_SIZE:
+        max_mb = Config.MAX_RESUME_SIZE / (1024 * 1024)
+        return jsonify({'error': f'Resume too large. Maximum size: {max_mb}MB'}), 413
+
     # Check if file is present
     if 'resume' not in request.files:
         return jsonify({'error': 'No resume file provided'}), 400
@@ -191,48 +297,61 @@ def parse_resume():
         import tempfile
 
         temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f'{user_id}_{file.filename}')
-        file.save(temp_path)
+        temp_path = os.path.join(temp_dir, f'{user_id}_{secure_filename(file.filename)}')
 
-        # Parse resume
-        parser = ResumeParser()
-        parsed_data = parser.parse_resume(temp_path)
+        # Stream to disk in fixed-size chunks, enforcing the size limit for
+        # uploads that didn't declare a Content-Length
+        if not _save_upload(file.stream, temp_path, Config.MAX_RESUME_SIZE):
+            os.remove(temp_path)
+            max_mb = Config.MAX_RESUME_SIZE / (1024 * 1024)
+            return jsonify({'error': f'Resume too large. Maximum size: {max_mb}MB'}), 413
+
+        merge_with_profile = request.form.get('mergeWithProfile', 'false').lower() == 'true'
 
-        # Queue resume for training corpus (background task)
+        # Queue parsing on a Celery worker; the client polls statusUrl
         try:
-            from celery_app import process_user_resume_for_training
-            process_user_resume_for_training.delay(user_id, temp_path)
+            from celery_app import parse_resume_task, parse_resume_task_id
         except ImportError:
-            # Celery not available, skip training corpus addition
-            pass
-
-        # Clean up temp file (will be copied by background task if Celery is available)
-        # For now, we keep it temporarily for the background task
-        # The background task will handle cleanup
-
-        # Optionally merge with user profile
-        merge_with_profile = request.form.get('mergeWithProfile', 'false').lower() == 'true'
+            parse_resume_task = None
+
+        if parse_resume_task:
+            # Workers may run on another host, so the file goes in the
+            # message rather than as a path to this process's temp dir
+            with open(temp_path, 'rb') as f:
+                resume_b64 = base64.b64encode(f.read()).decode('ascii')
+            os.remove(temp_path)
+
+            # The worker picks the parser by extension, which secure_filename
+            # can drop from a non-ASCII name
+            filename = secure_filename(file.filename)
+            if not filename.lower().endswith(f'.{file_ext}'):
+                filename = f'resume.{file_ext}'
+
+            task_id = parse_resume_task_id(user_id)
+            try:
+                parse_resume_task.apply_async(
+                    args=[user_id, resume_b64, filename, merge_with_profile],
+                    task_id=task_id
+                )
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': f'Resume parsing is temporarily unavailable: {str(e)}'
+                }), 503
+
+            return jsonify({
+                'success': True,
+                'status': 'pending',
+                'taskId': task_id,
+                'statusUrl': f'/api/onboarding/parse-resume/{task_id}'
+            }), 202
+
+        # Celery not available, parse inline
+        parser = ResumeParser()
+        parsed_data = parser.parse_resume(temp_path)
 
         if merge_with_profile:
-            # Update user profile with parsed data
-            users = get_users_collection()
-            users.update_one(
-                {'_id': ObjectId(user_id)},
-                {
-                    '$set': {
-                        'profile.phone': parsed_data.get('contactInfo', {}).get('phone'),
-                        'profile.location': parsed_data.get('contactInfo', {}).get('location', {}),
-                        'workExperience': parsed_data.get('workExperience', []),
-                        'education': parsed_data.get('education', []),
-                        'skills': [
-                            {'name': skill, 'source': 'parsed', 'proficiency': 'intermediate'}
-                            for skill in parsed_data.get('skills', [])
-                        ],
-                        'professional.summary': parsed_data.get('summary', ''),
-                        'resumes.parsed': parsed_data
-                    }
-                }
-            )
+            EnhancedUser.merge_parsed_resume(user_id, parsed_data)
 
         return jsonify({
             'success': True,
@@ -247,6 +366,60 @@ def parse_resume():
         }), 500
 
 
+@onboarding_bp.route('/parse-resume/<task_id>', methods=['GET'])
+@jwt_required()
+def get_parse_resume_status(task_id):
+    """
+    Get the result of a queued resume parse.
+
+    Args:
+        task_id: Task ID returned by /parse-resume
+
+    Returns:
+        JSON with status (pending, completed, failed) and parsed data when done
+    """
+    user_id = get_jwt_identity()
+
+    # Task IDs embed the owner, so users can only read their own results
+    if not task_id.startswith(f'parse-resume-{user_id}-'):
+        return jsonify({'error': 'Task not found'}), 404
+
+    try:
+        from celery_app import celery_app
+
+        result = celery_app.AsyncResult(task_id)
+
+        if not result.ready():
+            return jsonify({
+                'success': True,
+                'status': 'pending',
+                'taskId': task_id
+            }), 200
+
+        payload = result.result
+        if result.successful() and isinstance(payload, dict) and payload.get('success'):
+            return jsonify({
+                'success': True,
+                'status': 'completed',
+                'taskId': task_id,
+                'parsedData': payload.get('parsedData'),
+                'merged': payload.get('merged', False)
+            }), 200
+
+        return jsonify({
+            'success': False,
+            'status': 'failed',
+            'taskId': task_id,
+            'error': payload.get('error') if isinstance(payload, dict) else str(result.result)
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Failed to get parse status: {str(e)}'
+        }), 500
+
+
 @onboarding_bp.route('/skills/recommend', methods=['POST'])
 @jwt_required()
 def recommend_skills():
@@ -267,7 +440,10 @@ def recommend_skills():
     data = request.get_json() or {}
 
     # Get user's current profile
-    user = User.find_by_id(user_id)
+    user = User.find_by_id(
+        user_id,
+        projection={'jobPreferences': 1, 'professional': 1, 'skills': 1}
+    )
     if not user:
         return jsonify({'error': 'User not found'}), 404
 
@@ -316,8 +492,7 @@ def search_skills():
     industry_filter = request.args.get('industry')
 
     try:
-        taxonomy = SkillTaxonomyService()
-        results = taxonomy.search_skills(query, industry_key=industry_filter)
+        results = SkillTaxonomyService.search_skills(query, industry_key=industry_filter)
 
         return jsonify({
             'success': True,
@@ -342,24 +517,7 @@ def get_all_industries():
     Returns:
         JSON with all industries
     """
-    try:
-        taxonomy = SkillTaxonomyService()
-        industries = taxonomy.get_all_industries()
-
-        return jsonify({
-            'success': True,
-            'industries': [
-                {'key': key, 'name': name}
-                for key, name in industries.items()
-            ],
-            'count': len(industries)
-        }), 200
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Failed to fetch industries: {str(e)}'
-        }), 500
+    return _taxonomy_response(*_INDUSTRIES_RESPONSE)
 
 
 @onboarding_bp.route('/skills/categories/<industry_key>', methods=['GET'])
@@ -374,35 +532,12 @@ def get_skill_categories(industry_key):
     Returns:
         JSON with categories and skills
     """
-    try:
-        taxonomy = SkillTaxonomyService()
-        categories = taxonomy.get_skills_by_industry(industry_key)
-
-        if not categories:
-            return jsonify({'error': 'Industry not found'}), 404
-
-        # Format response
-        formatted_categories = []
-        for cat_key, cat_data in categories.items():
-            formatted_categories.append({
-                'key': cat_key,
-                'name': cat_data['display_name'],
-                'skills': cat_data['skills'],
-                'skillCount': len(cat_data['skills'])
-            })
+    cached_response = _CATEGORIES_RESPONSES.get(industry_key)
 
-        return jsonify({
-            'success': True,
-            'industry': industry_key,
-            'categories': formatted_categories,
-            'totalCategories': len(formatted_categories)
-        }), 200
+    if not cached_response:
+        return jsonify({'error': 'Industry not found'}), 404
 
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Failed to fetch categories: {str(e)}'
-        }), 500
+    return _taxonomy_response(*cached_response)
 
 
 @onboarding_bp.route('/linkedin/merge', methods=['POST'])
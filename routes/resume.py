@@ -1,15 +1,30 @@
 """Resume management routes for filter modal and application."""
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from bson import ObjectId
+import json
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from flask_jwt_extended import jwt_required
+from pymongo import ReturnDocument
 from datetime import datetime
 
 from models.user import User
 from config.database import get_users_collection
+from config.settings import Config
 from utils.helpers import format_error_response, serialize_document
 
 resume_bp = Blueprint('resume', __name__, url_prefix='/api/resume')
 
+# Customized versions returned per page by /options
+DEFAULT_VERSIONS_PAGE_SIZE = 10
+MAX_VERSIONS_PAGE_SIZE = 50
+
+# Option IDs for customized versions are VERSION_ID_PREFIX + list index
+VERSION_ID_PREFIX = 'version_'
+_VERSION_IDS = tuple(f'{VERSION_ID_PREFIX}{idx}' for idx in range(1024))
+
+
+def _version_id(idx):
+    """Option ID for the customized version at the given index."""
+    return _VERSION_IDS[idx] if idx < len(_VERSION_IDS) else f'{VERSION_ID_PREFIX}{idx}'
+
 
 @resume_bp.route('/options', methods=['GET'])
 @jwt_required()
@@ -23,82 +38,132 @@ def get_resume_options():
     3. Previously customized versions (from past applications)
     4. Ability to create new custom version
 
+    Query params:
+        - limit: Customized versions per page (default: 10, max: 50)
+        - offset: Customized versions to skip (default: 0)
+
     Returns:
         JSON response with resume options
     """
-    try:
-        user_id = get_jwt_identity()
-        user = User.find_by_id(user_id)
-
-        if not user:
-            return jsonify(format_error_response("User not found", 404))
-
-        resume_options = []
-
-        # Get resumes data
-        resumes = user.get('resumes', {})
-        profile = user.get('profile', {})
-
-        # Option 1: Original uploaded resume
-        if resumes.get('original') or profile.get('resume'):
-            original_path = resumes.get('original') or profile.get('resume')
-            resume_options.append({
-                'id': 'original',
-                'type': 'original',
-                'name': 'Original Resume',
-                'description': 'Your originally uploaded resume',
-                'filePath': original_path,
-                'uploadedAt': user.get('createdAt'),
-                'recommended': False
-            })
-
-        # Option 2: AI-parsed resume (structured data)
-        if resumes.get('parsed'):
-            parsed_data = resumes['parsed']
-            resume_options.append({
-                'id': 'parsed',
-                'type': 'parsed',
-                'name': 'AI-Optimized Resume',
-                'description': 'AI-parsed and structured resume with enhanced formatting',
-                'data': parsed_data,
-                'parsedAt': parsed_data.get('parsedAt'),
-                'recommended': True  # Recommended for auto-apply
-            })
-
-        # Option 3: Previously customized versions
-        versions = resumes.get('versions', [])
-        for idx, version in enumerate(versions):
-            resume_options.append({
-                'id': f'version_{idx}',
-                'type': 'customized',
-                'name': version.get('name', f'Custom Resume {idx + 1}'),
-                'description': version.get('description', 'Previously customized for specific job type'),
-                'data': version.get('content'),
-                'createdAt': version.get('createdAt'),
-                'jobType': version.get('jobType'),  # e.g., "Software Engineer"
-                'industry': version.get('industry'),  # e.g., "Technology"
-                'recommended': False
-            })
-
-        # Option 4: Current default/selected resume
-        default_version = resumes.get('defaultVersion')
-
-        # Add metadata
-        response = {
-            'resumeOptions': resume_options,
-            'totalOptions': len(resume_options),
-            'currentDefault': default_version or 'parsed',  # Default to AI-parsed
-            'hasResume': len(resume_options) > 0,
+    user_id = User.current_id()
+    if user_id is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+
+    limit = request.args.get('limit', DEFAULT_VERSIONS_PAGE_SIZE, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    limit = max(1, min(limit, MAX_VERSIONS_PAGE_SIZE))
+    offset = max(0, offset)
+
+    # Only one page of versions is sent back; the total comes from $size
+    users = get_users_collection()
+    result = list(users.aggregate([
+        {'$match': {'_id': user_id}},
+        {'$project': {
+            'createdAt': 1,
+            'profile.resume': 1,
+            'resumes.original': 1,
+            'resumes.parsed': 1,
+            'resumes.defaultVersionId': 1,
+            'versionsPage': {
+                '$slice': [{'$ifNull': ['$resumes.versions', []]}, offset, limit]
+            },
+            'totalVersions': {'$size': {'$ifNull': ['$resumes.versions', []]}}
+        }}
+    ]))
+
+    if not result:
+        body, status = format_error_response("User not found", 404)
+        return jsonify(body), status
+
+    user = result[0]
+    resumes = user.get('resumes', {})
+    versions = user.get('versionsPage', [])
+    total_versions = user['totalVersions']
+
+    def generate():
+        # Serialize one option at a time instead of building the whole
+        # response; the fields that depend on the count go last
+        dumps = current_app.json.dumps
+        yield '{"resumeOptions":['
+
+        option_count = 0
+        for option in _iter_resume_options(user, versions, offset):
+            if option_count:
+                yield ','
+            yield dumps(option)
+            option_count += 1
+
+        metadata = {
+            'totalOptions': option_count,
+            'currentDefault': resumes.get('defaultVersionId') or 'parsed',  # Default to AI-parsed
+            'hasResume': option_count > 0 or total_versions > 0,
+            'totalVersions': total_versions,
+            'hasMoreVersions': offset + len(versions) < total_versions,
             'recommendation': {
                 'message': 'We recommend using the AI-Optimized Resume for best results',
                 'preferredOption': 'parsed'
             }
         }
+        yield '],' + dumps(metadata)[1:]
+
+    return Response(stream_with_context(generate()), 200, mimetype='application/json')
+
+
+def _iter_resume_options(user, versions, offset):
+    """
+    Yield the resume options for /options, one at a time.
+
+    Args:
+        user: User document with resumes, profile.resume and createdAt
+        versions: Page of customized versions
+        offset: Index of the first version in the page
+
+    Yields:
+        dict: Resume option
+    """
+    resumes = user.get('resumes', {})
+    profile = user.get('profile', {})
+
+    # Option 1: Original uploaded resume
+    if resumes.get('original') or profile.get('resume'):
+        original_path = resumes.get('original') or profile.get('resume')
+        yield {
+            'id': 'original',
+            'type': 'original',
+            'name': 'Original Resume',
+            'description': 'Your originally uploaded resume',
+            'filePath': original_path,
+            'uploadedAt': user.get('createdAt'),
+            'recommended': False
+        }
 
-        return jsonify(response), 200
+    # Option 2: AI-parsed resume (structured data)
+    if resumes.get('parsed'):
+        parsed_data = resumes['parsed']
+        yield {
+            'id': 'parsed',
+            'type': 'parsed',
+            'name': 'AI-Optimized Resume',
+            'description': 'AI-parsed and structured resume with enhanced formatting',
+            'data': parsed_data,
+            'parsedAt': parsed_data.get('parsedAt'),
+            'recommended': True  # Recommended for auto-apply
+        }
 
-    except Exception as e:
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+    # Option 3: Previously customized versions
+    for idx, version in enumerate(versions, start=offset):
+        yield {
+            'id': _version_id(idx),
+            'type': 'customized',
+            'name': version.get('name', f'Custom Resume {idx + 1}'),
+            'description': version.get('description', 'Previously customized for specific job type'),
+            'data': version.get('content'),
+            'createdAt': version.get('createdAt'),
+            'jobType': version.get('jobType'),  # e.g., "Software Engineer"
+            'industry': version.get('industry'),  # e.g., "Technology"
+            'recommended': False
+        }
 
 
 @resume_bp.route('/select', methods=['POST'])
@@ -116,66 +181,57 @@ def select_default_resume():
     Returns:
         JSON response confirming selection
     """
-    try:
-        user_id = get_jwt_identity()
-        data = request.get_json()
-
-        if not data or 'resumeId' not in data:
-            return jsonify(format_error_response("Resume ID not specified", 400))
-
-        resume_id = data['resumeId']
-        resume_type = data.get('resumeType', 'parsed')
-
-        users = get_users_collection()
-        user = User.find_by_id(user_id)
-
-        if not user:
-            return jsonify(format_error_response("User not found", 404))
-
-        # Get the actual resume data based on ID
-        resumes = user.get('resumes', {})
-        selected_resume = None
-
-        if resume_id == 'original':
-            selected_resume = resumes.get('original') or user.get('profile', {}).get('resume')
-        elif resume_id == 'parsed':
-            selected_resume = resumes.get('parsed')
-        elif resume_id.startswith('version_'):
-            # Get specific version
-            version_idx = int(resume_id.split('_')[1])
-            versions = resumes.get('versions', [])
-            if version_idx < len(versions):
-                selected_resume = versions[version_idx]
-
-        if not selected_resume:
-            return jsonify(format_error_response("Resume not found", 404))
-
-        # Update default resume selection
-        result = users.update_one(
-            {'_id': ObjectId(user_id)},
-            {
-                '$set': {
-                    'resumes.defaultVersion': selected_resume,
-                    'resumes.defaultVersionId': resume_id,
-                    'resumes.defaultVersionType': resume_type,
-                    'updatedAt': datetime.utcnow()
-                }
-            }
-        )
-
-        if result.modified_count == 0:
-            return jsonify(format_error_response("Failed to update resume selection", 500))
+    user_id = User.current_id()
+    if user_id is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+    data = request.get_json()
+
+    if not data or 'resumeId' not in data:
+        body, status = format_error_response("Resume ID not specified", 400)
+        return jsonify(body), status
+
+    resume_id = data['resumeId']
+    resume_type = data.get('resumeType', 'parsed')
+
+    users = get_users_collection()
+    user = User.current()
+
+    if not user:
+        body, status = format_error_response("User not found", 404)
+        return jsonify(body), status
+
+    # Make sure the selected resume exists
+    selected_resume = User.resolve_resume(user, resume_id)
+
+    if not selected_resume:
+        body, status = format_error_response("Resume not found", 404)
+        return jsonify(body), status
+
+    # Store only a reference; the resume is resolved when it's used
+    result = users.update_one(
+        {'_id': user_id},
+        {
+            '$set': {
+                'resumes.defaultVersionId': resume_id,
+                'resumes.defaultVersionType': resume_type,
+                'updatedAt': datetime.utcnow()
+            },
+            '$unset': {'resumes.defaultVersion': ''}
+        }
+    )
 
-        return jsonify({
-            'message': 'Default resume updated successfully',
-            'selectedResume': {
-                'id': resume_id,
-                'type': resume_type
-            }
-        }), 200
+    if result.modified_count == 0:
+        body, status = format_error_response("Failed to update resume selection", 500)
+        return jsonify(body), status
 
-    except Exception as e:
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+    return jsonify({
+        'message': 'Default resume updated successfully',
+        'selectedResume': {
+            'id': resume_id,
+            'type': resume_type
+        }
+    }), 200
 
 
 @resume_bp.route('/create-version', methods=['POST'])
@@ -199,60 +255,75 @@ def create_custom_version():
     Returns:
         JSON response with created version
     """
-    try:
-        user_id = get_jwt_identity()
-        data = request.get_json()
-
-        if not data:
-            return jsonify(format_error_response("No data provided", 400))
-
-        # Validate required fields
-        if 'name' not in data or 'content' not in data:
-            return jsonify(format_error_response("Name and content are required", 400))
-
-        users = get_users_collection()
-        user = User.find_by_id(user_id)
-
-        if not user:
-            return jsonify(format_error_response("User not found", 404))
+    user_id = User.current_id()
+    if user_id is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+    data = request.get_json()
+
+    if not data:
+        body, status = format_error_response("No data provided", 400)
+        return jsonify(body), status
+
+    # Validate required fields
+    if 'name' not in data or 'content' not in data:
+        body, status = format_error_response("Name and content are required", 400)
+        return jsonify(body), status
+
+    # Versions live inside the user document, so keep each one bounded
+    if len(json.dumps(data['content'])) > Config.MAX_RESUME_VERSION_SIZE:
+        body, status = format_error_response("Resume content is too large", 413)
+        return jsonify(body), status
+
+    users = get_users_collection()
+
+    # Create new version
+    new_version = {
+        'name': data['name'],
+        'description': data.get('description', ''),
+        'jobType': data.get('jobType'),
+        'industry': data.get('industry'),
+        'content': data['content'],
+        'createdAt': datetime.utcnow()
+    }
 
-        # Create new version
-        new_version = {
+    # Add to versions array unless it's full, getting back only the new
+    # version count
+    updated_user = users.find_one_and_update(
+        {
+            '_id': user_id,
+            f'resumes.versions.{Config.MAX_RESUME_VERSIONS - 1}': {'$exists': False}
+        },
+        {
+            '$push': {'resumes.versions': new_version},
+            '$set': {'updatedAt': datetime.utcnow()}
+        },
+        projection={'versionCount': {'$size': '$resumes.versions'}},
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not updated_user:
+        if users.count_documents({'_id': user_id}, limit=1):
+            body, status = format_error_response(
+                f"You can keep at most {Config.MAX_RESUME_VERSIONS} resume versions. "
+                "Delete one to create another.",
+                400
+            )
+            return jsonify(body), status
+        body, status = format_error_response("User not found", 404)
+        return jsonify(body), status
+
+    # Get the index of the new version
+    version_idx = updated_user['versionCount'] - 1
+
+    return jsonify({
+        'message': 'Resume version created successfully',
+        'version': {
+            'id': _version_id(version_idx),
             'name': data['name'],
-            'description': data.get('description', ''),
-            'jobType': data.get('jobType'),
-            'industry': data.get('industry'),
-            'content': data['content'],
-            'createdAt': datetime.utcnow()
+            'type': 'customized'
         }
-
-        # Add to versions array
-        result = users.update_one(
-            {'_id': ObjectId(user_id)},
-            {
-                '$push': {'resumes.versions': new_version},
-                '$set': {'updatedAt': datetime.utcnow()}
-            }
-        )
-
-        if result.modified_count == 0:
-            return jsonify(format_error_response("Failed to create resume version", 500))
-
-        # Get the index of the new version
-        updated_user = User.find_by_id(user_id)
-        version_idx = len(updated_user.get('resumes', {}).get('versions', [])) - 1
-
-        return jsonify({
-            'message': 'Resume version created successfully',
-            'version': {
-                'id': f'version_{version_idx}',
-                'name': data['name'],
-                'type': 'customized'
-            }
-        }), 201
-
-    except Exception as e:
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+    }), 201
 
 
 @resume_bp.route('/versions', methods=['GET'])
@@ -264,35 +335,45 @@ def get_all_versions():
     Returns:
         JSON response with all resume versions
     """
-    try:
-        user_id = get_jwt_identity()
-        user = User.find_by_id(user_id)
-
-        if not user:
-            return jsonify(format_error_response("User not found", 404))
-
-        resumes = user.get('resumes', {})
-        versions = resumes.get('versions', [])
-
-        # Format versions for response
-        formatted_versions = []
-        for idx, version in enumerate(versions):
-            formatted_versions.append({
-                'id': f'version_{idx}',
-                'name': version.get('name'),
-                'description': version.get('description'),
-                'jobType': version.get('jobType'),
-                'industry': version.get('industry'),
-                'createdAt': version.get('createdAt')
-            })
-
-        return jsonify({
-            'versions': formatted_versions,
-            'totalVersions': len(formatted_versions)
-        }), 200
-
-    except Exception as e:
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+    user_id = User.current_id()
+    if user_id is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+    users = get_users_collection()
+
+    # Reshape versions server-side so their (large) content never leaves the database
+    result = list(users.aggregate([
+        {'$match': {'_id': user_id}},
+        {'$project': {
+            '_id': 0,
+            'versions': {'$map': {
+                'input': {'$range': [0, {'$size': {'$ifNull': ['$resumes.versions', []]}}]},
+                'as': 'i',
+                'in': {'$let': {
+                    'vars': {'v': {'$arrayElemAt': ['$resumes.versions', '$$i']}},
+                    'in': {
+                        'id': {'$concat': [VERSION_ID_PREFIX, {'$toString': '$$i'}]},
+                        'name': {'$ifNull': ['$$v.name', None]},
+                        'description': {'$ifNull': ['$$v.description', None]},
+                        'jobType': {'$ifNull': ['$$v.jobType', None]},
+                        'industry': {'$ifNull': ['$$v.industry', None]},
+                        'createdAt': {'$ifNull': ['$$v.createdAt', None]}
+                    }
+                }}
+            }}
+        }}
+    ]))
+
+    if not result:
+        body, status = format_error_response("User not found", 404)
+        return jsonify(body), status
+
+    formatted_versions = result[0]['versions']
+
+    return jsonify({
+        'versions': formatted_versions,
+        'totalVersions': len(formatted_versions)
+    }), 200
 
 
 @resume_bp.route('/version/<version_id>', methods=['DELETE'])
@@ -307,44 +388,65 @@ def delete_version(version_id):
     Returns:
         JSON response confirming deletion
     """
-    try:
-        user_id = get_jwt_identity()
-
-        if not version_id.startswith('version_'):
-            return jsonify(format_error_response("Invalid version ID", 400))
-
-        version_idx = int(version_id.split('_')[1])
-
-        users = get_users_collection()
-        user = User.find_by_id(user_id)
-
-        if not user:
-            return jsonify(format_error_response("User not found", 404))
-
-        versions = user.get('resumes', {}).get('versions', [])
-
-        if version_idx >= len(versions):
-            return jsonify(format_error_response("Version not found", 404))
-
-        # Remove the version
-        versions.pop(version_idx)
-
-        result = users.update_one(
-            {'_id': ObjectId(user_id)},
-            {
-                '$set': {
-                    'resumes.versions': versions,
-                    'updatedAt': datetime.utcnow()
-                }
+    user_id = User.current_id()
+    if user_id is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+
+    version_idx = version_id[len(VERSION_ID_PREFIX):]
+    if not version_id.startswith(VERSION_ID_PREFIX) or not version_idx.isdigit():
+        body, status = format_error_response("Invalid version ID", 400)
+        return jsonify(body), status
+
+    version_idx = int(version_idx)
+
+    users = get_users_collection()
+
+    # Splice the version out server-side in one atomic update
+    versions_field = '$resumes.versions'
+    remaining = []
+    if version_idx > 0:
+        remaining.append({'$slice': [versions_field, version_idx]})
+    remaining.append({'$slice': [versions_field, version_idx + 1, {'$size': versions_field}]})
+
+    # The default selection is stored by index: drop it if it was this
+    # version, and shift it down if it was a later one
+    default_idx = {'$convert': {
+        'input': {'$substrCP': ['$resumes.defaultVersionId', len(VERSION_ID_PREFIX), 10]},
+        'to': 'int',
+        'onError': None,
+        'onNull': None
+    }}
+    default_id = {'$let': {
+        'vars': {'idx': default_idx},
+        'in': {'$switch': {
+            'branches': [
+                {'case': {'$eq': ['$$idx', version_idx]}, 'then': None},
+                {'case': {'$gt': ['$$idx', version_idx]},
+                 'then': {'$concat': [VERSION_ID_PREFIX, {'$toString': {'$subtract': ['$$idx', 1]}}]}}
+            ],
+            'default': '$resumes.defaultVersionId'
+        }}
+    }}
+
+    result = users.update_one(
+        {
+            '_id': user_id,
+            f'resumes.versions.{version_idx}': {'$exists': True}
+        },
+        [{
+            '$set': {
+                'resumes.versions': {'$concatArrays': remaining},
+                'resumes.defaultVersionId': default_id,
+                'updatedAt': '$$NOW'
             }
-        )
-
-        if result.modified_count == 0:
-            return jsonify(format_error_response("Failed to delete version", 500))
+        }]
+    )
 
-        return jsonify({
-            'message': 'Resume version deleted successfully'
-        }), 200
+    if result.matched_count == 0:
+        body, status = format_error_response("Version not found", 404)
+        return jsonify(body), status
 
-    except Exception as e:
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+    return jsonify({
+        'message': 'Resume version deleted successfully'
+    }), 200
@@ -1,6 +1,8 @@
 """Subscription and swipe tracking routes."""
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+import hashlib
+import json
+from flask import Blueprint, Response, request, jsonify
+from flask_jwt_extended import jwt_required
 from models.user import User
 from utils.helpers import format_success_response, format_error_response
 import logging
@@ -9,6 +11,55 @@ logger = logging.getLogger(__name__)
 
 subscription_bp = Blueprint('subscription', __name__)
 
+# Pricing only changes on deploy, so clients and CDNs may cache it
+PRICING_CACHE_CONTROL = 'public, max-age=3600'
+
+PRICING = {
+    'plans': [
+        {
+            'id': 'free',
+            'name': 'Free',
+            'price': 0,
+            'currency': 'USD',
+            'interval': 'month',
+            'features': [
+                '50 job swipes per day',
+                'Manual job applications',
+                'Basic job matching',
+                'Course recommendations'
+            ]
+        },
+        {
+            'id': 'paid',
+            'name': 'Premium',
+            'price': 8.99,
+            'currency': 'USD',
+            'interval': 'month',
+            'features': [
+                'Unlimited job swipes',
+                'Auto-apply to matched jobs',
+                'Advanced job matching',
+                'Priority support',
+                'Resume optimization',
+                'Course recommendations'
+            ]
+        }
+    ]
+}
+
+# /pricing response body and ETag, serialized once at import
+_PRICING_BODY = json.dumps(format_success_response(
+    data=PRICING,
+    message='Pricing retrieved successfully'
+)).encode('utf-8')
+_PRICING_ETAG = hashlib.sha256(_PRICING_BODY).hexdigest()
+
+# /track-swipe limit-reached body, serialized once at import
+_SWIPE_LIMIT_BODY = json.dumps(format_error_response(
+    'Swipe limit reached. Upgrade to premium for unlimited swipes.',
+    403
+)).encode('utf-8')
+
 
 @subscription_bp.route('/track-swipe', methods=['POST'])
 @jwt_required()
@@ -23,24 +74,20 @@ def track_swipe():
         JSON response with swipe status
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
+        if user_id is None:
+            return jsonify(format_error_response('Invalid user ID', 400)), 400
 
-        # Increment swipe count
-        success, swipes_remaining = User.increment_swipes(user_id)
+        subscription = User.use_swipe(user_id)
+        if subscription is None:
+            return Response(_SWIPE_LIMIT_BODY, 403, mimetype='application/json')
 
-        if not success:
-            return jsonify(format_error_response(
-                'Swipe limit reached. Upgrade to premium for unlimited swipes.',
-                403
-            )), 403
-
-        # Get updated swipe status
-        swipe_status = User.get_swipe_status(user_id)
-
-        return jsonify(format_success_response(
-            data=swipe_status,
-            message='Swipe tracked successfully'
-        )), 200
+        # Built inline rather than via format_success_response: this is the
+        # most frequently called endpoint
+        return jsonify({
+            'message': 'Swipe tracked successfully',
+            'data': User.build_swipe_status(subscription)
+        }), 200
 
     except Exception as e:
         logger.error(f"Error tracking swipe: {str(e)}")
@@ -60,15 +107,19 @@ def get_subscription_status():
         JSON response with subscription details
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
+        if user_id is None:
+            return jsonify(format_error_response('Invalid user ID', 400)), 400
 
-        # Get user data
-        user = User.find_by_id(user_id)
-        if not user:
+        # Only the subscription subdocument is needed
+        user = User.find_by_id(user_id, projection={'subscription': 1, '_id': 0})
+        if user is None:
             return jsonify(format_error_response('User not found', 404)), 404
 
         subscription = user.get('subscription', {})
-        swipe_status = User.get_swipe_status(user_id)
+        swipe_status = User.build_swipe_status(
+            User.with_live_swipe_count(user_id, subscription)
+        )
 
         # Combine subscription and swipe info
         status = {
@@ -109,7 +160,9 @@ def upgrade_subscription():
         JSON response with upgrade status
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
+        if user_id is None:
+            return jsonify(format_error_response('Invalid user ID', 400)), 400
         data = request.get_json()
 
         plan = data.get('plan', 'paid')
@@ -121,9 +174,9 @@ def upgrade_subscription():
             )), 400
 
         # Upgrade subscription
-        success = User.upgrade_subscription(user_id, plan)
+        subscription = User.upgrade_subscription(user_id, plan)
 
-        if not success:
+        if subscription is None:
             return jsonify(format_error_response(
                 'Failed to upgrade subscription',
                 500
@@ -152,12 +205,14 @@ def cancel_subscription():
         JSON response with cancellation status
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
+        if user_id is None:
+            return jsonify(format_error_response('Invalid user ID', 400)), 400
 
         # Downgrade to free
-        success = User.upgrade_subscription(user_id, 'free')
+        subscription = User.upgrade_subscription(user_id, 'free')
 
-        if not success:
+        if subscription is None:
             return jsonify(format_error_response(
                 'Failed to cancel subscription',
                 500
@@ -184,48 +239,7 @@ def get_pricing():
     Returns:
         JSON response with pricing details
     """
-    try:
-        pricing = {
-            'plans': [
-                {
-                    'id': 'free',
-                    'name': 'Free',
-                    'price': 0,
-                    'currency': 'USD',
-                    'interval': 'month',
-                    'features': [
-                        '50 job swipes per day',
-                        'Manual job applications',
-                        'Basic job matching',
-                        'Course recommendations'
-                    ]
-                },
-                {
-                    'id': 'paid',
-                    'name': 'Premium',
-                    'price': 8.99,
-                    'currency': 'USD',
-                    'interval': 'month',
-                    'features': [
-                        'Unlimited job swipes',
-                        'Auto-apply to matched jobs',
-                        'Advanced job matching',
-                        'Priority support',
-                        'Resume optimization',
-                        'Course recommendations'
-                    ]
-                }
-            ]
-        }
-
-        return jsonify(format_success_response(
-            data=pricing,
-            message='Pricing retrieved successfully'
-        )), 200
-
-    except Exception as e:
-        logger.error(f"Error getting pricing: {str(e)}")
-        return jsonify(format_error_response(
-            'Failed to get pricing',
-            500
-        )), 500
+    response = Response(_PRICING_BODY, 200, mimetype='application/json')
+    response.set_etag(_PRICING_ETAG)
+    response.headers['Cache-Control'] = PRICING_CACHE_CONTROL
+    return response.make_conditional(request)
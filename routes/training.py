@@ -1,17 +1,23 @@
 """Training and model improvement routes."""
 import logging
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+import os
+import shutil
+from datetime import datetime
+from bson import ObjectId
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from werkzeug.utils import secure_filename
-from models.training import TrainingCorpus, TrainingJob
+from models.training import TrainingCorpus, TrainingJob, TrainingResume
 from models.user import User
-from services.training_service import TrainingService
-from services.google_forms_service import GoogleFormsService
-from services.resume_scraper import ResumeScraper
+from services.file_service import FileService
+from services.training_service import get_training_service
+from services.google_forms_service import DRIVE_DOWNLOAD_WORKERS, get_google_forms_service
+from utils.cache import REDIS_KEY_PREFIX, get_redis, shared_cached
 from utils.helpers import (
     format_error_response,
     serialize_document,
-    serialize_documents,
+    json_response,
+    with_id,
     calculate_skip_limit,
     get_pagination_metadata
 )
@@ -20,10 +26,159 @@ from utils.validators import validate_pagination_params
 logger = logging.getLogger(__name__)
 training_bp = Blueprint('training', __name__, url_prefix='/api/training')
 
-# Initialize services
-training_service = TrainingService()
-google_forms_service = GoogleFormsService()
-resume_scraper = ResumeScraper()
+
+@training_bp.before_request
+def _check_identity():
+    """Reject tokens whose identity isn't a user ObjectId before any handler runs."""
+    if verify_jwt_in_request(optional=True) and User.current_id() is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+
+
+# Resume file types accepted for training corpora
+TRAINING_RESUME_EXTENSIONS = {'pdf', 'docx', 'doc'}
+
+# Corpus totals only change on upload/delete, so page requests share a cached count
+CORPUS_COUNT_CACHE_TTL = 60
+
+# A retried import carrying the same Idempotency-Key gets the original task
+# back instead of queueing a second import for this long
+IDEMPOTENCY_KEY_TTL = 86400
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+def _parse_search_cursor(cursor):
+    """
+    Parse a search pagination cursor of the form "<qualityScore>_<resumeId>".
+
+    Args:
+        cursor: Cursor string from the query string
+
+    Returns:
+        tuple: (qualityScore, ObjectId) of the last-seen resume
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    score, _, resume_id = cursor.rpartition('_')
+    if not ObjectId.is_valid(resume_id):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return float(score), ObjectId(resume_id)
+
+
+def _stream_json_object(key, pairs):
+    """
+    Stream {key: {...}} built from (name, value) pairs as they are computed.
+
+    Each value is serialized and sent as soon as it is produced, so only one
+    section of the response is held in memory. The first section is computed
+    before the response starts, so an error there still reaches the caller's
+    500 handler. A later failure is logged and the object is closed with a
+    top-level "error" entry, so the client gets valid JSON that says it is
+    incomplete.
+
+    Args:
+        key: Top-level key of the response
+        pairs: Iterable of (name, value) pairs
+
+    Returns:
+        Streaming JSON response
+    """
+    dumps = current_app.json.dumps
+    pairs = iter(pairs)
+    first = next(pairs, None)
+
+    def generate():
+        yield '{' + dumps(key) + ':{'
+        if first is None:
+            yield '}}'
+            return
+        yield dumps(first[0]) + ':' + dumps(first[1])
+        try:
+            for name, value in pairs:
+                yield ',' + dumps(name) + ':' + dumps(value)
+        except Exception as e:
+            logger.error(f"Error streaming {key}: {str(e)}")
+            yield '},' + dumps('error') + ':' + dumps(f"Server error: {str(e)}") + '}'
+            return
+        yield '}}'
+
+    return Response(stream_with_context(generate()), 200, mimetype='application/json')
+
+
+def _task_queued_response(task_id, message):
+    """Build the 202 response for a queued training task."""
+    return jsonify({
+        'message': message,
+        'status': 'pending',
+        'taskId': task_id,
+        'statusUrl': f'/api/training/tasks/{task_id}'
+    }), 202
+
+
+def _parse_concurrency(data):
+    """
+    Read the optional Drive download concurrency from an import request body.
+
+    Returns:
+        int: Value clamped to 1..DRIVE_DOWNLOAD_WORKERS, or None if it isn't an integer
+    """
+    concurrency = data.get('concurrency', DRIVE_DOWNLOAD_WORKERS)
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool):
+        return None
+    return max(1, min(concurrency, DRIVE_DOWNLOAD_WORKERS))
+
+
+def _queue_import(user_id, source, options):
+    """
+    Queue a resume import on the scraper workers.
+
+    An Idempotency-Key request header is remembered in Redis for
+    IDEMPOTENCY_KEY_TTL seconds; repeating it returns the task queued the
+    first time. Without Redis the header is ignored.
+
+    Args:
+        user_id: User ID
+        source: Import source (see import_training_resumes_task)
+        options: Keyword arguments for the importer
+
+    Returns:
+        202 JSON response with the task ID
+    """
+    from celery_app import import_training_resumes_task, training_task_id
+
+    task_id = training_task_id(user_id)
+
+    idempotency_key = request.headers.get('Idempotency-Key')
+    client = get_redis() if idempotency_key else None
+    redis_key = None
+    if client is not None:
+        if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            return jsonify(format_error_response("Idempotency-Key is too long", 400)), 400
+
+        redis_key = f'{REDIS_KEY_PREFIX}idempotency:{user_id}:{idempotency_key}'
+        try:
+            if not client.set(redis_key, task_id, ex=IDEMPOTENCY_KEY_TTL, nx=True):
+                existing_task_id = client.get(redis_key)
+                if existing_task_id:
+                    return _task_queued_response(existing_task_id, 'Import already queued')
+        except Exception as e:
+            logger.warning(f"Idempotency key check failed for {user_id}: {str(e)}")
+            redis_key = None
+
+    try:
+        import_training_resumes_task.apply_async(
+            args=[source, user_id, options],
+            task_id=task_id
+        )
+    except Exception:
+        # Nothing was queued, so a retry with this key must not be answered
+        # with the task ID reserved above
+        if redis_key:
+            client.delete(redis_key)
+        raise
+
+    return _task_queued_response(task_id, 'Import queued')
 
 
 @training_bp.route('/upload', methods=['POST'])
@@ -42,34 +197,50 @@ def upload_training_resumes():
         JSON response with corpus ID and file count
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
 
         # Check if user is admin (optional - you can remove this for all users)
-        user = User.find_by_id(user_id)
+        user = User.current()
         if not user:
             return jsonify(format_error_response("User not found", 404))
 
-        # Get files from request
-        if 'files' not in request.files:
+        if request.mimetype != 'multipart/form-data' or 'boundary' not in request.mimetype_params:
             return jsonify(format_error_response("No files provided", 400))
 
-        files = request.files.getlist('files')
-        if not files or len(files) == 0:
-            return jsonify(format_error_response("No files selected", 400))
-
-        # Get metadata
-        corpus_name = request.form.get('corpusName', f"Corpus {datetime.utcnow().strftime('%Y-%m-%d')}")
-        description = request.form.get('description', '')
-        category = request.form.get('category', 'general')  # success, failed, general
-
-        # Upload and process resumes
-        result = training_service.upload_corpus(
-            user_id=user_id,
-            files=files,
-            corpus_name=corpus_name,
-            description=description,
-            category=category
-        )
+        # Stream the uploaded files straight into the corpus directory
+        corpus_id, corpus_path = get_training_service().create_corpus_dir()
+        try:
+            form, file_paths, rejected_filenames = FileService.stream_multipart_files(
+                request.stream,
+                request.mimetype_params['boundary'],
+                corpus_path,
+                file_field='files',
+                allowed_extensions=TRAINING_RESUME_EXTENSIONS
+            )
+
+            if not file_paths and not rejected_filenames:
+                os.rmdir(corpus_path)
+                return jsonify(format_error_response("No files selected", 400))
+
+            # Get metadata
+            corpus_name = form.get('corpusName', f"Corpus {datetime.utcnow().strftime('%Y-%m-%d')}")
+            description = form.get('description', '')
+            category = form.get('category', 'general')  # success, failed, general
+
+            # Process resumes
+            result = get_training_service().upload_corpus(
+                user_id=user_id,
+                corpus_id=corpus_id,
+                file_paths=file_paths,
+                corpus_name=corpus_name,
+                description=description,
+                category=category,
+                rejected_filenames=rejected_filenames
+            )
+        except Exception:
+            # Malformed body or client disconnect: drop the partial corpus
+            shutil.rmtree(corpus_path, ignore_errors=True)
+            raise
 
         if not result['success']:
             return jsonify(format_error_response(result.get('error', 'Upload failed'), 500))
@@ -97,17 +268,19 @@ def get_training_corpora():
     - page: Page number (default: 1)
     - pageSize: Items per page (default: 20)
     - category: Filter by category (success, failed, general)
+    - cursor: Last-seen corpus ID; takes precedence over page (preferred for deep pages)
+    - fields: 'full' to return whole corpus documents (default: listing fields only)
 
     Returns:
         JSON response with list of corpora
     """
     try:
-        user_id = get_jwt_identity()
-
         # Get pagination params
         page = request.args.get('page', 1, type=int)
         page_size = request.args.get('pageSize', 20, type=int)
         category = request.args.get('category')
+        cursor = request.args.get('cursor')
+        projection = None if request.args.get('fields') == 'full' else TrainingCorpus.LIST_PROJECTION
 
         is_valid, (validated_page, validated_page_size), error = validate_pagination_params(
             page, page_size
@@ -116,17 +289,49 @@ def get_training_corpora():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
-        # Calculate pagination
-        skip, limit = calculate_skip_limit(validated_page, validated_page_size)
-
-        # Get corpora
-        corpora = TrainingCorpus.get_all(category=category, skip=skip, limit=validated_page_size)
-        total_count = TrainingCorpus.get_count(category=category)
+        # Cursor pagination avoids the O(skip) walk on deep pages
+        if cursor:
+            if not ObjectId.is_valid(cursor):
+                return jsonify(format_error_response("Invalid cursor", 400))
+
+            corpora = TrainingCorpus.get_all_after(
+                category=category,
+                after_id=ObjectId(cursor),
+                limit=validated_page_size,
+                projection=projection
+            )
+        else:
+            skip, limit = calculate_skip_limit(validated_page, validated_page_size)
+            corpora = TrainingCorpus.get_all(
+                category=category, skip=skip, limit=validated_page_size, projection=projection
+            )
+
+        has_next = len(corpora) == validated_page_size
+        next_cursor = str(corpora[-1]['_id']) if has_next else None
+
+        if cursor:
+            return json_response({
+                'corpora': [with_id(corpus) for corpus in corpora],
+                'meta': {
+                    'pageSize': validated_page_size,
+                    'count': len(corpora),
+                    'hasNext': has_next,
+                    'nextCursor': next_cursor
+                }
+            })
+
+        total_count = shared_cached(
+            f'corpus-count:{category or "all"}',
+            CORPUS_COUNT_CACHE_TTL,
+            lambda: TrainingCorpus.get_count(category=category)
+        )
+        meta = get_pagination_metadata(total_count, validated_page, validated_page_size)
+        meta['nextCursor'] = next_cursor
 
-        return jsonify({
-            'corpora': serialize_documents(corpora),
-            'meta': get_pagination_metadata(total_count, validated_page, validated_page_size)
-        }), 200
+        return json_response({
+            'corpora': [with_id(corpus) for corpus in corpora],
+            'meta': meta
+        })
 
     except Exception as e:
         logger.error(f"Error fetching corpora: {str(e)}")
@@ -151,9 +356,9 @@ def get_corpus_details(corpus_id):
         if not corpus:
             return jsonify(format_error_response("Corpus not found", 404))
 
-        return jsonify({
-            'corpus': serialize_document(corpus)
-        }), 200
+        return json_response({
+            'corpus': with_id(corpus)
+        })
 
     except Exception as e:
         logger.error(f"Error fetching corpus: {str(e)}")
@@ -173,9 +378,9 @@ def delete_corpus(corpus_id):
         JSON response confirming deletion
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
 
-        result = training_service.delete_corpus(corpus_id, user_id)
+        result = get_training_service().delete_corpus(corpus_id, user_id)
 
         if not result['success']:
             return jsonify(format_error_response(result.get('error', 'Deletion failed'), 400))
@@ -207,7 +412,7 @@ def start_training_job():
         JSON response with training job details
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
         data = request.get_json() or {}
 
         corpus_ids = data.get('corpusIds')
@@ -215,7 +420,7 @@ def start_training_job():
         hyperparameters = data.get('hyperparameters', {})
 
         # Start training job
-        result = training_service.start_training_job(
+        result = get_training_service().start_training_job(
             user_id=user_id,
             corpus_ids=corpus_ids,
             model_type=model_type,
@@ -263,6 +468,59 @@ def get_training_job(job_id):
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
 
 
+@training_bp.route('/tasks/<task_id>', methods=['GET'])
+@jwt_required()
+def get_training_task(task_id):
+    """
+    Get the status of a queued import or auto-train request.
+
+    Args:
+        task_id: Task ID returned when the request was queued
+
+    Returns:
+        JSON with status (pending, running, completed, failed) and the
+        task's result when done
+    """
+    user_id = get_jwt_identity()
+
+    # Task IDs embed the owner, so users can only read their own tasks
+    if not task_id.startswith(f'training-{user_id}-'):
+        return jsonify(format_error_response("Task not found", 404))
+
+    from celery_app import celery_app
+
+    result = celery_app.AsyncResult(task_id)
+
+    if not result.ready():
+        return jsonify({
+            'status': 'running' if result.state == 'PROGRESS' else 'pending',
+            'taskId': task_id
+        }), 200
+
+    payload = result.result
+    # Auto-train results have no success flag, only an error on failure
+    if result.successful() and isinstance(payload, dict) and payload.get('success', 'error' not in payload):
+        if 'jobs_started' in payload:
+            # Same keys the auto-train endpoint returned before it was queued
+            payload = {
+                'message': payload.get('message', 'Auto-training triggered successfully'),
+                'jobsStarted': payload.get('jobs_started', 0),
+                'resumesProcessed': payload.get('resumes_processed', 0)
+            }
+        return jsonify({
+            'status': 'completed',
+            'taskId': task_id,
+            'result': payload
+        }), 200
+
+    return jsonify({
+        'status': 'failed',
+        'taskId': task_id,
+        # A task that raised (auto_training_check re-raises) has the exception as its result
+        'error': payload.get('error') if isinstance(payload, dict) else str(payload)
+    }), 200
+
+
 @training_bp.route('/analytics', methods=['GET'])
 @jwt_required()
 def get_training_analytics():
@@ -273,15 +531,12 @@ def get_training_analytics():
         JSON response with analytics data
     """
     try:
-        analytics = training_service.get_training_analytics()
-
-        return jsonify({
-            'analytics': analytics
-        }), 200
+        return _stream_json_object('analytics', get_training_service().iter_training_analytics())
 
     except Exception as e:
         logger.error(f"Error fetching analytics: {str(e)}")
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+        body, status = format_error_response(f"Server error: {str(e)}", 500)
+        return jsonify(body), status
 
 
 @training_bp.route('/search', methods=['GET'])
@@ -296,6 +551,8 @@ def search_training_resumes():
     - minScore: Minimum quality score
     - page: Page number
     - pageSize: Items per page
+    - cursor: nextCursor from the previous page; takes precedence over page
+    - fields: 'full' to return whole resume documents (default: search fields only)
 
     Returns:
         JSON response with search results
@@ -306,13 +563,24 @@ def search_training_resumes():
         min_score = request.args.get('minScore', type=float)
         page = request.args.get('page', 1, type=int)
         page_size = request.args.get('pageSize', 20, type=int)
+        cursor = request.args.get('cursor')
+        projection = None if request.args.get('fields') == 'full' else TrainingResume.SEARCH_PROJECTION
+
+        after = None
+        if cursor:
+            try:
+                after = _parse_search_cursor(cursor)
+            except ValueError:
+                return jsonify(format_error_response("Invalid cursor", 400))
 
-        results = training_service.search_resumes(
+        results = get_training_service().search_resumes(
             query=query,
             category=category,
             min_score=min_score,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            after=after,
+            projection=projection
         )
 
         return jsonify(results), 200
@@ -337,15 +605,12 @@ def get_extracted_patterns():
     try:
         pattern_type = request.args.get('patternType', 'all')
 
-        patterns = training_service.get_extracted_patterns(pattern_type)
-
-        return jsonify({
-            'patterns': patterns
-        }), 200
+        return _stream_json_object('patterns', get_training_service().iter_extracted_patterns(pattern_type))
 
     except Exception as e:
         logger.error(f"Error fetching patterns: {str(e)}")
-        return jsonify(format_error_response(f"Server error: {str(e)}", 500))
+        body, status = format_error_response(f"Server error: {str(e)}", 500)
+        return jsonify(body), status
 
 
 @training_bp.route('/validate', methods=['POST'])
@@ -375,7 +640,7 @@ def validate_resume_quality():
         if not resume_text and not resume_url:
             return jsonify(format_error_response("Resume text or URL required", 400))
 
-        validation = training_service.validate_resume_quality(resume_text, resume_url)
+        validation = get_training_service().validate_resume_quality(resume_text, resume_url)
 
         return jsonify({
             'validation': validation
@@ -396,18 +661,17 @@ def trigger_auto_training():
     that normally runs automatically in the background.
 
     Returns:
-        JSON response with training trigger status
+        202 JSON response with the task ID to poll at /tasks/<task_id>
     """
     try:
         user_id = get_jwt_identity()
 
-        result = training_service.trigger_auto_training()
+        from celery_app import auto_training_check, training_task_id
 
-        return jsonify({
-            'message': 'Auto-training triggered successfully',
-            'jobsStarted': result.get('jobs_started', 0),
-            'resumesProcessed': result.get('resumes_processed', 0)
-        }), 200
+        task_id = training_task_id(user_id)
+        auto_training_check.apply_async(task_id=task_id)
+
+        return _task_queued_response(task_id, 'Auto-training queued')
 
     except Exception as e:
         logger.error(f"Error triggering auto-training: {str(e)}")
@@ -426,11 +690,20 @@ def import_from_google_drive():
     {
         "folderId": "google-drive-folder-id",
         "corpusName": "My Training Corpus",
-        "category": "general"  // success, failed, general
+        "category": "general",  // success, failed, general
+        "skipIfEmpty": true,  // Optional, don't queue an import for a folder with no resumes
+        "concurrency": 8  // Optional, Drive files downloaded at once (capped at DRIVE_DOWNLOAD_WORKERS)
     }
 
+    Headers:
+        If-None-Match: Optional, the ETag from a previous import of this
+        folder; the import is skipped if its resumes haven't changed
+        Idempotency-Key: Optional, see _queue_import
+
     Returns:
-        JSON response with import results
+        202 JSON response with the task ID to poll at /tasks/<task_id>,
+        or 200 with the folder info when the folder is empty or unchanged.
+        Both carry the folder's ETag when the folder was checked.
     """
     try:
         user_id = get_jwt_identity()
@@ -443,26 +716,44 @@ def import_from_google_drive():
         corpus_name = data.get('corpusName', 'Google Forms Import')
         category = data.get('category', 'general')
 
-        # Import resumes from folder
-        result = google_forms_service.import_resumes_from_folder(
-            folder_id=folder_id,
-            user_id=user_id,
-            corpus_name=corpus_name,
-            category=category
-        )
-
-        if not result['success']:
-            return jsonify(format_error_response(result.get('error', 'Import failed'), 500))
-
-        return jsonify({
-            'message': 'Resumes imported successfully from Google Drive',
-            'corpusId': result['corpus_id'],
-            'filesUploaded': result['files_uploaded'],
-            'filesFailed': result['files_failed'],
-            'corpus': serialize_document(result['corpus']),
-            'uploadedFiles': result['uploaded_files'],
-            'failedFiles': result['failed_files']
-        }), 201
+        concurrency = _parse_concurrency(data)
+        if concurrency is None:
+            return jsonify(format_error_response("concurrency must be an integer", 400))
+
+        # Lets scheduled imports check the folder and queue in one round trip;
+        # if the folder can't be read the import is queued as usual
+        etag = None
+        if data.get('skipIfEmpty') or request.if_none_match:
+            result = get_google_forms_service().get_folder_info(folder_id)
+            if result['success']:
+                folder = result['folder']
+                etag = folder['fileIdsHash']
+
+                if folder.get('resumeCount', 0) == 0 and data.get('skipIfEmpty'):
+                    message = 'No resumes found in folder'
+                elif request.if_none_match.contains_weak(etag):
+                    message = 'Folder unchanged since the last import'
+                else:
+                    message = None
+
+                if message:
+                    response = jsonify({
+                        'message': message,
+                        'status': 'skipped',
+                        'folder': folder
+                    })
+                    response.set_etag(etag)
+                    return response, 200
+
+        response, status = _queue_import(user_id, 'google_drive', {
+            'folder_id': folder_id,
+            'corpus_name': corpus_name,
+            'category': category,
+            'concurrency': concurrency
+        })
+        if etag:
+            response.set_etag(etag)
+        return response, status
 
     except Exception as e:
         logger.error(f"Error importing from Google Drive: {str(e)}")
@@ -479,11 +770,15 @@ def import_from_google_sheets():
     {
         "spreadsheetId": "google-sheets-id",
         "sheetName": "Form Responses 1",  // Optional
-        "fileUrlColumn": "Resume File"  // Optional, column containing file URLs
+        "fileUrlColumn": "Resume File",  // Optional, column containing file URLs
+        "concurrency": 8  // Optional, Drive files downloaded at once (capped at DRIVE_DOWNLOAD_WORKERS)
     }
 
+    Headers:
+        Idempotency-Key: Optional, see _queue_import
+
     Returns:
-        JSON response with import results
+        202 JSON response with the task ID to poll at /tasks/<task_id>
     """
     try:
         user_id = get_jwt_identity()
@@ -496,26 +791,16 @@ def import_from_google_sheets():
         sheet_name = data.get('sheetName', 'Form Responses 1')
         file_url_column = data.get('fileUrlColumn', 'Resume File')
 
-        # Import resumes from sheets
-        result = google_forms_service.import_from_sheets(
-            spreadsheet_id=spreadsheet_id,
-            user_id=user_id,
-            sheet_name=sheet_name,
-            file_url_column=file_url_column
-        )
-
-        if not result['success']:
-            return jsonify(format_error_response(result.get('error', 'Import failed'), 500))
+        concurrency = _parse_concurrency(data)
+        if concurrency is None:
+            return jsonify(format_error_response("concurrency must be an integer", 400))
 
-        return jsonify({
-            'message': 'Resumes imported successfully from Google Sheets',
-            'corpusId': result['corpus_id'],
-            'filesUploaded': result['files_uploaded'],
-            'filesFailed': result['files_failed'],
-            'corpus': serialize_document(result['corpus']),
-            'uploadedFiles': result['uploaded_files'],
-            'failedFiles': result['failed_files']
-        }), 201
+        return _queue_import(user_id, 'google_sheets', {
+            'spreadsheet_id': spreadsheet_id,
+            'sheet_name': sheet_name,
+            'file_url_column': file_url_column,
+            'concurrency': concurrency
+        })
 
     except Exception as e:
         logger.error(f"Error importing from Google Sheets: {str(e)}")
@@ -532,17 +817,20 @@ def get_google_drive_folder_info(folder_id):
         folder_id: Google Drive folder ID
 
     Returns:
-        JSON response with folder information
+        JSON response with folder information and an ETag of its resumes,
+        or 304 when If-None-Match still matches
     """
     try:
-        result = google_forms_service.get_folder_info(folder_id)
+        result = get_google_forms_service().get_folder_info(folder_id)
 
         if not result['success']:
             return jsonify(format_error_response(result.get('error', 'Failed to get folder info'), 500))
 
-        return jsonify({
+        response = jsonify({
             'folder': result['folder']
-        }), 200
+        })
+        response.set_etag(result['folder']['fileIdsHash'])
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"Error getting folder info: {str(e)}")
@@ -564,7 +852,7 @@ def scrape_huggingface_dataset():
     }
 
     Returns:
-        JSON response with scraping results
+        202 JSON response with the task ID to poll at /tasks/<task_id>
     """
     try:
         user_id = get_jwt_identity()
@@ -573,25 +861,10 @@ def scrape_huggingface_dataset():
         dataset_name = data.get('datasetName', 'opensporks/resumes')
         max_resumes = data.get('maxResumes', 100)
 
-        # Download dataset
-        result = resume_scraper.download_huggingface_dataset(
-            user_id=user_id,
-            dataset_name=dataset_name,
-            max_resumes=max_resumes
-        )
-
-        if not result['success']:
-            return jsonify(format_error_response(result.get('error', 'Scraping failed'), 500))
-
-        return jsonify({
-            'message': 'Resumes scraped successfully from Hugging Face',
-            'corpusId': result['corpus_id'],
-            'filesUploaded': result['files_uploaded'],
-            'filesFailed': result['files_failed'],
-            'corpus': serialize_document(result['corpus']),
-            'uploadedFiles': result['uploaded_files'][:10],  # Show first 10
-            'totalFiles': len(result['uploaded_files'])
-        }), 201
+        return _queue_import(user_id, 'huggingface', {
+            'dataset_name': dataset_name,
+            'max_resumes': max_resumes
+        })
 
     except Exception as e:
         logger.error(f"Error scraping Hugging Face: {str(e)}")
@@ -611,7 +884,7 @@ def scrape_kaggle_dataset():
     }
 
     Returns:
-        JSON response with scraping results
+        202 JSON response with the task ID to poll at /tasks/<task_id>
     """
     try:
         user_id = get_jwt_identity()
@@ -620,25 +893,10 @@ def scrape_kaggle_dataset():
         dataset_name = data.get('datasetName', 'snehaanbhawal/resume-dataset')
         max_resumes = data.get('maxResumes', 100)
 
-        # Download dataset
-        result = resume_scraper.download_from_kaggle(
-            user_id=user_id,
-            dataset_name=dataset_name,
-            max_resumes=max_resumes
-        )
-
-        if not result['success']:
-            return jsonify(format_error_response(result.get('error', 'Scraping failed'), 500))
-
-        return jsonify({
-            'message': 'Resumes scraped successfully from Kaggle',
-            'corpusId': result['corpus_id'],
-            'filesUploaded': result['files_uploaded'],
-            'filesFailed': result['files_failed'],
-            'corpus': serialize_document(result['corpus']),
-            'uploadedFiles': result['uploaded_files'][:10],
-            'totalFiles': len(result['uploaded_files'])
-        }), 201
+        return _queue_import(user_id, 'kaggle', {
+            'dataset_name': dataset_name,
+            'max_resumes': max_resumes
+        })
 
     except Exception as e:
         logger.error(f"Error scraping Kaggle: {str(e)}")
@@ -659,7 +917,7 @@ def scrape_from_url():
     }
 
     Returns:
-        JSON response with scraping results
+        202 JSON response with the task ID to poll at /tasks/<task_id>
     """
     try:
         user_id = get_jwt_identity()
@@ -672,24 +930,11 @@ def scrape_from_url():
         corpus_name = data.get('corpusName', 'URL Import')
         is_zip = data.get('isZip', False)
 
-        # Download from URL
-        result = resume_scraper.download_from_url(
-            user_id=user_id,
-            url=url,
-            corpus_name=corpus_name,
-            is_zip=is_zip
-        )
-
-        if not result['success']:
-            return jsonify(format_error_response(result.get('error', 'Download failed'), 500))
-
-        return jsonify({
-            'message': 'Resumes downloaded successfully from URL',
-            'corpusId': result['corpus_id'],
-            'filesUploaded': result['files_uploaded'],
-            'filesFailed': result['files_failed'],
-            'corpus': serialize_document(result['corpus'])
-        }), 201
+        return _queue_import(user_id, 'url', {
+            'url': url,
+            'corpus_name': corpus_name,
+            'is_zip': is_zip
+        })
 
     except Exception as e:
         logger.error(f"Error downloading from URL: {str(e)}")
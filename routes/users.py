@@ -1,13 +1,37 @@
 """User profile management routes."""
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, verify_jwt_in_request
+from config.database import get_users_collection
 from models.user import User
-from utils.helpers import format_error_response, serialize_document
+from utils.helpers import format_error_response, json_response, with_id
 from utils.validators import validate_user_profile_data
 
 users_bp = Blueprint('users', __name__, url_prefix='/api/user')
 
 
+@users_bp.before_request
+def _check_identity():
+    """Reject tokens whose identity isn't a user ObjectId before any handler runs."""
+    if verify_jwt_in_request(optional=True) and User.current_id() is None:
+        body, status = format_error_response("Invalid user ID", 400)
+        return jsonify(body), status
+
+
+# Plan details returned by /subscription/upgrade (read-only)
+PLAN_DETAILS = {
+    'free': {'price': 0, 'features': ['50 swipes/day', 'Manual apply']},
+    'paid': {
+        'price': 8.99,
+        'features': [
+            'Unlimited swipes',
+            'Auto-apply on swipe right',
+            'AI-generated cover letters',
+            'Resume customization'
+        ]
+    }
+}
+
+
 @users_bp.route('/profile', methods=['GET'])
 @jwt_required()
 def get_profile():
@@ -18,19 +42,15 @@ def get_profile():
         JSON response with user profile data
     """
     try:
-        user_id = get_jwt_identity()
-        user = User.find_by_id(user_id)
+        user = User.current()
 
         if not user:
             return jsonify(format_error_response("User not found", 404))
 
-        user_data = serialize_document(user)
-
-        # Remove sensitive data
-        if 'password_hash' in user_data:
-            del user_data['password_hash']
+        # The password hash is never read (User.PUBLIC_PROJECTION)
+        user_data = with_id(user)
 
-        return jsonify({'user': user_data}), 200
+        return json_response({'user': user_data})
 
     except Exception as e:
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
@@ -64,7 +84,7 @@ def update_profile():
         JSON response with updated user data
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
         data = request.get_json()
 
         if not data:
@@ -75,24 +95,19 @@ def update_profile():
         if not is_valid:
             return jsonify(format_error_response(error, 400))
 
-        # Update profile
-        success = User.update_profile(user_id, data)
+        # Update profile (returns the updated user, so no re-read)
+        user = User.update_profile(user_id, data)
 
-        if not success:
+        if not user:
             return jsonify(format_error_response("Failed to update profile", 500))
 
-        # Get updated user
-        user = User.find_by_id(user_id)
-        user_data = serialize_document(user)
-
-        # Remove sensitive data
-        if 'password_hash' in user_data:
-            del user_data['password_hash']
+        # The password hash is never read (User.PUBLIC_PROJECTION)
+        user_data = with_id(user)
 
-        return jsonify({
+        return json_response({
             'message': 'Profile updated successfully',
             'user': user_data
-        }), 200
+        })
 
     except Exception as e:
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
@@ -116,26 +131,22 @@ def update_preferences():
         JSON response with updated preferences
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
         data = request.get_json()
 
         if not data:
             return jsonify(format_error_response("No data provided", 400))
 
-        # Update preferences
-        success = User.update_preferences(user_id, data)
+        # Update preferences (returns the updated user, so no re-read)
+        user = User.update_preferences(user_id, data)
 
-        if not success:
+        if not user:
             return jsonify(format_error_response("Failed to update preferences", 500))
 
-        # Get updated user
-        user = User.find_by_id(user_id)
-        user_data = serialize_document(user)
-
-        return jsonify({
+        return json_response({
             'message': 'Preferences updated successfully',
-            'preferences': user_data.get('preferences', {})
-        }), 200
+            'preferences': user.get('preferences', {})
+        })
 
     except Exception as e:
         return jsonify(format_error_response(f"Server error: {str(e)}", 500))
@@ -151,7 +162,7 @@ def get_subscription_status():
         JSON response with subscription details
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
         swipe_status = User.get_swipe_status(user_id)
 
         if not swipe_status:
@@ -182,7 +193,7 @@ def upgrade_subscription():
         JSON response confirming upgrade
     """
     try:
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
         data = request.get_json()
 
         if not data or 'plan' not in data:
@@ -198,32 +209,18 @@ def upgrade_subscription():
             ))
 
         # Update subscription
-        success = User.upgrade_subscription(user_id, plan)
+        subscription = User.upgrade_subscription(user_id, plan)
 
-        if not success:
+        if subscription is None:
             return jsonify(format_error_response("Failed to update subscription", 500))
 
-        # Get updated swipe status
-        swipe_status = User.get_swipe_status(user_id)
-
-        # Add pricing info
-        pricing_info = {
-            'free': {'price': 0, 'features': ['50 swipes/day', 'Manual apply']},
-            'paid': {
-                'price': 8.99,
-                'features': [
-                    'Unlimited swipes',
-                    'Auto-apply on swipe right',
-                    'AI-generated cover letters',
-                    'Resume customization'
-                ]
-            }
-        }
+        # Build swipe status from the updated subscription
+        swipe_status = User.build_swipe_status(User.with_live_swipe_count(user_id, subscription))
 
         return jsonify({
             'message': f'Subscription {"upgraded" if plan == "paid" else "changed"} to {plan} successfully',
             'subscription': swipe_status,
-            'planDetails': pricing_info[plan]
+            'planDetails': PLAN_DETAILS[plan]
         }), 200
 
     except Exception as e:
@@ -240,14 +237,11 @@ def deactivate_account():
         JSON response confirming deactivation
     """
     try:
-        from config.database import get_users_collection
-        from bson import ObjectId
-
-        user_id = get_jwt_identity()
+        user_id = User.current_id()
         users = get_users_collection()
 
         result = users.update_one(
-            {'_id': ObjectId(user_id)},
+            {'_id': user_id},
             {'$set': {'isActive': False}}
         )
 
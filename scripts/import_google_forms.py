@@ -2,172 +2,474 @@
 """
 Automated script to import resumes from Google Forms.
 
-This script can be run manually or scheduled via cron to periodically
-import new resumes from a Google Drive folder.
+This script can be run manually, scheduled via cron, or left running with
+--daemon to periodically import new resumes from a Google Drive folder.
 
 Usage:
+    python scripts/import_google_forms.py [--daemon]
+
+For frequent cron runs, .env can be exported once instead of parsed by
+every run:
+    set -a; . ./.env; set +a; export CAREERGENIE_ENV_LOADED=1
     python scripts/import_google_forms.py
 
 Environment Variables:
     API_URL: Backend API URL (default: http://localhost:8000)
     ADMIN_TOKEN: JWT token for authentication
-    GOOGLE_FORMS_FOLDER_ID: Google Drive folder ID
+    GOOGLE_FORMS_FOLDER_ID: Google Drive folder ID, or several separated by commas
     IMPORT_METHOD: 'folder' or 'sheets' (default: folder)
     GOOGLE_SHEETS_ID: Google Sheets ID (if using sheets method)
+    CONNECT_TIMEOUT: Seconds to wait for the connection (default: 5)
+    READ_TIMEOUT: Seconds to wait for the import response (default: 300)
+    IMPORT_CONCURRENCY: Drive files the backend downloads at once (default: 8)
+    POLL_BASE_SEC: Daemon poll interval after an import (default: 30)
+    POLL_MAX_SEC: Longest daemon poll interval while idle (default: 600)
+    IMPORT_STATE_FILE: Where the last imported folder state is kept
+                       (default: ~/.careergenie/import_state.json)
+    LOG_FORMAT: 'text' or 'json' (one JSON object per line) (default: text)
+    IMPORT_LOCK_FILE: Lock held while running (default: /tmp/careergenie_import.lock)
+    CAREERGENIE_ENV_LOADED: Set to skip reading .env (variables already exported)
 """
 
 import os
 import sys
+import json
+import fcntl
+import signal
+import argparse
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables, unless the caller already exported them
+# (e.g. a cron line that sources a pre-generated env file)
+if not os.getenv('CAREERGENIE_ENV_LOADED'):
+    from dotenv import load_dotenv
+    load_dotenv()
+    os.environ['CAREERGENIE_ENV_LOADED'] = '1'
 
 # Configuration
 API_URL = os.getenv('API_URL', 'http://localhost:8000')
 ADMIN_TOKEN = os.getenv('ADMIN_TOKEN')
-FOLDER_ID = os.getenv('GOOGLE_FORMS_FOLDER_ID')
+FOLDER_IDS = [
+    folder_id.strip()
+    for folder_id in os.getenv('GOOGLE_FORMS_FOLDER_ID', '').split(',')
+    if folder_id.strip()
+]
 SHEETS_ID = os.getenv('GOOGLE_SHEETS_ID')
 IMPORT_METHOD = os.getenv('IMPORT_METHOD', 'folder')  # 'folder' or 'sheets'
+IMPORT_CONCURRENCY = int(os.getenv('IMPORT_CONCURRENCY', 8))
+
+# Daemon mode doubles the wait after each poll that queued nothing
+POLL_BASE_SEC = float(os.getenv('POLL_BASE_SEC', 30))
+POLL_MAX_SEC = float(os.getenv('POLL_MAX_SEC', 600))
+
+# ETag of each folder's resumes as of its last successful import; sent back
+# so the backend skips the import when nothing was added or removed. A queued
+# import's ETag is kept as pending and only promoted once a later run sees
+# its task completed. Delete the file to force a re-import.
+IMPORT_STATE_FILE = os.path.expanduser(
+    os.getenv('IMPORT_STATE_FILE', '~/.careergenie/import_state.json')
+)
+
+# Held for the life of the process so overlapping cron runs don't import twice
+IMPORT_LOCK_FILE = os.getenv('IMPORT_LOCK_FILE', '/tmp/careergenie_import.lock')
+
+# Outcomes of an import request
+QUEUED = 'queued'
+SKIPPED = 'skipped'
+FAILED = 'failed'
+
+# An unreachable backend fails within CONNECT_TIMEOUT; only a running
+# import gets the long READ_TIMEOUT
+CONNECT_TIMEOUT = float(os.getenv('CONNECT_TIMEOUT', 5))
+READ_TIMEOUT = float(os.getenv('READ_TIMEOUT', 300))
+TASK_STATUS_READ_TIMEOUT = 30
+
+# Imports are killed after an hour (the worker's task_time_limit), so a
+# task that still hasn't finished after this long was lost; its folder is
+# imported again
+PENDING_TASK_MAX_AGE_SEC = 3 * 3600
+
+# Folders are imported at most this many at a time (each import request is
+# quick; the backend queues the work), sharing SESSION's connection pool
+FOLDER_WORKERS = 8
+
+# Only this much of a failed import's response body is read and logged
+ERROR_BODY_LIMIT = 4096
+
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # 'text' or 'json'
+
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as one JSON line, merging in extra={'fields': {...}}."""
+
+    def format(self, record):
+        entry = {
+            'ts': record.created,
+            'level': record.levelname,
+            'msg': record.getMessage(),
+            **getattr(record, 'fields', {})
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
 
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
+if LOG_FORMAT == 'json':
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(JsonFormatter())
 logger = logging.getLogger(__name__)
 
+# One session for the whole run so the task status checks and the imports
+# share kept-alive connections. Import POSTs are retried on 502/503/504 too:
+# each carries an Idempotency-Key, so a retry of an import the backend
+# already queued returns that task instead of starting a second one.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['GET', 'POST']
+    )
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+SESSION.headers.update({"Authorization": f"Bearer {ADMIN_TOKEN}"})
 
-def import_from_folder():
-    """Import resumes from Google Drive folder."""
-    if not FOLDER_ID:
-        logger.error("GOOGLE_FORMS_FOLDER_ID not set in environment")
-        return False
 
-    logger.info(f"Importing resumes from Google Drive folder: {FOLDER_ID}")
+def _report_import(response):
+    """
+    Log the backend's answer to an import request.
+
+    The response is requested with stream=True: successful answers are small
+    JSON bodies, while an error page (e.g. a proxy's HTML) is only read up
+    to ERROR_BODY_LIMIT bytes instead of being buffered whole.
+
+    Returns:
+        tuple: (QUEUED, SKIPPED or FAILED, the queued task's ID or None)
+    """
+    with response:
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('status') == 'skipped':
+                logger.info(
+                    f"{data.get('message', 'Nothing to import')}. Skipping.",
+                    extra={'fields': {'outcome': SKIPPED}}
+                )
+                return SKIPPED, None
+
+        if response.status_code == 202:
+            data = response.json()
+            logger.info(
+                f"✓ Import queued as task {data['taskId']}",
+                extra={'fields': {'outcome': QUEUED, 'taskId': data['taskId']}}
+            )
+            logger.info(f"  Status URL: {data['statusUrl']}")
+            return QUEUED, data['taskId']
+
+        body = next(response.iter_content(ERROR_BODY_LIMIT), b'')
+        logger.error(
+            f"✗ Import failed: {response.status_code}",
+            extra={'fields': {'outcome': FAILED, 'status': response.status_code}}
+        )
+        logger.error(f"  Response: {body.decode('utf-8', errors='replace')}")
+        return FAILED, None
+
+
+def _load_state():
+    """
+    Read the saved import state, or empty state if there is none.
+
+    Returns:
+        tuple: (ETag per folder ID, pending import per folder ID as
+                {'taskId', 'etag', 'queuedAt'})
+    """
+    try:
+        with open(IMPORT_STATE_FILE) as f:
+            state = json.load(f)
+        return state.get('etags', {}), state.get('pending', {})
+    except (OSError, ValueError, AttributeError):
+        return {}, {}
+
+
+def _save_state(etags, pending):
+    """Write the import state, replacing the file atomically."""
+    try:
+        os.makedirs(os.path.dirname(IMPORT_STATE_FILE), exist_ok=True)
+        tmp_path = f"{IMPORT_STATE_FILE}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'etags': etags, 'pending': pending}, f)
+        os.replace(tmp_path, IMPORT_STATE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not save import state: {str(e)}")
+
+
+def get_task_status(task_id):
+    """
+    Ask the backend how a queued import is doing.
+
+    Returns:
+        str: pending, running, completed or failed; None if it couldn't be checked
+    """
+    try:
+        response = SESSION.get(
+            f"{API_URL}/api/training/tasks/{task_id}",
+            timeout=(CONNECT_TIMEOUT, TASK_STATUS_READ_TIMEOUT)
+        )
+        if response.status_code == 200:
+            return response.json().get('status')
+        logger.warning(f"Could not fetch status of task {task_id}: {response.status_code}")
+    except Exception as e:
+        logger.warning(f"Error checking task {task_id}: {str(e)}")
+    return None
+
+
+def import_from_folder(folder_id, etag=None):
+    """
+    Import resumes from one Google Drive folder.
+
+    Args:
+        folder_id: Google Drive folder ID
+        etag: ETag from the folder's last import, if any
+
+    Returns:
+        tuple: (QUEUED, SKIPPED or FAILED, the folder's current ETag or None,
+                the queued task's ID or None)
+    """
+    logger.info(f"Importing resumes from Google Drive folder: {folder_id}")
+
+    # One key per attempt; urllib3 retries resend the same headers
+    headers = {'Idempotency-Key': str(uuid.uuid4())}
+    if etag:
+        headers['If-None-Match'] = etag
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_URL}/api/training/google-forms/import-folder",
-            headers={
-                "Authorization": f"Bearer {ADMIN_TOKEN}",
-                "Content-Type": "application/json"
-            },
             json={
-                "folderId": FOLDER_ID,
+                "folderId": folder_id,
                 "corpusName": f"Auto-Import {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-                "category": "general"
+                "category": "general",
+                # The backend checks the folder itself, so an empty folder
+                # costs one request instead of a folder-info call first
+                "skipIfEmpty": True,
+                "concurrency": IMPORT_CONCURRENCY
             },
-            timeout=300  # 5 minutes timeout
+            headers=headers,
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+            stream=True
         )
 
-        if response.status_code == 201:
-            data = response.json()
-            logger.info(f"✓ Successfully imported {data['filesUploaded']} resumes")
-            logger.info(f"  Corpus ID: {data['corpusId']}")
-
-            if data['filesFailed'] > 0:
-                logger.warning(f"  {data['filesFailed']} files failed to import")
-                logger.warning(f"  Failed files: {data.get('failedFiles', [])}")
-
-            return True
-        else:
-            logger.error(f"✗ Import failed: {response.status_code}")
-            logger.error(f"  Response: {response.text}")
-            return False
+        outcome, task_id = _report_import(response)
+        return outcome, response.headers.get('ETag'), task_id
 
-    except requests.exceptions.Timeout:
-        logger.error("✗ Request timed out after 5 minutes")
-        return False
+    except requests.exceptions.ConnectTimeout:
+        logger.error(f"✗ Could not connect to {API_URL} within {CONNECT_TIMEOUT:g}s")
+    except requests.exceptions.ReadTimeout:
+        logger.error(f"✗ Import did not respond within {READ_TIMEOUT:g}s")
     except requests.exceptions.RequestException as e:
         logger.error(f"✗ Request error: {str(e)}")
-        return False
     except Exception as e:
         logger.error(f"✗ Unexpected error: {str(e)}")
-        return False
+    return FAILED, None, None
+
+
+def settle_folder(folder_id, task, status, etags):
+    """
+    Act on the status of the import an earlier run queued for a folder.
+
+    A completed import moves its ETag into etags. A failed or lost one is
+    dropped so the folder is imported again.
+
+    Args:
+        folder_id: Google Drive folder ID
+        task: The folder's pending import ({'taskId', 'etag', 'queuedAt'})
+        status: The task's status from get_task_status
+        etags: ETag per folder ID, updated in place
+
+    Returns:
+        bool: True if the import is finished (either way), False if it is
+              still queued or running, or its status couldn't be checked
+    """
+    if status == 'completed':
+        etags[folder_id] = task['etag']
+        logger.info(f"✓ Earlier import of folder {folder_id} completed")
+        return True
+
+    if status == 'failed':
+        logger.warning(f"Earlier import of folder {folder_id} failed; importing again")
+        return True
+
+    if time.time() - task.get('queuedAt', 0) > PENDING_TASK_MAX_AGE_SEC:
+        logger.warning(f"Earlier import of folder {folder_id} never finished; importing again")
+        return True
+
+    logger.info(f"Earlier import of folder {folder_id} is still {status or 'unknown'}. Skipping.")
+    return False
+
+
+def import_from_folders():
+    """
+    Import every folder in GOOGLE_FORMS_FOLDER_ID, several at a time.
+
+    A folder whose earlier import is still running is skipped rather than
+    queued again.
+
+    Returns:
+        FAILED if any folder failed, else QUEUED if any import was queued,
+        else SKIPPED
+    """
+    if not FOLDER_IDS:
+        logger.error("GOOGLE_FORMS_FOLDER_ID not set in environment")
+        return FAILED
+
+    etags, pending = _load_state()
+    # Forget folders that are no longer configured
+    pending = {folder_id: task for folder_id, task in pending.items() if folder_id in FOLDER_IDS}
+
+    with ThreadPoolExecutor(max_workers=min(FOLDER_WORKERS, len(FOLDER_IDS))) as executor:
+        statuses = list(executor.map(
+            lambda folder_id: get_task_status(pending[folder_id]['taskId']),
+            pending
+        ))
+        for folder_id, status in zip(list(pending), statuses):
+            if settle_folder(folder_id, pending[folder_id], status, etags):
+                del pending[folder_id]
+
+        folder_ids = [folder_id for folder_id in FOLDER_IDS if folder_id not in pending]
+        results = list(executor.map(
+            lambda folder_id: import_from_folder(folder_id, etags.get(folder_id)),
+            folder_ids
+        ))
+
+    # A skipped folder's ETag is current right away; a queued one only once
+    # a later run sees its task completed. A failed folder is retried in full.
+    for folder_id, (outcome, etag, task_id) in zip(folder_ids, results):
+        if outcome == SKIPPED and etag:
+            etags[folder_id] = etag
+        elif outcome == QUEUED and etag:
+            pending[folder_id] = {'taskId': task_id, 'etag': etag, 'queuedAt': time.time()}
+    _save_state(etags, pending)
+
+    outcomes = {outcome for outcome, _, _ in results}
+    for outcome in (FAILED, QUEUED):
+        if outcome in outcomes:
+            return outcome
+    return SKIPPED
 
 
 def import_from_sheets():
-    """Import resumes from Google Sheets."""
+    """Import resumes from Google Sheets. Returns QUEUED or FAILED."""
     if not SHEETS_ID:
         logger.error("GOOGLE_SHEETS_ID not set in environment")
-        return False
+        return FAILED
 
     logger.info(f"Importing resumes from Google Sheets: {SHEETS_ID}")
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_URL}/api/training/google-forms/import-sheets",
-            headers={
-                "Authorization": f"Bearer {ADMIN_TOKEN}",
-                "Content-Type": "application/json"
-            },
             json={
                 "spreadsheetId": SHEETS_ID,
                 "sheetName": "Form Responses 1",
                 "fileUrlColumn": "Upload Your Resume"
             },
-            timeout=300  # 5 minutes timeout
+            headers={'Idempotency-Key': str(uuid.uuid4())},
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+            stream=True
         )
 
-        if response.status_code == 201:
-            data = response.json()
-            logger.info(f"✓ Successfully imported {data['filesUploaded']} resumes")
-            logger.info(f"  Corpus ID: {data['corpusId']}")
-
-            if data['filesFailed'] > 0:
-                logger.warning(f"  {data['filesFailed']} files failed to import")
-                logger.warning(f"  Failed files: {data.get('failedFiles', [])}")
-
-            return True
-        else:
-            logger.error(f"✗ Import failed: {response.status_code}")
-            logger.error(f"  Response: {response.text}")
-            return False
+        return _report_import(response)[0]
 
-    except requests.exceptions.Timeout:
-        logger.error("✗ Request timed out after 5 minutes")
-        return False
+    except requests.exceptions.ConnectTimeout:
+        logger.error(f"✗ Could not connect to {API_URL} within {CONNECT_TIMEOUT:g}s")
+        return FAILED
+    except requests.exceptions.ReadTimeout:
+        logger.error(f"✗ Import did not respond within {READ_TIMEOUT:g}s")
+        return FAILED
     except requests.exceptions.RequestException as e:
         logger.error(f"✗ Request error: {str(e)}")
-        return False
+        return FAILED
     except Exception as e:
         logger.error(f"✗ Unexpected error: {str(e)}")
-        return False
+        return FAILED
 
 
-def check_folder_info():
-    """Check folder information before importing."""
-    if not FOLDER_ID:
-        return None
+def acquire_lock():
+    """
+    Take the import lock without waiting.
 
+    Returns:
+        int: Lock file descriptor to keep open, or None if another import holds it
+    """
+    lock_fd = os.open(IMPORT_LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
     try:
-        response = requests.get(
-            f"{API_URL}/api/training/google-forms/folder-info/{FOLDER_ID}",
-            headers={"Authorization": f"Bearer {ADMIN_TOKEN}"},
-            timeout=30
-        )
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(lock_fd)
+        return None
+    return lock_fd
 
-        if response.status_code == 200:
-            data = response.json()
-            folder = data.get('folder', {})
-            logger.info(f"Folder: {folder.get('name')}")
-            logger.info(f"Resume count: {folder.get('resumeCount')}")
-            return folder
+
+def run_import():
+    """Run the configured import once. Returns QUEUED, SKIPPED or FAILED."""
+    if IMPORT_METHOD == 'sheets':
+        return import_from_sheets()
+    return import_from_folders()
+
+
+def run_forever():
+    """
+    Poll for new resumes until SIGTERM or SIGINT.
+
+    Keeps the process, its settings and the pooled connection alive between
+    polls. The wait starts at POLL_BASE_SEC, doubles after every poll that
+    queued nothing (up to POLL_MAX_SEC) and resets once an import is queued.
+    """
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping after the current poll")
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    interval = POLL_BASE_SEC
+    while not stopping.is_set():
+        if run_import() == QUEUED:
+            interval = POLL_BASE_SEC
         else:
-            logger.warning(f"Could not fetch folder info: {response.status_code}")
-            return None
+            interval = min(POLL_MAX_SEC, interval * 2)
 
-    except Exception as e:
-        logger.warning(f"Error checking folder info: {str(e)}")
-        return None
+        logger.info(f"Next poll in {interval:g}s")
+        stopping.wait(interval)
+
+    logger.info("Import daemon stopped")
 
 
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Import resumes from Google Forms.")
+    parser.add_argument('--daemon', action='store_true',
+                        help="keep running and poll instead of importing once")
+    args = parser.parse_args()
+
     logger.info("=" * 60)
     logger.info("Google Forms Resume Import")
     logger.info("=" * 60)
@@ -178,18 +480,18 @@ def main():
         logger.error("Please set ADMIN_TOKEN in .env file")
         sys.exit(1)
 
-    # Check folder info if using folder method
-    if IMPORT_METHOD == 'folder':
-        folder_info = check_folder_info()
-        if folder_info and folder_info.get('resumeCount', 0) == 0:
-            logger.info("No new resumes found in folder. Exiting.")
-            sys.exit(0)
+    # Released when the process exits
+    lock_fd = acquire_lock()
+    if lock_fd is None:
+        logger.info("Another import is already running. Exiting.")
+        sys.exit(0)
+
+    if args.daemon:
+        run_forever()
+        sys.exit(0)
 
     # Run import
-    if IMPORT_METHOD == 'sheets':
-        success = import_from_sheets()
-    else:
-        success = import_from_folder()
+    success = run_import() != FAILED
 
     # Exit with appropriate code
     if success:
@@ -8,12 +8,66 @@ Additional Free Course Sources
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional
 import logging
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
 logger = logging.getLogger(__name__)
 
+# Shared across MITOpenCourseWare instances (the aggregator creates its own)
+# so repeated OCW searches reuse a kept-alive connection instead of redoing
+# the TCP/TLS handshake
+_ocw_session = requests.Session()
+_ocw_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_ocw_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+
+def _has_class(name):
+    """XPath predicate matching elements whose class list contains name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# OCW search results are queried with XPaths compiled once at import, so
+# matching runs in libxml2 rather than walking the tree in Python. Each list
+# is tried in order, since MIT OCW frequently updates its HTML structure.
+OCW_COURSE_XPATHS = [
+    etree.XPath(f"//li[{_has_class('course-item')}]"),
+    etree.XPath(f"//article[{_has_class('course')}]"),
+    etree.XPath(f"//div[{_has_class('course-card')}]"),
+    etree.XPath(f"//*[{_has_class('course')}]")
+]
+OCW_TITLE_XPATHS = [
+    etree.XPath('.//h2'),
+    etree.XPath('.//h3'),
+    etree.XPath(f".//a[{_has_class('course-title')}]"),
+    etree.XPath('.//a')
+]
+OCW_LINK_XPATH = etree.XPath('.//a[@href]')
+OCW_DESCRIPTION_XPATHS = [
+    etree.XPath(f".//p[{_has_class('description')}]"),
+    etree.XPath(f".//div[{_has_class('description')}]"),
+    etree.XPath('.//p')
+]
+# Visible text only: inline <script>/<style> contents aren't course text
+OCW_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]')
+
+
+def _first_match(element, xpaths):
+    """Return the first element found by the first XPath that matches, or None."""
+    for xpath in xpaths:
+        matches = xpath(element)
+        if matches:
+            return matches[0]
+    return None
+
+
+def _stripped_text(element):
+    """Element text with each piece stripped, skipping <script> and <style> contents."""
+    return ''.join(text.strip() for text in OCW_TEXT_XPATH(element))
+
 
 class MITOpenCourseWare:
     """
@@ -48,48 +102,29 @@ class MITOpenCourseWare:
             search_url = f"{self.base_url}/search/"
             params = {'q': query, 'type': 'course'}
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-
-            response = requests.get(search_url, params=params, headers=headers, timeout=15)
+            response = _ocw_session.get(search_url, params=params, timeout=15)
 
             if response.status_code != 200:
                 logger.warning(f"MIT OCW returned status {response.status_code}")
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Passing bytes lets lxml detect the page encoding itself
+            tree = html.document_fromstring(response.content)
 
             # Try multiple selectors for course results
-            # MIT OCW frequently updates their HTML structure
-            course_elements = (
-                soup.find_all('li', class_='course-item', limit=limit) or
-                soup.find_all('article', class_='course', limit=limit) or
-                soup.find_all('div', class_='course-card', limit=limit) or
-                soup.select('.search-results .course', limit=limit)
-            )
+            course_elements = []
+            for xpath in OCW_COURSE_XPATHS:
+                course_elements = xpath(tree)[:limit]
+                if course_elements:
+                    break
 
             for element in course_elements:
                 try:
-                    # Try to find title
-                    title_elem = (
-                        element.find('h2') or
-                        element.find('h3') or
-                        element.find('a', class_='course-title') or
-                        element.find('a')
-                    )
-
-                    # Try to find link
-                    link_elem = element.find('a', href=True)
-
-                    # Try to find description
-                    desc_elem = (
-                        element.find('p', class_='description') or
-                        element.find('div', class_='description') or
-                        element.find('p')
-                    )
-
-                    if title_elem and link_elem:
+                    title_elem = _first_match(element, OCW_TITLE_XPATHS)
+                    link_elem = _first_match(element, [OCW_LINK_XPATH])
+                    desc_elem = _first_match(element, OCW_DESCRIPTION_XPATHS)
+
+                    if title_elem is not None and link_elem is not None:
                         href = link_elem.get('href', '')
                         full_url = f'{self.base_url}{href}' if href.startswith('/') else href
 
@@ -98,8 +133,8 @@ class MITOpenCourseWare:
 
                         course = {
                             'id': f'mit_ocw_{course_id}',
-                            'title': title_elem.get_text(strip=True),
-                            'description': desc_elem.get_text(strip=True) if desc_elem else f'MIT OpenCourseWare course on {query}',
+                            'title': _stripped_text(title_elem),
+                            'description': _stripped_text(desc_elem) if desc_elem is not None else f'MIT OpenCourseWare course on {query}',
                             'provider': 'MIT OpenCourseWare',
                             'url': full_url,
                             'thumbnail': 'https://ocw.mit.edu/static_shared/images/favicon.ico',
@@ -65,13 +65,9 @@ class AuthService:
             refresh_token = create_refresh_token(identity=str(user_id))
 
             # Get created user
-            user = User.find_by_id(user_id)
+            user = User.find_by_id(user_id, User.PUBLIC_PROJECTION)
             user_data = serialize_document(user)
 
-            # Remove password hash from response
-            if 'password_hash' in user_data:
-                del user_data['password_hash']
-
             return {
                 'message': 'User registered successfully',
                 'user': user_data,
@@ -150,7 +146,7 @@ class AuthService:
             tuple: (response_data, status_code)
         """
         # Verify user exists
-        user = User.find_by_id(user_id)
+        user = User.find_by_id(user_id, {'isActive': 1})
         if not user:
             return format_error_response("User not found", 404)
 
@@ -177,15 +173,11 @@ class AuthService:
         Returns:
             tuple: (response_data, status_code)
         """
-        user = User.find_by_id(user_id)
+        user = User.find_by_id(user_id, User.PUBLIC_PROJECTION)
         if not user:
             return format_error_response("User not found", 404)
 
-        # Serialize and clean user data
+        # Serialize user data
         user_data = serialize_document(user)
 
-        # Remove password hash
-        if 'password_hash' in user_data:
-            del user_data['password_hash']
-
         return {'user': user_data}, 200
@@ -94,17 +94,15 @@ class AutoApplyService:
                 application_data
             )
 
-            # Step 5: Update user analytics
+            # Step 5: Update user analytics and track skill gaps (for learning
+            # recommendations) in a single write
             try:
-                EnhancedUser.increment_analytics(user_id, 'autoApplications')
-                EnhancedUser.increment_analytics(user_id, 'totalApplications')
+                missing_skills = self._find_skill_gaps(job_data, user_profile)
+                EnhancedUser.record_auto_application(user_id, user_profile, missing_skills)
             except Exception as e:
                 logger.error(f"Failed to update analytics for user {user_id}: {str(e)}")
                 # Don't fail the entire application if analytics update fails
 
-            # Step 6: Track skill gaps (for learning recommendations)
-            self._track_skill_gaps(user_id, job_data, user_profile)
-
             logger.info(f"Successfully auto-applied to job {job_id} for user {user_id}")
 
             return {
@@ -138,7 +136,7 @@ class AutoApplyService:
             resumes = user_profile['resumes']
 
             # Check for default/selected version
-            default_version = resumes.get('defaultVersion')
+            default_version = User.get_default_resume(user_profile)
             if default_version:
                 return default_version
 
@@ -211,66 +209,57 @@ class AutoApplyService:
                 'error': str(e)
             }
 
-    def _track_skill_gaps(self, user_id, job_data, user_profile):
+    def _find_skill_gaps(self, job_data, user_profile):
         """
-        Track skill gaps based on job requirements vs user skills.
+        Find skill gaps based on job requirements vs user skills.
         This helps with course recommendations later.
 
         Args:
-            user_id: User ID
             job_data: Job details
             user_profile: User profile
+
+        Returns:
+            list: Job requirements the user doesn't have a matching skill for
         """
-        try:
-            # Get job requirements/skills
-            job_requirements = job_data.get('requirements', [])
-            if isinstance(job_requirements, str):
-                # If requirements is a string, split it
-                job_requirements = [req.strip() for req in job_requirements.split(',')]
-
-            # Get user's current skills from profile or top-level
-            user_skills = []
-
-            # Check profile.skills first (from onboarding)
-            profile = user_profile.get('profile', {})
-            if profile.get('skills'):
-                skills_data = profile['skills']
-                user_skills = [
-                    skill.get('name', skill) if isinstance(skill, dict) else skill
-                    for skill in skills_data
-                ]
-            # Fallback to top-level skills (legacy)
-            elif 'skills' in user_profile:
-                user_skills = [
-                    skill.get('name', skill) if isinstance(skill, dict) else skill
-                    for skill in user_profile.get('skills', [])
-                ]
-
-            # Find missing skills (simplified - could be enhanced with NLP)
-            for requirement in job_requirements:
-                requirement_lower = requirement.lower()
-
-                # Check if user has this skill
-                has_skill = any(
-                    skill.lower() in requirement_lower or requirement_lower in skill.lower()
-                    for skill in user_skills
-                )
-
-                if not has_skill:
-                    # Add as skill gap (with medium priority by default)
-                    try:
-                        EnhancedUser.add_skill_gap(
-                            user_id,
-                            skill=requirement,
-                            priority='medium',
-                            frequency=1
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to add skill gap: {str(e)}")
+        # Get job requirements/skills
+        job_requirements = job_data.get('requirements', [])
+        if isinstance(job_requirements, str):
+            # If requirements is a string, split it
+            job_requirements = [req.strip() for req in job_requirements.split(',')]
+
+        # Get user's current skills from profile or top-level
+        user_skills = []
+
+        # Check profile.skills first (from onboarding)
+        profile = user_profile.get('profile', {})
+        if profile.get('skills'):
+            skills_data = profile['skills']
+            user_skills = [
+                skill.get('name', skill) if isinstance(skill, dict) else skill
+                for skill in skills_data
+            ]
+        # Fallback to top-level skills (legacy)
+        elif 'skills' in user_profile:
+            user_skills = [
+                skill.get('name', skill) if isinstance(skill, dict) else skill
+                for skill in user_profile.get('skills', [])
+            ]
+
+        # Find missing skills (simplified - could be enhanced with NLP)
+        missing_skills = []
+        for requirement in job_requirements:
+            requirement_lower = requirement.lower()
+
+            # Check if user has this skill
+            has_skill = any(
+                skill.lower() in requirement_lower or requirement_lower in skill.lower()
+                for skill in user_skills
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to track skill gaps: {str(e)}")
-            # Don't fail the application process if skill tracking fails
+            if not has_skill:
+                missing_skills.append(requirement)
+
+        return missing_skills
 
     def can_auto_apply(self, user_id):
         """
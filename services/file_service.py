@@ -2,11 +2,15 @@
 import os
 from PIL import Image
 import io
+from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
 from werkzeug.utils import secure_filename
 from config.settings import Config
 from utils.helpers import generate_unique_filename, get_file_extension
 from utils.validators import validate_file_type
 
+# Bytes read from the request body at a time when streaming uploads
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class FileService:
     """Handle file uploads and storage."""
@@ -251,3 +255,75 @@ class FileService:
             return False, f"File too large. Maximum size: {max_mb}MB"
 
         return True, None
+
+    @staticmethod
+    def stream_multipart_files(stream, boundary, dest_dir, file_field, allowed_extensions):
+        """
+        Parse a multipart/form-data body straight from the request stream.
+
+        Parts of file_field are written directly into dest_dir as they
+        arrive, so uploads aren't first spooled to temporary files. Other
+        form fields are collected as strings.
+
+        Args:
+            stream: Request body stream
+            boundary: Multipart boundary from the Content-Type header
+            dest_dir: Directory to write uploaded files into
+            file_field: Name of the form field holding the files
+            allowed_extensions: Allowed file extensions (lowercase, no dot)
+
+        Returns:
+            tuple: (fields, saved_paths, rejected_filenames)
+        """
+        decoder = MultipartDecoder(boundary.encode('latin-1'))
+
+        fields = {}
+        saved_paths = []
+        rejected_filenames = []
+
+        # What the current part's data goes into: a file, a field buffer,
+        # or nothing (skipped part)
+        current_file = None
+        current_field = None
+
+        try:
+            while True:
+                chunk = stream.read(STREAM_CHUNK_SIZE)
+                decoder.receive_data(chunk or None)
+
+                event = decoder.next_event()
+                while not isinstance(event, (Epilogue, NeedData)):
+                    if isinstance(event, File):
+                        filename = secure_filename(event.filename or '')
+                        if event.name != file_field or not filename:
+                            current_file = None
+                        elif get_file_extension(filename) not in allowed_extensions:
+                            rejected_filenames.append(filename)
+                            current_file = None
+                        else:
+                            file_path = os.path.join(dest_dir, filename)
+                            current_file = open(file_path, 'wb')
+                            saved_paths.append(file_path)
+                    elif isinstance(event, Field):
+                        current_field = (event.name, bytearray())
+                    elif isinstance(event, Data):
+                        if current_file is not None:
+                            current_file.write(event.data)
+                            if not event.more_data:
+                                current_file.close()
+                                current_file = None
+                        elif current_field is not None:
+                            current_field[1].extend(event.data)
+                            if not event.more_data:
+                                fields[current_field[0]] = current_field[1].decode('utf-8', 'replace')
+                                current_field = None
+
+                    event = decoder.next_event()
+
+                if not chunk or isinstance(event, Epilogue):
+                    break
+        finally:
+            if current_file is not None:
+                current_file.close()
+
+        return fields, saved_paths, rejected_filenames
@@ -1,19 +1,30 @@
 """Google Forms/Drive/Sheets integration service for collecting training resumes."""
 import os
+import hashlib
 import logging
-import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from bson import ObjectId
+from werkzeug.utils import secure_filename
 
 from models.training import TrainingCorpus, TrainingResume
 from services.resume_parser import ResumeParser
 
 logger = logging.getLogger(__name__)
 
+# Drive files downloaded at once during an import
+DRIVE_DOWNLOAD_WORKERS = 16
+
+# httplib2 connections aren't thread-safe, so each download thread gets its own
+_thread_local = threading.local()
+
 
 class GoogleFormsService:
     """Service for importing resumes from Google Forms/Drive/Sheets."""
@@ -83,7 +94,8 @@ class GoogleFormsService:
         folder_id: str,
         user_id: str,
         corpus_name: str = "Google Forms Import",
-        category: str = "general"
+        category: str = "general",
+        concurrency: int = DRIVE_DOWNLOAD_WORKERS
     ) -> Dict:
         """
         Import all resume files from a Google Drive folder.
@@ -93,6 +105,7 @@ class GoogleFormsService:
             user_id: User ID importing the resumes
             corpus_name: Name for the training corpus
             category: Category for the corpus
+            concurrency: Drive files downloaded at once
 
         Returns:
             Dictionary with import results
@@ -129,64 +142,54 @@ class GoogleFormsService:
             uploaded_files = []
             failed_files = []
 
-            # Process each file
-            for file_meta in files:
-                try:
-                    # Download file
-                    file_id = file_meta['id']
-                    file_name = file_meta['name']
-
-                    logger.info(f"Downloading file: {file_name}")
-
-                    request = self.drive_service.files().get_media(fileId=file_id)
-                    file_content = io.BytesIO()
-                    downloader = MediaIoBaseDownload(file_content, request)
-
-                    done = False
-                    while not done:
-                        status, done = downloader.next_chunk()
-
-                    # Save file locally
-                    file_path = os.path.join(corpus_path, file_name)
-                    with open(file_path, 'wb') as f:
-                        f.write(file_content.getvalue())
-
-                    # Parse resume
-                    parsed = self.resume_parser.parse_resume(file_path)
-
-                    # Calculate quality score
-                    quality_score = self._calculate_quality_score(parsed)
-
-                    # Create training resume record
-                    training_resume = {
-                        'corpusId': corpus_id,
-                        'filename': file_name,
-                        'filePath': file_path,
-                        'parsedData': parsed,
-                        'qualityScore': quality_score,
-                        'googleDriveFileId': file_id,
-                        'uploadedAt': datetime.utcnow(),
-                        'source': 'google_forms'
-                    }
-
-                    # Save to database
-                    resume_id = TrainingResume.create(training_resume)
-
-                    uploaded_files.append({
-                        'filename': file_name,
-                        'resumeId': str(resume_id),
-                        'qualityScore': quality_score,
-                        'googleDriveFileId': file_id
-                    })
-
-                    logger.info(f"Successfully imported: {file_name}")
-
-                except Exception as e:
-                    logger.error(f"Error processing file {file_meta.get('name', 'unknown')}: {str(e)}")
-                    failed_files.append({
-                        'filename': file_meta.get('name', 'unknown'),
-                        'error': str(e)
-                    })
+            # Download files in parallel and process each as it arrives
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                downloads = [
+                    executor.submit(self._download_drive_file, file_meta['id'], corpus_path, file_meta['name'])
+                    for file_meta in files
+                ]
+
+                for file_meta, download in zip(files, downloads):
+                    try:
+                        file_id = file_meta['id']
+                        file_name, file_path = download.result()
+
+                        # Parse resume
+                        parsed = self.resume_parser.parse_resume(file_path)
+
+                        # Calculate quality score
+                        quality_score = self._calculate_quality_score(parsed)
+
+                        # Create training resume record
+                        training_resume = {
+                            'corpusId': corpus_id,
+                            'filename': file_name,
+                            'filePath': file_path,
+                            'parsedData': parsed,
+                            'qualityScore': quality_score,
+                            'googleDriveFileId': file_id,
+                            'uploadedAt': datetime.utcnow(),
+                            'source': 'google_forms'
+                        }
+
+                        # Save to database
+                        resume_id = TrainingResume.create(training_resume)
+
+                        uploaded_files.append({
+                            'filename': file_name,
+                            'resumeId': str(resume_id),
+                            'qualityScore': quality_score,
+                            'googleDriveFileId': file_id
+                        })
+
+                        logger.info(f"Successfully imported: {file_name}")
+
+                    except Exception as e:
+                        logger.error(f"Error processing file {file_meta.get('name', 'unknown')}: {str(e)}")
+                        failed_files.append({
+                            'filename': file_meta.get('name', 'unknown'),
+                            'error': str(e)
+                        })
 
             # Create corpus record
             corpus_data = {
@@ -228,7 +231,8 @@ class GoogleFormsService:
         spreadsheet_id: str,
         user_id: str,
         sheet_name: str = "Form Responses 1",
-        file_url_column: str = "Resume File"
+        file_url_column: str = "Resume File",
+        concurrency: int = DRIVE_DOWNLOAD_WORKERS
     ) -> Dict:
         """
         Import resumes from Google Sheets (form responses).
@@ -238,6 +242,7 @@ class GoogleFormsService:
             user_id: User ID importing the resumes
             sheet_name: Name of the sheet/tab with form responses
             file_url_column: Column name containing file URLs
+            concurrency: Drive files downloaded at once
 
         Returns:
             Dictionary with import results
@@ -310,70 +315,54 @@ class GoogleFormsService:
             uploaded_files = []
             failed_files = []
 
-            # Process each file
-            for file_id, form_data in zip(file_ids, additional_data):
-                try:
-                    # Get file metadata
-                    file_meta = self.drive_service.files().get(
-                        fileId=file_id,
-                        fields='name, mimeType'
-                    ).execute()
-
-                    file_name = file_meta['name']
-
-                    logger.info(f"Downloading file: {file_name}")
-
-                    # Download file
-                    request = self.drive_service.files().get_media(fileId=file_id)
-                    file_content = io.BytesIO()
-                    downloader = MediaIoBaseDownload(file_content, request)
-
-                    done = False
-                    while not done:
-                        status, done = downloader.next_chunk()
-
-                    # Save file locally
-                    file_path = os.path.join(corpus_path, file_name)
-                    with open(file_path, 'wb') as f:
-                        f.write(file_content.getvalue())
-
-                    # Parse resume
-                    parsed = self.resume_parser.parse_resume(file_path)
-
-                    # Calculate quality score
-                    quality_score = self._calculate_quality_score(parsed)
-
-                    # Create training resume record
-                    training_resume = {
-                        'corpusId': corpus_id,
-                        'filename': file_name,
-                        'filePath': file_path,
-                        'parsedData': parsed,
-                        'qualityScore': quality_score,
-                        'googleDriveFileId': file_id,
-                        'formData': form_data,  # Store additional form responses
-                        'uploadedAt': datetime.utcnow(),
-                        'source': 'google_forms'
-                    }
-
-                    # Save to database
-                    resume_id = TrainingResume.create(training_resume)
-
-                    uploaded_files.append({
-                        'filename': file_name,
-                        'resumeId': str(resume_id),
-                        'qualityScore': quality_score,
-                        'googleDriveFileId': file_id
-                    })
-
-                    logger.info(f"Successfully imported: {file_name}")
-
-                except Exception as e:
-                    logger.error(f"Error processing file {file_id}: {str(e)}")
-                    failed_files.append({
-                        'fileId': file_id,
-                        'error': str(e)
-                    })
+            # Download files in parallel and process each as it arrives
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                downloads = [
+                    executor.submit(self._download_drive_file, file_id, corpus_path)
+                    for file_id in file_ids
+                ]
+
+                for file_id, form_data, download in zip(file_ids, additional_data, downloads):
+                    try:
+                        file_name, file_path = download.result()
+
+                        # Parse resume
+                        parsed = self.resume_parser.parse_resume(file_path)
+
+                        # Calculate quality score
+                        quality_score = self._calculate_quality_score(parsed)
+
+                        # Create training resume record
+                        training_resume = {
+                            'corpusId': corpus_id,
+                            'filename': file_name,
+                            'filePath': file_path,
+                            'parsedData': parsed,
+                            'qualityScore': quality_score,
+                            'googleDriveFileId': file_id,
+                            'formData': form_data,  # Store additional form responses
+                            'uploadedAt': datetime.utcnow(),
+                            'source': 'google_forms'
+                        }
+
+                        # Save to database
+                        resume_id = TrainingResume.create(training_resume)
+
+                        uploaded_files.append({
+                            'filename': file_name,
+                            'resumeId': str(resume_id),
+                            'qualityScore': quality_score,
+                            'googleDriveFileId': file_id
+                        })
+
+                        logger.info(f"Successfully imported: {file_name}")
+
+                    except Exception as e:
+                        logger.error(f"Error processing file {file_id}: {str(e)}")
+                        failed_files.append({
+                            'fileId': file_id,
+                            'error': str(e)
+                        })
 
             # Create corpus record
             corpus_data = {
@@ -410,6 +399,63 @@ class GoogleFormsService:
                 'error': str(e)
             }
 
+    def _drive_http(self) -> AuthorizedHttp:
+        """Get this thread's authorized HTTP connection for Drive calls."""
+        http = getattr(_thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            _thread_local.http = http
+        return http
+
+    def _download_drive_file(
+        self,
+        file_id: str,
+        corpus_path: str,
+        file_name: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Download a Drive file into the corpus directory.
+
+        Safe to call from worker threads: every request goes through the
+        calling thread's own connection, and the file is written to disk
+        chunk by chunk.
+
+        Args:
+            file_id: Google Drive file ID
+            corpus_path: Directory to save the file in
+            file_name: File name, looked up from Drive if not given
+
+        Returns:
+            Tuple of (Drive file name, local file path)
+        """
+        http = self._drive_http()
+
+        if file_name is None:
+            file_meta = self.drive_service.files().get(
+                fileId=file_id,
+                fields='name, mimeType'
+            ).execute(http=http)
+            file_name = file_meta['name']
+
+        logger.info(f"Downloading file: {file_name}")
+
+        request = self.drive_service.files().get_media(fileId=file_id)
+        request.http = http
+
+        # Drive allows duplicate names within a folder and the name is
+        # user-supplied, so the local name is the file ID plus a sanitized
+        # copy of it: unique per download and safe to join into the path
+        local_name = f"{file_id}_{secure_filename(file_name) or 'resume'}"
+        file_path = os.path.join(corpus_path, local_name)
+        with open(file_path, 'wb') as f:
+            downloader = MediaIoBaseDownload(f, request)
+
+            done = False
+            while not done:
+                status, done = downloader.next_chunk()
+
+        return file_name, file_path
+
     def get_folder_info(self, folder_id: str) -> Dict:
         """
         Get information about a Google Drive folder.
@@ -451,7 +497,12 @@ class GoogleFormsService:
                     'name': folder['name'],
                     'createdTime': folder.get('createdTime'),
                     'modifiedTime': folder.get('modifiedTime'),
-                    'resumeCount': len(files)
+                    'resumeCount': len(files),
+                    # Changes whenever a resume is added or removed, so
+                    # callers can tell whether the folder needs re-importing
+                    'fileIdsHash': hashlib.sha256(
+                        '\n'.join(sorted(f['id'] for f in files)).encode()
+                    ).hexdigest()
                 }
             }
 
@@ -537,3 +588,22 @@ class GoogleFormsService:
             score += 1.0
 
         return round(score / max_score, 2)
+
+
+_shared_service = None
+
+
+def get_google_forms_service() -> GoogleFormsService:
+    """
+    Get the process-wide GoogleFormsService.
+
+    Building the Drive and Sheets clients loads their discovery documents,
+    so each process builds them once and every import reuses them.
+
+    Returns:
+        Shared GoogleFormsService instance
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = GoogleFormsService()
+    return _shared_service
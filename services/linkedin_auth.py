@@ -1,9 +1,19 @@
 """LinkedIn OAuth authentication service."""
 import os
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from authlib.integrations.flask_client import OAuth
 from flask import session
 
+# Timeout (seconds) for LinkedIn API calls
+LINKEDIN_TIMEOUT = 10
+
+# Shared across service instances (routes create one per request) so
+# LinkedIn connections stay alive and skip the TCP/TLS handshake
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
 
 class LinkedInAuthService:
     """Handle LinkedIn OAuth 2.0 authentication."""
@@ -73,7 +83,7 @@ class LinkedInAuthService:
             'client_secret': self.client_secret
         }
 
-        response = requests.post(token_url, data=data)
+        response = _session.post(token_url, data=data, timeout=LINKEDIN_TIMEOUT)
         response.raise_for_status()
 
         return response.json()
@@ -92,17 +102,20 @@ class LinkedInAuthService:
             'Authorization': f'Bearer {access_token}'
         }
 
-        # Get basic profile
         profile_url = 'https://api.linkedin.com/v2/me'
-        profile_response = requests.get(profile_url, headers=headers)
-        profile_response.raise_for_status()
-        profile_data = profile_response.json()
-
-        # Get email
         email_url = 'https://api.linkedin.com/v2/emailAddress?q=members&projection=(elements*(handle~))'
-        email_response = requests.get(email_url, headers=headers)
-        email_response.raise_for_status()
-        email_data = email_response.json()
+
+        def fetch(url):
+            response = _session.get(url, headers=headers, timeout=LINKEDIN_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+
+        # Get basic profile and email concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            profile_future = executor.submit(fetch, profile_url)
+            email_future = executor.submit(fetch, email_url)
+            profile_data = profile_future.result()
+            email_data = email_future.result()
 
         # Extract email
         email = None
@@ -159,7 +172,7 @@ class LinkedInAuthService:
                 'token': access_token
             }
 
-            response = requests.post(revoke_url, data=data)
+            response = _session.post(revoke_url, data=data, timeout=LINKEDIN_TIMEOUT)
             return response.status_code == 200
 
         except Exception as e:
@@ -2,12 +2,13 @@
 import os
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 import zipfile
-import io
 from bson import ObjectId
 
 from models.training import TrainingCorpus, TrainingResume
@@ -15,6 +16,26 @@ from services.resume_parser import ResumeParser
 
 logger = logging.getLogger(__name__)
 
+# File types imported from downloaded archives
+RESUME_EXTENSIONS = {'.pdf', '.docx', '.doc', '.txt'}
+
+# Downloads are written to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Shared across scraper instances (import tasks create one each) so dataset
+# downloads reuse pooled connections instead of redoing the TCP/TLS handshake
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
 
 class ResumeScraper:
     """Service for scraping and downloading resume samples from public datasets."""
@@ -23,10 +44,7 @@ class ResumeScraper:
         """Initialize resume scraper."""
         self.resume_parser = ResumeParser()
         self.training_dir = os.getenv('TRAINING_DATA_DIR', 'training_data')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session = _session
 
         # Ensure training directories exist
         os.makedirs(os.path.join(self.training_dir, 'scraped'), exist_ok=True)
@@ -323,26 +341,22 @@ class ResumeScraper:
             corpus_path = os.path.join(self.training_dir, 'scraped', corpus_id)
             os.makedirs(corpus_path, exist_ok=True)
 
-            # Download file
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
             uploaded_files = []
             failed_files = []
 
             if is_zip:
                 # Handle ZIP file
-                with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
-                    # Extract all files
-                    zip_file.extractall(corpus_path)
+                zip_path = os.path.join(corpus_path, 'download.zip')
+                self._download_to_file(url, zip_path)
 
-                    # Find all resume files
-                    resume_files = []
-                    for ext in ['*.pdf', '*.docx', '*.doc', '*.txt']:
-                        resume_files.extend(Path(corpus_path).rglob(ext))
+                with zipfile.ZipFile(zip_path) as zip_file:
+                    # Extract and process resumes one member at a time,
+                    # leaving every other file in the archive unextracted
+                    for info in zip_file.infolist():
+                        if info.is_dir() or Path(info.filename).suffix.lower() not in RESUME_EXTENSIONS:
+                            continue
 
-                    # Process each resume
-                    for file_path in resume_files:
+                        file_path = Path(zip_file.extract(info, corpus_path))
                         try:
                             parsed = self.resume_parser.parse_resume(str(file_path))
                             quality_score = self._calculate_quality_score(parsed)
@@ -372,6 +386,8 @@ class ResumeScraper:
                                 'filename': file_path.name,
                                 'error': str(e)
                             })
+
+                os.remove(zip_path)
             else:
                 # Handle single file
                 filename = url.split('/')[-1]
@@ -379,9 +395,7 @@ class ResumeScraper:
                     filename = filename.split('?')[0]
 
                 file_path = os.path.join(corpus_path, filename)
-
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
+                self._download_to_file(url, file_path)
 
                 try:
                     parsed = self.resume_parser.parse_resume(file_path)
@@ -447,6 +461,21 @@ class ResumeScraper:
                 'error': str(e)
             }
 
+    def _download_to_file(self, url: str, file_path: str):
+        """
+        Stream a download to disk without holding the body in memory.
+
+        Args:
+            url: URL to download
+            file_path: Destination path
+        """
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            with open(file_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
     def _calculate_quality_score(self, parsed_data: Dict) -> float:
         """
         Calculate quality score for a resume.
@@ -1,4 +1,5 @@
 """Comprehensive skill taxonomy covering all major industries."""
+from functools import lru_cache
 
 # Skill categories and industries
 SKILL_TAXONOMY = {
@@ -489,16 +490,94 @@ COMMON_TECHNICAL_SKILLS = {
 }
 
 
+# The taxonomy is static between deploys, so derived lookups are built once
+
+@lru_cache(maxsize=None)
+def _industry_names():
+    """Industry display names keyed by industry key."""
+    return {
+        industry_key: data['display_name']
+        for industry_key, data in SKILL_TAXONOMY.items()
+    }
+
+
+@lru_cache(maxsize=64)
+def _all_skills_flat(industry_key):
+    """Sorted unique skills for an industry (None for all) plus universal skills."""
+    all_skills = []
+
+    if industry_key:
+        # Get skills for specific industry
+        if industry_key in SKILL_TAXONOMY:
+            for category_data in SKILL_TAXONOMY[industry_key]['categories'].values():
+                all_skills.extend(category_data['skills'])
+    else:
+        # Get all skills across all industries
+        for industry_data in SKILL_TAXONOMY.values():
+            for category_data in industry_data['categories'].values():
+                all_skills.extend(category_data['skills'])
+
+    # Add soft skills
+    for category_data in UNIVERSAL_SOFT_SKILLS.values():
+        all_skills.extend(category_data['skills'])
+
+    # Add common technical skills
+    for category_data in COMMON_TECHNICAL_SKILLS.values():
+        all_skills.extend(category_data['skills'])
+
+    # Remove duplicates and sort
+    return tuple(sorted(set(all_skills)))
+
+
+@lru_cache(maxsize=None)
+def _searchable_skills():
+    """(lowercased skill, search result) pairs in taxonomy order, soft skills last."""
+    entries = []
+
+    for ind_key, industry_data in SKILL_TAXONOMY.items():
+        for cat_key, cat_data in industry_data['categories'].items():
+            for skill in cat_data['skills']:
+                entries.append((skill.lower(), {
+                    'skill': skill,
+                    'industry': industry_data['display_name'],
+                    'category': cat_data['display_name'],
+                    'industry_key': ind_key,
+                    'category_key': cat_key
+                }))
+
+    for cat_key, cat_data in UNIVERSAL_SOFT_SKILLS.items():
+        for skill in cat_data['skills']:
+            entries.append((skill.lower(), {
+                'skill': skill,
+                'industry': 'Universal',
+                'category': cat_data['display_name'],
+                'industry_key': 'universal',
+                'category_key': cat_key
+            }))
+
+    return tuple(entries)
+
+
+@lru_cache(maxsize=None)
+def _skill_locations():
+    """(industry key, category key) pairs for each skill, in taxonomy order."""
+    locations = {}
+
+    for ind_key, industry_data in SKILL_TAXONOMY.items():
+        for cat_key, cat_data in industry_data['categories'].items():
+            for skill in cat_data['skills']:
+                locations.setdefault(skill, []).append((ind_key, cat_key))
+
+    return locations
+
+
 class SkillTaxonomyService:
     """Service for managing and querying the skill taxonomy."""
 
     @staticmethod
     def get_all_industries():
         """Get list of all industries with display names."""
-        return {
-            industry_key: data['display_name']
-            for industry_key, data in SKILL_TAXONOMY.items()
-        }
+        return dict(_industry_names())
 
     @staticmethod
     def get_skills_by_industry(industry_key):
@@ -548,29 +627,7 @@ class SkillTaxonomyService:
         Returns:
             list: Flat list of all skills
         """
-        all_skills = []
-
-        if industry_key:
-            # Get skills for specific industry
-            if industry_key in SKILL_TAXONOMY:
-                for category_data in SKILL_TAXONOMY[industry_key]['categories'].values():
-                    all_skills.extend(category_data['skills'])
-        else:
-            # Get all skills across all industries
-            for industry_data in SKILL_TAXONOMY.values():
-                for category_data in industry_data['categories'].values():
-                    all_skills.extend(category_data['skills'])
-
-        # Add soft skills
-        for category_data in UNIVERSAL_SOFT_SKILLS.values():
-            all_skills.extend(category_data['skills'])
-
-        # Add common technical skills
-        for category_data in COMMON_TECHNICAL_SKILLS.values():
-            all_skills.extend(category_data['skills'])
-
-        # Remove duplicates and sort
-        return sorted(list(set(all_skills)))
+        return list(_all_skills_flat(industry_key or None))
 
     @staticmethod
     def get_soft_skills():
@@ -595,40 +652,15 @@ class SkillTaxonomyService:
             list: Matching skills with industry/category context
         """
         query_lower = query.lower()
-        results = []
-
-        # Search industry-specific skills
-        industries_to_search = [industry_key] if industry_key else SKILL_TAXONOMY.keys()
 
-        for ind_key in industries_to_search:
-            if ind_key not in SKILL_TAXONOMY:
-                continue
-
-            industry_data = SKILL_TAXONOMY[ind_key]
-            for cat_key, cat_data in industry_data['categories'].items():
-                for skill in cat_data['skills']:
-                    if query_lower in skill.lower():
-                        results.append({
-                            'skill': skill,
-                            'industry': industry_data['display_name'],
-                            'category': cat_data['display_name'],
-                            'industry_key': ind_key,
-                            'category_key': cat_key
-                        })
-
-        # Search soft skills
-        for cat_key, cat_data in UNIVERSAL_SOFT_SKILLS.items():
-            for skill in cat_data['skills']:
-                if query_lower in skill.lower():
-                    results.append({
-                        'skill': skill,
-                        'industry': 'Universal',
-                        'category': cat_data['display_name'],
-                        'industry_key': 'universal',
-                        'category_key': cat_key
-                    })
-
-        return results
+        # Industry filter applies to industry-specific skills; soft skills
+        # always match
+        return [
+            dict(entry)
+            for skill_lower, entry in _searchable_skills()
+            if query_lower in skill_lower
+            and (not industry_key or entry['industry_key'] in (industry_key, 'universal'))
+        ]
 
     @staticmethod
     def get_related_skills(skill_name, industry_key=None):
@@ -645,18 +677,9 @@ class SkillTaxonomyService:
         # Find the skill's category
         skill_context = None
 
-        industries_to_search = [industry_key] if industry_key else SKILL_TAXONOMY.keys()
-
-        for ind_key in industries_to_search:
-            if ind_key not in SKILL_TAXONOMY:
-                continue
-
-            for cat_key, cat_data in SKILL_TAXONOMY[ind_key]['categories'].items():
-                if skill_name in cat_data['skills']:
-                    skill_context = (ind_key, cat_key)
-                    break
-
-            if skill_context:
+        for ind_key, cat_key in _skill_locations().get(skill_name, []):
+            if not industry_key or ind_key == industry_key:
+                skill_context = (ind_key, cat_key)
                 break
 
         if not skill_context:
@@ -0,0 +1,268 @@
+"""
+Swipe Counter Service
+=====================
+
+Counts daily swipes in Redis instead of writing to MongoDB on every swipe.
+
+- Each user has one counter per UTC day (INCR, expires after 26 hours)
+- Counters touched since the last flush are tracked in a pending set
+- A periodic Celery task flushes them to MongoDB with one bulk_write
+
+Every function returns None when Redis is not available, so callers can
+fall back to the direct MongoDB update.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from config.database import get_users_collection
+from config.settings import Config
+from utils.cache import REDIS_KEY_PREFIX, get_redis, invalidate_shared, shared_cached
+
+logger = logging.getLogger(__name__)
+
+# Counters outlive their day so a late flush can still read them
+SWIPE_COUNTER_TTL = 93600  # 26 hours
+
+# Swipe limits are read from MongoDB at most once per minute per user, and
+# shared through Redis so a plan change can drop them for every worker
+SWIPE_LIMIT_CACHE_TTL = 60
+
+PENDING_KEY = REDIS_KEY_PREFIX + 'swipes:pending'
+FLUSH_BATCH_SIZE = 1000
+
+
+def _counter_key(user_id, day):
+    return f'{REDIS_KEY_PREFIX}swipes:{user_id}:{day}'
+
+
+def _reset_date_for(day):
+    """Midnight UTC after the given yyyymmdd day."""
+    return datetime.strptime(day, '%Y%m%d') + timedelta(days=1)
+
+
+def _load_subscription(user_id):
+    users = get_users_collection()
+    user = users.find_one({'_id': ObjectId(user_id)}, {'subscription': 1})
+    if not user:
+        return None
+    return user.get('subscription', {})
+
+
+def _load_plan_limits(user_id):
+    subscription = _load_subscription(user_id)
+    if subscription is None:
+        return None
+    return [subscription.get('plan', 'free'), subscription.get('swipeLimit', Config.FREE_SWIPE_LIMIT)]
+
+
+def _plan_limits(user_id):
+    return shared_cached(
+        f'swipe-limits:{user_id}',
+        SWIPE_LIMIT_CACHE_TTL,
+        lambda: _load_plan_limits(user_id)
+    )
+
+
+def _seed_counter(client, key, user_id, day):
+    """Start today's counter from the count already stored in MongoDB."""
+    subscription = _load_subscription(user_id) or {}
+    reset_date = subscription.get('resetDate')
+    swipes_used = 0
+    if reset_date and reset_date == _reset_date_for(day):
+        swipes_used = subscription.get('swipesUsed', 0)
+
+    client.set(key, swipes_used, ex=SWIPE_COUNTER_TTL, nx=True)
+
+
+def track_swipe(user_id):
+    """
+    Count one swipe for today, enforcing the user's daily limit.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        dict: Subscription fields after the swipe ('plan', 'swipeLimit',
+              'swipesUsed', 'resetDate') and 'allowed' (False if the limit
+              was already reached), or None if Redis or the user is unavailable
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    limits = _plan_limits(user_id)
+    if limits is None:
+        return None
+    plan, swipe_limit = limits
+
+    day = datetime.utcnow().strftime('%Y%m%d')
+    key = _counter_key(user_id, day)
+
+    try:
+        if not client.exists(key):
+            _seed_counter(client, key, user_id, day)
+
+        swipes_used = client.incr(key)
+    except Exception as e:
+        logger.warning(f"Redis swipe counter failed for {user_id}: {str(e)}")
+        return None
+
+    allowed = swipe_limit == -1 or swipes_used <= swipe_limit
+    try:
+        if allowed:
+            client.expire(key, SWIPE_COUNTER_TTL)
+            client.sadd(PENDING_KEY, f'{user_id}:{day}')
+        else:
+            # Over the limit, so this swipe doesn't count
+            swipes_used = client.decr(key)
+    except Exception as e:
+        # incr already counted the swipe, so report the Redis result rather
+        # than return None and have the caller count it in MongoDB too. A
+        # missed sadd is picked up by the user's next swipe, which re-marks
+        # the counter for flushing.
+        logger.warning(f"Redis swipe counter failed after counting for {user_id}: {str(e)}")
+        if not allowed:
+            swipes_used = swipe_limit
+
+    return {
+        'allowed': allowed,
+        'plan': plan,
+        'swipeLimit': swipe_limit,
+        'swipesUsed': swipes_used,
+        'resetDate': _reset_date_for(day)
+    }
+
+
+def untrack_swipe(user_id):
+    """
+    Give back one swipe counted today by track_swipe.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        bool: True once the counter is decremented, or None if Redis or
+              today's counter is unavailable
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    day = datetime.utcnow().strftime('%Y%m%d')
+    key = _counter_key(user_id, day)
+
+    try:
+        if not client.exists(key):
+            return None
+        client.decr(key)
+        client.sadd(PENDING_KEY, f'{user_id}:{day}')
+    except Exception as e:
+        logger.warning(f"Redis swipe counter refund failed for {user_id}: {str(e)}")
+        return None
+
+    return True
+
+
+def get_swipe_count(user_id):
+    """
+    Get today's swipe count from Redis.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        tuple: (swipes_used, reset_date), or None if there is no counter
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    day = datetime.utcnow().strftime('%Y%m%d')
+    try:
+        swipes_used = client.get(_counter_key(user_id, day))
+    except Exception as e:
+        logger.warning(f"Redis swipe counter read failed for {user_id}: {str(e)}")
+        return None
+
+    if swipes_used is None:
+        return None
+    return int(swipes_used), _reset_date_for(day)
+
+
+def forget_subscription(user_id):
+    """
+    Drop the cached swipe limit after a plan change, for every worker.
+
+    Args:
+        user_id: User ID
+    """
+    invalidate_shared(f'swipe-limits:{user_id}')
+
+
+def flush_swipe_counts():
+    """
+    Write pending Redis swipe counters to MongoDB.
+
+    Returns:
+        int: Number of counters flushed
+    """
+    client = get_redis()
+    if client is None:
+        return 0
+
+    users = get_users_collection()
+    flushed = 0
+
+    while True:
+        members = client.spop(PENDING_KEY, FLUSH_BATCH_SIZE)
+        if not members:
+            break
+
+        keys = [_counter_key(*member.rsplit(':', 1)) for member in members]
+        counts = client.mget(keys)
+
+        operations = []
+        for member, count in zip(members, counts):
+            if count is None:
+                continue
+            user_id, day = member.rsplit(':', 1)
+            reset_date = _reset_date_for(day)
+
+            # Never overwrite a newer day's count; within the same day keep
+            # the larger count so swipes recorded directly in MongoDB stick
+            same_day = {'$eq': ['$subscription.resetDate', reset_date]}
+            operations.append(UpdateOne(
+                {
+                    '_id': ObjectId(user_id),
+                    '$or': [
+                        {'subscription.resetDate': None},
+                        {'subscription.resetDate': {'$lte': reset_date}}
+                    ]
+                },
+                [{
+                    '$set': {
+                        'subscription.swipesUsed': {'$cond': [
+                            same_day,
+                            {'$max': [{'$ifNull': ['$subscription.swipesUsed', 0]}, int(count)]},
+                            int(count)
+                        ]},
+                        'subscription.resetDate': reset_date,
+                        'updatedAt': datetime.utcnow()
+                    }
+                }]
+            ))
+
+        if operations:
+            try:
+                users.bulk_write(operations, ordered=False)
+            except Exception:
+                # Put the batch back so the next flush retries it
+                client.sadd(PENDING_KEY, *members)
+                raise
+            flushed += len(operations)
+
+    return flushed
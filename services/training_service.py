@@ -2,16 +2,20 @@
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
-from werkzeug.utils import secure_filename
+from typing import Iterator, List, Dict, Optional, Tuple
 from bson import ObjectId
 
 from models.training import TrainingCorpus, TrainingJob, TrainingResume
 from services.resume_parser import ResumeParser
 from config.database import get_training_collection, get_users_collection
+from utils.cache import cached
 
 logger = logging.getLogger(__name__)
 
+# Extracted patterns only move as the training corpus grows, so each
+# pattern type is recomputed at most once per TTL per worker
+PATTERN_CACHE_TTL = 300
+
 
 class TrainingService:
     """Service for managing training data and progressive learning."""
@@ -26,54 +30,54 @@ class TrainingService:
         os.makedirs(os.path.join(self.training_dir, 'models'), exist_ok=True)
         os.makedirs(os.path.join(self.training_dir, 'checkpoints'), exist_ok=True)
 
+    def create_corpus_dir(self) -> Tuple[str, str]:
+        """
+        Reserve a new corpus ID and create its resume directory.
+
+        Returns:
+            Tuple of (corpus ID, directory path)
+        """
+        corpus_id = str(ObjectId())
+        corpus_path = os.path.join(self.training_dir, 'resumes', corpus_id)
+        os.makedirs(corpus_path, exist_ok=True)
+        return corpus_id, corpus_path
+
     def upload_corpus(
         self,
         user_id: str,
-        files: List,
+        corpus_id: str,
+        file_paths: List[str],
         corpus_name: str,
         description: str = '',
-        category: str = 'general'
+        category: str = 'general',
+        rejected_filenames: Optional[List[str]] = None
     ) -> Dict:
         """
-        Upload multiple resumes to create a training corpus.
+        Create a training corpus from resumes already saved to its directory.
 
         Args:
             user_id: ID of user uploading
-            files: List of file uploads
+            corpus_id: Corpus ID from create_corpus_dir
+            file_paths: Paths of the saved resume files
             corpus_name: Name for this corpus
             description: Optional description
             category: Category (success, failed, general)
+            rejected_filenames: Uploads skipped for having an invalid file type
 
         Returns:
             Dictionary with corpus ID and upload results
         """
         try:
             uploaded_files = []
-            failed_files = []
-
-            # Create corpus directory
-            corpus_id = str(ObjectId())
-            corpus_path = os.path.join(self.training_dir, 'resumes', corpus_id)
-            os.makedirs(corpus_path, exist_ok=True)
+            failed_files = [
+                {'filename': filename, 'error': 'Invalid file type'}
+                for filename in rejected_filenames or []
+            ]
 
             # Process each file
-            for file in files:
+            for file_path in file_paths:
+                filename = os.path.basename(file_path)
                 try:
-                    if file.filename == '':
-                        continue
-
-                    filename = secure_filename(file.filename)
-                    if not filename.lower().endswith(('.pdf', '.docx', '.doc')):
-                        failed_files.append({
-                            'filename': filename,
-                            'error': 'Invalid file type'
-                        })
-                        continue
-
-                    # Save file
-                    file_path = os.path.join(corpus_path, filename)
-                    file.save(file_path)
-
                     # Parse resume
                     parsed = self.resume_parser.parse_resume(file_path)
 
@@ -97,9 +101,9 @@ class TrainingService:
                     })
 
                 except Exception as e:
-                    logger.error(f"Error processing file {file.filename}: {str(e)}")
+                    logger.error(f"Error processing file {filename}: {str(e)}")
                     failed_files.append({
-                        'filename': file.filename,
+                        'filename': filename,
                         'error': str(e)
                     })
 
@@ -240,36 +244,39 @@ class TrainingService:
             Dictionary with analytics data
         """
         try:
-            # Get corpus stats
-            total_corpora = TrainingCorpus.get_count()
-            total_resumes = TrainingResume.get_count()
+            return dict(self.iter_training_analytics())
 
-            # Get category breakdown
-            categories = TrainingCorpus.get_category_breakdown()
+        except Exception as e:
+            logger.error(f"Error fetching analytics: {str(e)}")
+            return {}
 
-            # Get recent training jobs
-            recent_jobs = TrainingJob.get_recent(limit=10)
+    def iter_training_analytics(self) -> Iterator[Tuple[str, object]]:
+        """
+        Compute training analytics one section at a time.
 
-            # Get average quality scores
-            avg_quality = TrainingResume.get_average_quality_score()
+        Each section is queried only when the previous one has been consumed,
+        so a streaming response holds one section in memory at a time.
 
-            # Get model performance (from latest completed job)
-            latest_model = TrainingJob.get_latest_completed()
-            model_performance = latest_model.get('metrics', {}) if latest_model else {}
+        Yields:
+            (key, value) pairs of the analytics object
+        """
+        # Get corpus stats
+        yield 'totalCorpora', TrainingCorpus.get_count()
+        yield 'totalResumes', TrainingResume.get_count()
 
-            return {
-                'totalCorpora': total_corpora,
-                'totalResumes': total_resumes,
-                'averageQualityScore': avg_quality,
-                'categoryBreakdown': categories,
-                'recentJobs': recent_jobs,
-                'modelPerformance': model_performance,
-                'lastTrainingDate': latest_model.get('completedAt') if latest_model else None
-            }
+        # Get average quality scores
+        yield 'averageQualityScore', TrainingResume.get_average_quality_score()
 
-        except Exception as e:
-            logger.error(f"Error fetching analytics: {str(e)}")
-            return {}
+        # Get category breakdown
+        yield 'categoryBreakdown', TrainingCorpus.get_category_breakdown()
+
+        # Get recent training jobs
+        yield 'recentJobs', TrainingJob.get_recent(limit=10)
+
+        # Get model performance (from latest completed job)
+        latest_model = TrainingJob.get_latest_completed()
+        yield 'modelPerformance', latest_model.get('metrics', {}) if latest_model else {}
+        yield 'lastTrainingDate', latest_model.get('completedAt') if latest_model else None
 
     def search_resumes(
         self,
@@ -277,7 +284,9 @@ class TrainingService:
         category: Optional[str] = None,
         min_score: Optional[float] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        after: Optional[Tuple[float, ObjectId]] = None,
+        projection: Optional[Dict] = None
     ) -> Dict:
         """
         Search through training corpus resumes.
@@ -286,20 +295,62 @@ class TrainingService:
             query: Search query
             category: Filter by category
             min_score: Minimum quality score
-            page: Page number
+            page: Page number (ignored when after is given)
             page_size: Items per page
+            after: (qualityScore, _id) of the last-seen resume for cursor pagination
+            projection: Fields to return for each resume (None for full documents)
 
         Returns:
             Dictionary with search results
         """
         try:
-            results = TrainingResume.search(
-                query=query,
-                category=category,
-                min_score=min_score,
-                skip=(page - 1) * page_size,
-                limit=page_size
+            if after:
+                results = TrainingResume.search_after(
+                    query=query,
+                    category=category,
+                    min_score=min_score,
+                    after=after,
+                    limit=page_size,
+                    projection=projection
+                )
+            else:
+                results = TrainingResume.search(
+                    query=query,
+                    category=category,
+                    min_score=min_score,
+                    skip=(page - 1) * page_size,
+                    limit=page_size,
+                    projection=projection
+                )
+
+            # One $in query for every corpus on the page instead of one per hit
+            corpora = TrainingCorpus.find_by_ids(
+                [resume.get('corpusId') for resume in results if resume.get('corpusId')],
+                {'name': 1, 'category': 1}
             )
+            for resume in results:
+                corpus = corpora.get(str(resume.get('corpusId')))
+                resume['corpus'] = {
+                    'name': corpus.get('name'),
+                    'category': corpus.get('category')
+                } if corpus else None
+
+            has_next = len(results) == page_size
+            next_cursor = None
+            if has_next:
+                last = results[-1]
+                next_cursor = f"{last.get('qualityScore', 0)}_{last['_id']}"
+
+            if after:
+                return {
+                    'resumes': results,
+                    'meta': {
+                        'pageSize': page_size,
+                        'count': len(results),
+                        'hasNext': has_next,
+                        'nextCursor': next_cursor
+                    }
+                }
 
             total_count = TrainingResume.count_search(query, category, min_score)
 
@@ -309,7 +360,8 @@ class TrainingService:
                     'page': page,
                     'pageSize': page_size,
                     'totalCount': total_count,
-                    'totalPages': (total_count + page_size - 1) // page_size
+                    'totalPages': (total_count + page_size - 1) // page_size,
+                    'nextCursor': next_cursor
                 }
             }
 
@@ -328,25 +380,45 @@ class TrainingService:
             Dictionary with extracted patterns
         """
         try:
-            patterns = {}
+            return dict(self.iter_extracted_patterns(pattern_type))
 
-            if pattern_type in ['skills', 'all']:
-                patterns['skills'] = TrainingResume.get_common_skills(min_frequency=5)
+        except Exception as e:
+            logger.error(f"Error extracting patterns: {str(e)}")
+            return {}
 
-            if pattern_type in ['phrases', 'all']:
-                patterns['phrases'] = TrainingResume.get_common_phrases(min_frequency=3)
+    def iter_extracted_patterns(self, pattern_type: str = 'all') -> Iterator[Tuple[str, List]]:
+        """
+        Extract patterns one pattern type at a time.
 
-            if pattern_type in ['formats', 'all']:
-                patterns['formats'] = TrainingResume.get_format_patterns()
+        Each pattern type is cached per worker for PATTERN_CACHE_TTL seconds.
 
-            if pattern_type in ['structures', 'all']:
-                patterns['structures'] = TrainingResume.get_structure_patterns()
+        Args:
+            pattern_type: Type of patterns (skills, phrases, formats, structures, all)
 
-            return patterns
+        Yields:
+            (pattern type, patterns) pairs
+        """
+        if pattern_type in ['skills', 'all']:
+            yield 'skills', cached(
+                'patterns:skills', PATTERN_CACHE_TTL,
+                lambda: TrainingResume.get_common_skills(min_frequency=5)
+            )
 
-        except Exception as e:
-            logger.error(f"Error extracting patterns: {str(e)}")
-            return {}
+        if pattern_type in ['phrases', 'all']:
+            yield 'phrases', cached(
+                'patterns:phrases', PATTERN_CACHE_TTL,
+                lambda: TrainingResume.get_common_phrases(min_frequency=3)
+            )
+
+        if pattern_type in ['formats', 'all']:
+            yield 'formats', cached(
+                'patterns:formats', PATTERN_CACHE_TTL, TrainingResume.get_format_patterns
+            )
+
+        if pattern_type in ['structures', 'all']:
+            yield 'structures', cached(
+                'patterns:structures', PATTERN_CACHE_TTL, TrainingResume.get_structure_patterns
+            )
 
     def validate_resume_quality(
         self,
@@ -569,3 +641,19 @@ class TrainingService:
         except Exception as e:
             logger.error(f"Error processing training job {job_id}: {str(e)}")
             TrainingJob.update_status(job_id, 'failed', error=str(e))
+
+
+_shared_service = None
+
+
+def get_training_service() -> TrainingService:
+    """
+    Get the process-wide TrainingService, creating it on first use.
+
+    Returns:
+        Shared TrainingService instance
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = TrainingService()
+    return _shared_service
@@ -25,7 +25,7 @@ echo ""
 mkdir -p logs
 
 # Check if Celery is already running
-if pgrep -f "celery.*worker" > /dev/null; then
+if pgrep -f "job_fetching_tasks worker" > /dev/null; then
     echo "⚠️  Celery worker is already running"
     echo "   Stop it first with: ./stop_celery.sh"
     echo ""
@@ -42,7 +42,27 @@ fi
 
 echo ""
 
-if pgrep -f "celery.*beat" > /dev/null; then
+# App worker: resume parsing, auto-apply and training tasks, plus the
+# scraper_queue that training imports are routed to
+if pgrep -f "celery_app worker" > /dev/null; then
+    echo "⚠️  Celery app worker is already running"
+    echo "   Stop it first with: ./stop_celery.sh"
+    echo ""
+else
+    echo "Starting Celery app worker..."
+    ./venv/bin/celery -A celery_app worker \
+        -Q celery,scraper_queue \
+        --loglevel=info \
+        --logfile=logs/celery_app_worker.log \
+        --detach
+
+    echo "✅ Celery app worker started"
+    echo "   Logs: logs/celery_app_worker.log"
+fi
+
+echo ""
+
+if pgrep -f "job_fetching_tasks beat" > /dev/null; then
     echo "⚠️  Celery beat is already running"
     echo "   Stop it first with: ./stop_celery.sh"
 else
@@ -56,6 +76,26 @@ else
     echo "   Logs: logs/celery_beat.log"
 fi
 
+echo ""
+
+# App beat: flushes Redis swipe counters to MongoDB and runs the
+# auto-training and cache jobs. Separate schedule file so the two beats
+# don't overwrite each other's state
+if pgrep -f "celery_app beat" > /dev/null; then
+    echo "⚠️  Celery app beat is already running"
+    echo "   Stop it first with: ./stop_celery.sh"
+else
+    echo "Starting Celery app beat..."
+    ./venv/bin/celery -A celery_app beat \
+        --schedule=logs/celery_app_beat-schedule \
+        --loglevel=info \
+        --logfile=logs/celery_app_beat.log \
+        --detach
+
+    echo "✅ Celery app beat started"
+    echo "   Logs: logs/celery_app_beat.log"
+fi
+
 echo ""
 echo "=========================================="
 echo "Celery Status"
@@ -65,12 +105,15 @@ echo "Scheduled Tasks:"
 echo "  • fetch-global-jobs-daily: Runs daily at 2 AM"
 echo "  • fetch-kenya-jobs-twice-daily: Runs at 2 AM and 2 PM"
 echo "  • cleanup-old-jobs-weekly: Runs every Sunday at 3 AM"
+echo "  • flush-swipe-counts: Runs every 30 seconds"
 echo ""
 echo "Each task fetches 100 jobs per source per query!"
 echo ""
 echo "View logs:"
 echo "  tail -f logs/celery_worker.log"
+echo "  tail -f logs/celery_app_worker.log"
 echo "  tail -f logs/celery_beat.log"
+echo "  tail -f logs/celery_app_beat.log"
 echo ""
 echo "Stop Celery:"
 echo "  ./stop_celery.sh"
@@ -0,0 +1,145 @@
+"""Caching utilities (in-process and Redis-backed)."""
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Cached values keyed by name: {key: (expires_at, value)}
+_cache = {}
+
+# Shared Redis client, connected lazily on first use (None if unavailable)
+_redis_client = None
+# While Redis is unreachable, reconnecting is retried no sooner than this
+# (time.monotonic()), so a blip at startup doesn't disable it for good
+_redis_retry_at = 0.0
+REDIS_RETRY_INTERVAL = 30
+
+REDIS_KEY_PREFIX = 'careergenie:'
+
+
+def cached(key, ttl, fn):
+    """
+    Return a cached value, computing and storing it if missing or expired.
+
+    The cache is local to the worker process, so each worker computes the
+    value at most once per TTL window.
+
+    Args:
+        key: Cache key
+        ttl: Time-to-live in seconds
+        fn: Zero-argument callable that computes the value
+
+    Returns:
+        Cached or freshly computed value
+    """
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    value = fn()
+    _cache[key] = (now + ttl, value)
+    return value
+
+
+def invalidate(key):
+    """
+    Drop a cached value.
+
+    Args:
+        key: Cache key
+    """
+    _cache.pop(key, None)
+
+
+def get_redis():
+    """
+    Get the shared Redis client, connecting on first call.
+
+    A failed connection is retried after REDIS_RETRY_INTERVAL seconds, so
+    every worker goes back to the shared Redis counters once it recovers.
+
+    Returns:
+        Redis client, or None if Redis is not available
+    """
+    global _redis_client, _redis_retry_at
+
+    if _redis_client is None and time.monotonic() >= _redis_retry_at:
+        try:
+            import redis
+            redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+            client = redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+            client.ping()
+            _redis_client = client
+        except Exception as e:
+            _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+            logger.warning(
+                f"Redis cache not available: {str(e)}. Using in-process cache, "
+                f"retrying in {REDIS_RETRY_INTERVAL}s."
+            )
+
+    return _redis_client
+
+
+def invalidate_shared(key):
+    """
+    Drop a value cached with shared_cached, for every worker.
+
+    Args:
+        key: Cache key
+    """
+    invalidate(key)
+
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        client.delete(REDIS_KEY_PREFIX + key)
+    except Exception as e:
+        logger.warning(f"Redis cache delete failed for {key}: {str(e)}")
+
+
+def shared_cached(key, ttl, fn):
+    """
+    Like cached(), but shared across workers through Redis.
+
+    Values must be JSON-serializable. Falls back to the in-process cache
+    when Redis is not available.
+
+    Args:
+        key: Cache key
+        ttl: Time-to-live in seconds
+        fn: Zero-argument callable that computes the value
+
+    Returns:
+        Cached or freshly computed value
+    """
+    client = get_redis()
+    if client is None:
+        return cached(key, ttl, fn)
+
+    redis_key = REDIS_KEY_PREFIX + key
+    try:
+        raw = client.get(redis_key)
+        if raw is not None:
+            return json.loads(raw)
+    except Exception as e:
+        logger.warning(f"Redis cache read failed for {key}: {str(e)}")
+        return cached(key, ttl, fn)
+
+    value = fn()
+
+    try:
+        client.setex(redis_key, ttl, json.dumps(value))
+    except Exception as e:
+        logger.warning(f"Redis cache write failed for {key}: {str(e)}")
+
+    return value
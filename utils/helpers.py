@@ -1,8 +1,15 @@
 """Helper utility functions."""
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from bson import ObjectId
+import hashlib
+import json
 import secrets
 import string
+import threading
+
+from flask import Response
 
 
 def generate_random_token(length=32):
@@ -55,6 +62,67 @@ def serialize_document(document):
     return serialized
 
 
+def json_default(value):
+    """
+    json.dumps default hook for MongoDB types.
+
+    Lets responses be encoded in one pass without copying documents
+    through serialize_document first. Unlike serialize_document, _id is
+    kept as-is (not renamed to id).
+
+    Args:
+        value: Object json can't encode natively
+
+    Returns:
+        str: String form of ObjectId or Decimal, or ISO format of datetime/date
+
+    Raises:
+        TypeError: For any other type
+    """
+    if isinstance(value, (ObjectId, Decimal)):
+        return str(value)
+    if isinstance(value, date):
+        # Covers datetime too (a date subclass)
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response encoded in one pass with json_default.
+
+    Use instead of jsonify(serialize_document(...)) for document-heavy
+    responses, so documents are not copied before encoding.
+
+    Args:
+        payload: JSON-serializable data; may contain ObjectIds and datetimes
+        status: HTTP status code
+
+    Returns:
+        Response: application/json response
+    """
+    return Response(json.dumps(payload, default=json_default), status, mimetype='application/json')
+
+
+def with_id(document):
+    """
+    Shallow copy of a document with _id renamed to id.
+
+    Matches serialize_document's top-level id convention for documents
+    sent through json_response.
+
+    Args:
+        document: MongoDB document
+
+    Returns:
+        dict: Document with an id key instead of _id
+    """
+    document = dict(document)
+    if '_id' in document:
+        document['id'] = document.pop('_id')
+    return document
+
+
 def serialize_documents(documents):
     """
     Serialize list of MongoDB documents.
@@ -151,6 +219,16 @@ def should_reset_swipes(reset_date):
     return datetime.utcnow() >= reset_date
 
 
+# Weights used by both the Python and the MongoDB match scorers
+MATCH_SCORE_WEIGHTS = {
+    'job_type': 0.25,
+    'industry': 0.20,
+    'salary': 0.30,
+    'location': 0.15,
+    'skills': 0.10
+}
+
+
 def calculate_match_score(user_preferences, job_data):
     """
     Calculate match score between user preferences and job.
@@ -163,13 +241,7 @@ def calculate_match_score(user_preferences, job_data):
         float: Match score (0.0 to 1.0)
     """
     score = 0.0
-    weights = {
-        'job_type': 0.25,
-        'industry': 0.20,
-        'salary': 0.30,
-        'location': 0.15,
-        'skills': 0.10
-    }
+    weights = MATCH_SCORE_WEIGHTS
 
     # Job type match
     if user_preferences.get('jobTypes'):
@@ -219,6 +291,218 @@ def calculate_match_score(user_preferences, job_data):
     return min(score, 1.0)  # Cap at 1.0
 
 
+# Preference fields that contribute to calculate_match_score
+MATCH_PREFERENCE_FIELDS = ('jobTypes', 'industries', 'expectedSalary', 'location', 'skills')
+
+
+def has_match_preferences(user_preferences):
+    """
+    Check whether any preference can affect the match score.
+
+    Args:
+        user_preferences: User preference data
+
+    Returns:
+        bool: False if every job would score 0.0
+    """
+    return any(user_preferences.get(field) for field in MATCH_PREFERENCE_FIELDS)
+
+
+# LRU cache of match scores keyed by (preferences key, job ID, job updatedAt)
+MATCH_SCORE_CACHE_SIZE = 50000
+_match_score_cache = OrderedDict()
+_match_score_cache_lock = threading.Lock()
+
+
+def preferences_cache_key(user_preferences):
+    """
+    Get a short stable hash of user preferences for cache keys.
+
+    Args:
+        user_preferences: User preference data
+
+    Returns:
+        str: 16-character hex digest
+    """
+    encoded = json.dumps(user_preferences, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(encoded).hexdigest()[:16]
+
+
+def cached_match_score(user_preferences, job_data, prefs_key=None):
+    """
+    Calculate match score, memoized per (preferences, job version).
+
+    Changing preferences changes the preferences key and updating a job
+    changes its updatedAt, so stale entries are never read back.
+
+    Args:
+        user_preferences: User preference data
+        job_data: Job data
+        prefs_key: Precomputed preferences_cache_key (computed if omitted)
+
+    Returns:
+        float: Match score (0.0 to 1.0)
+    """
+    job_id = job_data.get('_id')
+    if job_id is None:
+        return calculate_match_score(user_preferences, job_data)
+
+    if prefs_key is None:
+        prefs_key = preferences_cache_key(user_preferences)
+
+    key = (prefs_key, job_id, job_data.get('updatedAt'))
+
+    with _match_score_cache_lock:
+        score = _match_score_cache.get(key)
+        if score is not None:
+            _match_score_cache.move_to_end(key)
+            return score
+
+    score = calculate_match_score(user_preferences, job_data)
+
+    with _match_score_cache_lock:
+        _match_score_cache[key] = score
+        if len(_match_score_cache) > MATCH_SCORE_CACHE_SIZE:
+            _match_score_cache.popitem(last=False)
+
+    return score
+
+
+def _is_number(value):
+    """Check if value is a real number (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _non_empty_object(field):
+    """MongoDB expression that is true when field is a non-empty subdocument."""
+    return {'$gt': [
+        {'$size': {'$objectToArray': {
+            '$cond': [{'$eq': [{'$type': field}, 'object']}, field, {}]
+        }}},
+        0
+    ]}
+
+
+def build_match_score_expression(user_preferences):
+    """
+    Build a MongoDB aggregation expression equivalent to calculate_match_score.
+
+    Args:
+        user_preferences: User preference data
+
+    Returns:
+        dict: Aggregation expression evaluating to the match score, or None
+              if the preferences contain values the expression can't represent
+              (callers should fall back to calculate_match_score)
+    """
+    weights = MATCH_SCORE_WEIGHTS
+    parts = []
+
+    # Job type match
+    job_types = user_preferences.get('jobTypes')
+    if job_types:
+        if not isinstance(job_types, list):
+            return None
+        parts.append({'$cond': [
+            {'$in': [{'$ifNull': ['$employment.type', None]}, job_types]},
+            weights['job_type'],
+            0
+        ]})
+
+    # Industry match
+    industries = user_preferences.get('industries')
+    if industries:
+        if not isinstance(industries, list):
+            return None
+        parts.append({'$cond': [
+            {'$in': [{'$ifNull': ['$company.industry', None]}, industries]},
+            weights['industry'],
+            0
+        ]})
+
+    # Salary match
+    user_salary = user_preferences.get('expectedSalary', {})
+    if user_salary:
+        if not isinstance(user_salary, dict):
+            return None
+        user_min = user_salary.get('min', 0)
+        user_max = user_salary.get('max', float('inf'))
+        if not _is_number(user_min) or not _is_number(user_max):
+            return None
+
+        # An open-ended user range always yields a 0% overlap
+        if user_max != float('inf'):
+            job_min = {'$ifNull': ['$salary.min', 0]}
+            job_max = {'$ifNull': ['$salary.max', 0]}
+
+            if user_max > user_min:
+                salary_score = {'$multiply': [
+                    weights['salary'] / (user_max - user_min),
+                    {'$subtract': [{'$min': [user_max, job_max]}, {'$max': [user_min, job_min]}]}
+                ]}
+            else:
+                salary_score = weights['salary']
+
+            parts.append({'$cond': [
+                {'$and': [
+                    _non_empty_object('$salary'),
+                    {'$gte': [job_max, user_min]},
+                    {'$lte': [job_min, user_max]}
+                ]},
+                salary_score,
+                0
+            ]})
+
+    # Location match
+    user_location = user_preferences.get('location', {})
+    if user_location:
+        if not isinstance(user_location, dict):
+            return None
+        parts.append({'$cond': [
+            _non_empty_object('$location'),
+            {'$cond': [
+                {'$and': [
+                    {'$eq': [{'$ifNull': ['$location.city', None]}, user_location.get('city')]},
+                    {'$eq': [{'$ifNull': ['$location.state', None]}, user_location.get('state')]}
+                ]},
+                weights['location'],
+                {'$cond': [
+                    {'$ifNull': ['$location.remote', False]},
+                    weights['location'] * 0.8,
+                    0
+                ]}
+            ]},
+            0
+        ]})
+
+    # Skills match
+    user_skills = user_preferences.get('skills', [])
+    if user_skills:
+        if not isinstance(user_skills, list) or not all(isinstance(s, str) for s in user_skills):
+            return None
+        requirements = {'$setUnion': ['$requirements', []]}
+        parts.append({'$cond': [
+            {'$isArray': '$requirements'},
+            {'$cond': [
+                {'$gt': [{'$size': requirements}, 0]},
+                {'$multiply': [
+                    weights['skills'],
+                    {'$divide': [
+                        {'$size': {'$setIntersection': [requirements, list(set(user_skills))]}},
+                        {'$size': requirements}
+                    ]}
+                ]},
+                0
+            ]},
+            0
+        ]})
+
+    if not parts:
+        return {'$literal': 0.0}
+
+    return {'$min': [{'$add': parts}, 1.0]}
+
+
 def format_error_response(message, status_code=400, errors=None):
     """
     Format error response.